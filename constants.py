@@ -1,5 +1,11 @@
+import os
 import sys
+import tempfile
 TIME_FORMAT = "%H:%M"
 MAX_INT = sys.maxsize
 DEFAULT_LANGUAGE = 'English'
 WALKING_RATE = 1.0
+DISTANCE_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'allocate')
+GRID_CELL_SIZE = 10
+TRAVEL_CACHE_SIZE = 8
+TIME_CACHE_SIZE = 4096
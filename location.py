@@ -1,19 +1,62 @@
-from utils import typedef
+from constants import (
+    DISTANCE_CACHE_DIR,
+    GRID_CELL_SIZE,
+    TRAVEL_CACHE_SIZE,
+    WALKING_RATE
+)
+from utils import (
+    commute_time,
+    typedef
+)
+from array import array
+import abc
+import bisect
+import collections
+import hashlib
+import json
+import math
+import os
+import weakref
 
 
 class Point(object):
     """
-    A coordinate in a 2D plane with orthogonal axes x & y
+    An immutable coordinate in a 2D plane with orthogonal axes x & y.
+    Points are interned, so equal coordinates share a single instance.
     """
-    def __init__(self, x, y):
+    __slots__ = ('x', 'y', 'coordinates', '__weakref__')
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, x, y):
         """
-        Initialize the Point class
+        Get the Point at (x, y), creating it only if it does not exist yet
         :param x: The x coordinate
         :param y: The y coordinate
         """
-        self.x = x
-        self.y = y
-        self.coordinates = (x, y)
+        return cls._intern((x, y))
+
+    @classmethod
+    def _intern(cls, key):
+        """
+        Look key up in the class's intern table, creating it if absent
+        :param key: A tuple of the values passed to the constructor
+        :return: An instance of cls
+        """
+        instance = cls._interned.get(key)
+        if instance is None:
+            instance = object.__new__(cls)
+            for name, value in zip(cls._fields(), key):
+                object.__setattr__(instance, name, value)
+            object.__setattr__(instance, 'coordinates', key[:2])
+            cls._interned[key] = instance
+        return instance
+
+    @staticmethod
+    def _fields():
+        return 'x', 'y'
+
+    def _key(self):
+        return tuple(getattr(self, name) for name in self._fields())
 
     def move(self, delta_x, delta_y):
         """
@@ -44,28 +87,51 @@ class Point(object):
         y_distance = self.y - other.y
         return (x_distance**2 + y_distance**2)**0.5
 
+    def __setattr__(self, name, value):
+        raise AttributeError(typedef(self) + ' objects are immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError(typedef(self) + ' objects are immutable.')
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, self._key()
+
     def __str__(self):
         return str(self.coordinates)
 
+    def __hash__(self):
+        return hash(self._key())
+
     def __eq__(self, other):
-        if not isinstance(other, Point):
+        if self is other:
+            return True
+        if type(self) is not type(other):
             return False
-        return self.__dict__ == other.__dict__
+        return self._key() == other._key()
 
     def __ne__(self, other):
-        if not isinstance(other, Point):
-            return True
-        return self.__dict__ != other.__dict__
+        return not self == other
 
 
 class Location(Point):
     """
     A Point object with the addition of building and clinic name text
     """
-    def __init__(self, x, y, building, clinic):
-        Point.__init__(self, x, y)
-        self.building = building
-        self.clinic = clinic
+    __slots__ = ('building', 'clinic')
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, x, y, building, clinic):
+        return cls._intern((x, y, building, clinic))
+
+    @staticmethod
+    def _fields():
+        return 'x', 'y', 'building', 'clinic'
 
     def __str__(self):
         return str((self.building, self.clinic))
@@ -73,13 +139,20 @@ class Location(Point):
 
 class Grid(object):
     """
-    A two-dimensional Cartesian grid
+    A two-dimensional Cartesian grid, with appointments bucketed into
+    square cells so that nearby appointments can be found without a scan
     """
-    def __init__(self):
+    def __init__(self, cell_size=GRID_CELL_SIZE):
         """
         Initialize the Grid class
+        :param cell_size: The width of the square cells appointments index to
         """
         self.locs = {}
+        self.cell_size = cell_size
+        self.indexed_appts = None
+        self.appt_buckets = {}
+        self.appt_count = 0
+        self.cell_bounds = None
 
     def add_loc(self, person, point):
         """
@@ -115,6 +188,134 @@ class Grid(object):
             raise ValueError(typedef(person) + ' not in grid.')
         self.locs[person] = Point(point.x, point.y)
 
+    def get_cell(self, point):
+        """
+        Get the grid cell that contains point
+        :param point: A Point object
+        :return: A tuple of integer cell coordinates
+        """
+        return (math.floor(point.x / self.cell_size),
+                math.floor(point.y / self.cell_size))
+
+    def index_appts(self, appts):
+        """
+        Rebuild the spatial index so it holds exactly the appointments in appts
+        :param appts: A list of Appointment objects
+        :return: None
+        """
+        self.indexed_appts = appts
+        self.appt_buckets = {}
+        self.appt_count = 0
+        self.cell_bounds = None
+        for appt in appts:
+            self.add_appt(appt)
+
+    def add_appt(self, appt):
+        """
+        Add appt to the bucket of its cell, keeping buckets sorted by start
+        :param appt: An Appointment object
+        :return: None
+        """
+        cell = self.get_cell(appt.location)
+        bucket = self.appt_buckets.setdefault(cell, [])
+        entry = (appt.start.minutes, appt.idnum)
+        idx = bisect.bisect_right(bucket, entry)
+        bucket.insert(idx, entry + (appt,))
+        self.appt_count += 1
+        if self.cell_bounds is None:
+            self.cell_bounds = [cell[0], cell[1], cell[0], cell[1]]
+        else:
+            bounds = self.cell_bounds
+            bounds[0] = min(bounds[0], cell[0])
+            bounds[1] = min(bounds[1], cell[1])
+            bounds[2] = max(bounds[2], cell[0])
+            bounds[3] = max(bounds[3], cell[1])
+
+    def remove_appt(self, appt):
+        """
+        Remove appt from the spatial index, if it is indexed
+        :param appt: An Appointment object
+        :return: None
+        """
+        bucket = self.appt_buckets.get(self.get_cell(appt.location))
+        if not bucket:
+            return
+        entry = (appt.start.minutes, appt.idnum)
+        idx = bisect.bisect_left(bucket, entry)
+        while idx < len(bucket) and bucket[idx][:2] == entry:
+            if bucket[idx][2] is appt:
+                del bucket[idx]
+                self.appt_count -= 1
+                return
+            idx += 1
+
+    def _ring_cells(self, cell, ring):
+        """
+        Generate the cells exactly ring cells away from cell
+        :param cell: A tuple of integer cell coordinates
+        :param ring: An integer Chebyshev distance in cells
+        :return: A generator of cells
+        """
+        (x, y) = cell
+        if ring == 0:
+            yield cell
+            return
+        for dx in range(-ring, ring + 1):
+            yield (x + dx, y - ring)
+            yield (x + dx, y + ring)
+        for dy in range(1 - ring, ring):
+            yield (x - ring, y + dy)
+            yield (x + ring, y + dy)
+
+    def nearest_appt(self, point, time, earliest_start, commute,
+                     walking_rate=None, accept=None):
+        """
+        Find the indexed appointment staff at point could arrive at first.
+        Cells are searched in rings around point, and the search stops once
+        no unsearched cell could give an earlier arrival.
+        :param point: A Point object where staff are now
+        :param time: A Time object when staff are free to leave point
+        :param earliest_start: A Time object, skip appts starting before it
+        :param commute: A function of two locations returning minutes
+        :param walking_rate: Distance units per minute used to bound commute
+        times by straight-line distance, or None if commute can be shorter
+        :param accept: A function of an Appointment, False to skip it
+        :return: An Appointment object, or None
+        """
+        if self.cell_bounds is None:
+            return None
+        best = None
+        best_key = None
+        cell = self.get_cell(point)
+        bounds = self.cell_bounds
+        max_ring = max(cell[0] - bounds[0], cell[1] - bounds[1],
+                       bounds[2] - cell[0], bounds[3] - cell[1], 0)
+        first = (earliest_start.minutes,)
+        for ring in range(max_ring + 1):
+            if best_key is not None and walking_rate is not None and ring > 0:
+                closest = int((ring - 1) * self.cell_size)
+                if best_key[0] <= time.minutes + int(closest / walking_rate):
+                    break
+            for ring_cell in self._ring_cells(cell, ring):
+                bucket = self.appt_buckets.get(ring_cell)
+                if not bucket:
+                    continue
+                for idx in range(bisect.bisect_left(bucket, first),
+                                 len(bucket)):
+                    (start, idnum, appt) = bucket[idx]
+                    if best_key is not None and start > best_key[0]:
+                        # arrival is never before start, nor are later appts
+                        break
+                    arrival = max(time.minutes +
+                                  commute(point, appt.location), start)
+                    key = (arrival, start, idnum)
+                    if best_key is not None and key >= best_key:
+                        continue
+                    if accept is None or accept(appt):
+                        best = appt
+                        best_key = key
+        return best
+
     def __eq__(self, other):
         if not isinstance(other, Grid):
             return False
@@ -126,3 +327,270 @@ class Grid(object):
         return self.__dict__ != other.__dict__
 
 
+class DistanceModel(abc.ABC):
+    """
+    An abstract base class for the ways of measuring distance between two
+    locations, subclasses must implement distance
+    """
+    # True if distances are never shorter than the straight-line distance
+    at_least_straight_line = False
+
+    @property
+    def key(self):
+        """
+        Identify the model for caching distances, by its class and the
+        parameters it was built with, so models that measure differently
+        never share a key
+        :return: A hashable key
+        """
+        return (type(self),) + tuple(sorted(
+            (name, repr(value)) for (name, value) in vars(self).items()))
+
+    @abc.abstractmethod
+    def distance(self, location1, location2):
+        """
+        Measure the distance between two locations
+        :param location1: A Point (or inherited) object
+        :param location2: A Point (or inherited) object
+        :return: A number representing the distance
+        """
+
+    @staticmethod
+    def location_key(location):
+        """
+        Get the part of a location that its distances depend on
+        :param location: A Point (or inherited) object
+        :return: A hashable key
+        """
+        return location.coordinates
+
+
+class EuclideanDistance(DistanceModel):
+    """
+    Straight-line distance, the same as Point.distance_from
+    """
+    at_least_straight_line = True
+
+    def distance(self, location1, location2):
+        return location1.distance_from(location2)
+
+
+class ManhattanDistance(DistanceModel):
+    """
+    Distance walked along axis-aligned hallways
+    """
+    at_least_straight_line = True
+
+    def distance(self, location1, location2):
+        return (abs(location1.x - location2.x) +
+                abs(location1.y - location2.y))
+
+
+class CorridorGraph(DistanceModel):
+    """
+    Distance walked through the corridors and bridges between buildings.
+    Locations in the same building (or without one) use straight-line
+    distance. All-pairs shortest paths are computed once with
+    Floyd-Warshall and stored on disk under a hash of the graph.
+    """
+
+    def __init__(self, corridors, cache_dir=DISTANCE_CACHE_DIR):
+        """
+        Initialize the CorridorGraph class
+        :param corridors: A dict mapping (building, building) to a length
+        :param cache_dir: A directory for the path cache, or None to skip it
+        """
+        self.corridors = {}
+        for (building1, building2), length in corridors.items():
+            pair = tuple(sorted((building1, building2)))
+            self.corridors[pair] = min(length,
+                                       self.corridors.get(pair, length))
+        edges = sorted([building1, building2, length] for
+                       (building1, building2), length in
+                       self.corridors.items())
+        self.graph_hash = hashlib.sha1(
+            json.dumps(edges).encode('utf-8')).hexdigest()
+        self.cache_dir = cache_dir
+        self.buildings, self.paths = self._load_paths()
+        self.index = {building: idx for idx, building in
+                      enumerate(self.buildings)}
+
+    @property
+    def key(self):
+        return (type(self), self.graph_hash)
+
+    @staticmethod
+    def location_key(location):
+        return (location.coordinates, getattr(location, 'building', None))
+
+    def shortest_paths(self):
+        """
+        Compute all-pairs shortest path lengths with Floyd-Warshall
+        :return: A tuple of the building list and a matrix of lengths
+        """
+        buildings = sorted({building for pair in self.corridors
+                            for building in pair})
+        index = {building: idx for idx, building in enumerate(buildings)}
+        size = len(buildings)
+        paths = [[0 if row == col else math.inf for col in range(size)]
+                 for row in range(size)]
+        for (building1, building2), length in self.corridors.items():
+            row, col = index[building1], index[building2]
+            paths[row][col] = paths[col][row] = min(length, paths[row][col])
+        for mid in range(size):
+            mid_row = paths[mid]
+            for row in range(size):
+                to_mid = paths[row][mid]
+                if to_mid == math.inf:
+                    continue
+                current = paths[row]
+                for col in range(size):
+                    via_mid = to_mid + mid_row[col]
+                    if via_mid < current[col]:
+                        current[col] = via_mid
+        return buildings, paths
+
+    def _cache_file(self):
+        return os.path.join(self.cache_dir, self.graph_hash + '.json')
+
+    def _load_paths(self):
+        """
+        Read the shortest paths from the disk cache, computing them if absent
+        :return: A tuple of the building list and a matrix of lengths
+        """
+        if self.cache_dir is None:
+            return self.shortest_paths()
+        try:
+            with open(self._cache_file()) as fh:
+                data = json.load(fh)
+            paths = [[math.inf if length is None else length
+                      for length in row] for row in data['paths']]
+            return data['buildings'], paths
+        except (OSError, ValueError, KeyError):
+            pass
+        buildings, paths = self.shortest_paths()
+        data = {'buildings': buildings,
+                'paths': [[None if length == math.inf else length
+                           for length in row] for row in paths]}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._cache_file(), 'w') as fh:
+                json.dump(data, fh)
+        except OSError:
+            pass
+        return buildings, paths
+
+    def distance(self, location1, location2):
+        building1 = getattr(location1, 'building', None)
+        building2 = getattr(location2, 'building', None)
+        row = self.index.get(building1)
+        col = self.index.get(building2)
+        if building1 == building2 or row is None or col is None:
+            return location1.distance_from(location2)
+        length = self.paths[row][col]
+        if length == math.inf:
+            raise ValueError('No corridor between ' + str(building1) +
+                             ' and ' + str(building2) + '.')
+        return length
+
+
+class TravelMatrix(object):
+    """
+    Precomputed commute minutes between every pair of unique locations.
+    The minutes are a flat stdlib array rather than a NumPy array: commute
+    looks up one pair at a time, which is faster on an array and gives a
+    plain int, and np.asarray views the array without copying it
+    """
+    # The matrices build shares, least recently used first
+    _cache = collections.OrderedDict()
+    cache_size = TRAVEL_CACHE_SIZE
+
+    def __init__(self, locations, walking_rate=WALKING_RATE, model=None):
+        """
+        Initialize the TravelMatrix class. Prefer TravelMatrix.build, which
+        reuses a matrix already computed for the same locations and rate
+        :param locations: An iterable of Point (or inherited) objects
+        :param walking_rate: A number of distance units covered per minute
+        :param model: A DistanceModel object, EuclideanDistance by default
+        """
+        if model is None:
+            model = EuclideanDistance()
+        self.walking_rate = walking_rate
+        self.model = model
+        self.index = {}
+        points = []
+        for loc in locations:
+            loc_key = model.location_key(loc)
+            if loc_key not in self.index:
+                self.index[loc_key] = len(points)
+                points.append(loc)
+        self.size = len(points)
+        self.minutes = array('l', [0]) * (self.size * self.size)
+        for row, loc1 in enumerate(points):
+            for col in range(row + 1, self.size):
+                minutes = commute_time(loc1, points[col], walking_rate,
+                                       model)
+                self.minutes[row * self.size + col] = minutes
+                self.minutes[col * self.size + row] = minutes
+
+    @classmethod
+    def build(cls, locations, walking_rate=WALKING_RATE, model=None):
+        """
+        Get the matrix for locations, reusing one of the last cache_size
+        matrices built for the same locations, rate and model
+        :param locations: An iterable of Point (or inherited) objects
+        :param walking_rate: A number of distance units covered per minute
+        :param model: A DistanceModel object, EuclideanDistance by default
+        :return: A TravelMatrix object
+        """
+        if model is None:
+            model = EuclideanDistance()
+        unique = {}
+        for loc in locations:
+            unique.setdefault(model.location_key(loc), loc)
+        key = (walking_rate, model.key, frozenset(unique))
+        if key in cls._cache:
+            cls._cache.move_to_end(key)
+        else:
+            cls._cache[key] = cls(list(unique.values()), walking_rate, model)
+            while len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+        return cls._cache[key]
+
+    def index_of(self, location):
+        """
+        Get the row/column of location in the matrix
+        :param location: A Point (or inherited) object
+        :return: An integer index, or None if location was not precomputed
+        """
+        return self.index.get(self.model.location_key(location))
+
+    def commute(self, location1, location2):
+        """
+        Look up the commute minutes between two locations
+        Locations missing from the matrix are computed on the fly
+        :param location1: A Point (or inherited) object
+        :param location2: A Point (or inherited) object
+        :return: An integer number of minutes
+        """
+        row = self.index.get(self.model.location_key(location1))
+        col = self.index.get(self.model.location_key(location2))
+        if row is None or col is None:
+            return commute_time(location1, location2, self.walking_rate,
+                                self.model)
+        return self.minutes[row * self.size + col]
+
+    def __deepcopy__(self, memo):
+        # The matrix is never modified after it is built, so copies share it
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, TravelMatrix):
+            return False
+        return (self.walking_rate == other.walking_rate and
+                self.model.key == other.model.key and
+                self.index == other.index and
+                self.minutes == other.minutes)
+
+    def __ne__(self, other):
+        return not self == other
@@ -4,6 +4,57 @@ from utils import (
 )
 from constants import TIME_FORMAT
 import copy
+import itertools
+
+
+class LanguageRegistry(object):
+    """
+    Gives each language its own bit so a set of languages fits in one int
+    """
+
+    def __init__(self):
+        """
+        Initialize the LanguageRegistry class
+        """
+        self.bits = {}
+
+    def bit(self, language):
+        """
+        Get the bit for language, registering it the first time it is seen
+        :param language: A string representing a language
+        :return: An integer with a single bit set
+        """
+        if language not in self.bits:
+            self.bits[language] = 1 << len(self.bits)
+        return self.bits[language]
+
+    def mask(self, languages):
+        """
+        Combine the bits of every language in languages
+        :param languages: An iterable of language strings
+        :return: An integer bitmask
+        """
+        mask = 0
+        for language in languages:
+            mask |= self.bit(language)
+        return mask
+
+    def languages(self, mask):
+        """
+        Get the registered languages whose bits are set in mask
+        :param mask: An integer bitmask
+        :return: A set of language strings
+        """
+        return {language for language, bit in self.bits.items()
+                if mask & bit}
+
+
+# Bits are only meaningful within one process, so Person objects recompute
+# their masks when they are unpickled
+LANGUAGES = LanguageRegistry()
+
+# Each Person gets the next uid when created; copies and pickles keep it
+PERSON_IDS = itertools.count(1)
 
 
 class Person(object):
@@ -18,10 +69,27 @@ class Person(object):
         :param languages: A set of strings, the languages spoken by Person
         :param gender: A string representing the person's gender
         """
+        self.uid = next(PERSON_IDS)
         self.name = name
         self.languages = languages
         self.gender = gender
 
+    @property
+    def languages(self):
+        return self._languages
+
+    @languages.setter
+    def languages(self, languages):
+        """
+        Set the languages spoken and keep self.language_mask in step with them.
+        They are kept as a frozenset, since changing them in place would
+        leave the mask behind, so assign a new set to change them
+        :param languages: A set of strings, the languages spoken by Person
+        :return: None
+        """
+        self._languages = frozenset(languages)
+        self.language_mask = LANGUAGES.mask(self._languages)
+
     def speaks(self, language):
         """
         Test if person can speak language
@@ -36,11 +104,20 @@ class Person(object):
         :param other: A Person (or inherited object)
         :return: A Boolean indicating mutual intelligibility
         """
-        return self.languages & other.languages
+        return (self.language_mask & other.language_mask) != 0
 
     def copy(self):
         return copy.deepcopy(self)
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state['language_mask']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.language_mask = LANGUAGES.mask(self._languages)
+
     def __str__(self):
         return self.name
 
@@ -50,10 +127,13 @@ class Person(object):
     def __eq__(self, other):
         if not isinstance(other, Person):
             return False
-        return self.__dict__ == other.__dict__
+        return self.uid == other.uid
+
+    def __ne__(self, other):
+        return not self == other
 
     def __hash__(self):
-        return id(self)
+        return hash(self.uid)
 
 
 class Patient(Person):
@@ -4,15 +4,33 @@ from utils import (
     Time,
     calc_arrival
 )
-from constants import TIME_FORMAT
+from location import TravelMatrix
+from constants import (
+    TIME_FORMAT,
+    WALKING_RATE
+)
+from array import array
 import bisect
+import collections
 import copy
+import weakref
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional, ScheduleColumns falls back to stdlib arrays
+    np = None
+
+# The fields a ScheduleColumns copies that can change after it is built
+WATCHED_FIELDS = ('priority', 'interpreter')
 
 
 class Appointment(object):
     """
     An encounter with fixed start and end times, and one patient
     """
+    # The ScheduleColumns watching self live outside __dict__, so they
+    # aren't printed, compared, copied or pickled with the appointment
+    __slots__ = ('__dict__', '_watchers')
 
     def __init__(self, idnum, start, duration_in_mins, patient, location,
                  priority, provider, interpreter):
@@ -30,8 +48,7 @@ class Appointment(object):
         self.idnum = idnum
         self.start = Time(start, TIME_FORMAT)
         self.duration = duration_in_mins
-        self.finish = Time(start, TIME_FORMAT)
-        self.finish.add_time(hours=0, minutes=duration_in_mins)
+        self.finish = self.start.plus_minutes(duration_in_mins)
         self.patient = patient
         self.location = location
         self.priority = priority
@@ -62,6 +79,18 @@ class Appointment(object):
     def copy(self):
         return copy.deepcopy(self)
 
+    def watch(self, columns):
+        """
+        Have columns re-read self whenever a field in WATCHED_FIELDS changes
+        :param columns: A ScheduleColumns object holding self
+        :return: None
+        """
+        watchers = getattr(self, '_watchers', None)
+        if watchers is None:
+            watchers = self._watchers = []
+        watchers[:] = [ref for ref in watchers if ref() is not None]
+        watchers.append(weakref.ref(columns))
+
     def distance_from(self, other):
         """
         Distance from another Appointment using Pythagorean distance formula
@@ -78,30 +107,34 @@ class Appointment(object):
     def is_compatible(self, other):
         return self.overlaps_with(other)
 
-    def is_compatible_arrival(self, other):
+    def is_compatible_arrival(self, other, travel=None):
         """
         Test whether self and other are not overlapping appointments
         :param other: An Appointment object
+        :param travel: An optional TravelMatrix to look commute times up in
         :return: Boolean indicating if they're compatible
         """
         appts = [self, other]
         appts.sort(key=attrgetter('start'), reverse=False)
         first_appt = appts[0]
         second_appt = appts[1]
-        arrival_time = calc_arrival(first_appt, second_appt)
-        second_time = second_appt.start.copy()
-        second_time.add_time(hours=0, minutes=self.late_allowed)
+        arrival_time = calc_arrival(first_appt, second_appt, travel)
+        second_time = second_appt.start.plus_minutes(self.late_allowed)
         return arrival_time <= second_time
 
     def calc_prior(self, others):
-        lst = copy.deepcopy(others)
-        lst.sort(key=attrgetter('finish'), reverse=False)
-        finish = [other.finish for other in others]
-        pos = bisect.bisect(finish, self.finish)
-        valid_others = [other for other in others[:pos] if
-                        other.finish <= self.start]
-        if valid_others:
-            return valid_others[-1]
+        """
+        Find the last appointment in others to finish by the time self starts
+        :param others: a list of Appointment objects
+        :return: An Appointment object, or None if there is none
+        """
+        lst = sorted(others, key=attrgetter('finish'))
+        finish = [other.finish for other in lst]
+        pos = bisect.bisect_right(finish, self.start)
+        while pos > 0 and lst[pos - 1] is self:
+            pos -= 1
+        if pos > 0:
+            return lst[pos - 1]
 
     def get_prior_num(self, others):
         """
@@ -132,15 +165,32 @@ class Appointment(object):
             num_keys_iterated += 1
         return temp_str
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in WATCHED_FIELDS:
+            for ref in getattr(self, '_watchers', ()):
+                columns = ref()
+                if columns is not None:
+                    columns.refresh(self)
+
+    def __getstate__(self):
+        return self.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
     def __eq__(self, other):
         if not isinstance(other, Appointment):
             return False
-        return self.__dict__ == other.__dict__
+        return self.idnum == other.idnum
 
     def __ne__(self, other):
         if not isinstance(other, Appointment):
             return True
-        return self.__dict__ != other.__dict__
+        return self.idnum != other.idnum
+
+    def __hash__(self):
+        return hash(self.idnum)
 
     def __lt__(self, other):
         """
@@ -155,22 +205,451 @@ class Appointment(object):
         return self.start < other.start
 
 
+class AppointmentList(list):
+    """
+    A list of Appointment objects that also counts its members by idnum,
+    so that membership tests take O(1) time instead of a full scan.
+    Indexes over the list, eg. a StartIndex, are told of every appt added
+    or removed
+    """
+
+    def __init__(self, appts=()):
+        """
+        Initialize the AppointmentList class
+        :param appts: An iterable of Appointment objects
+        """
+        list.__init__(self, appts)
+        self._counts = collections.Counter(self)
+        self._watchers = []
+
+    def watch(self, index):
+        """
+        Have index add and remove appts as they are added to and removed
+        from self
+        :param index: An object with add(appt) and remove(appt) methods
+        :return: None
+        """
+        self._watchers[:] = [ref for ref in self._watchers
+                             if ref() is not None]
+        self._watchers.append(weakref.ref(index))
+
+    def _notify(self, added=(), removed=()):
+        for ref in self._watchers:
+            index = ref()
+            if index is not None:
+                for appt in removed:
+                    index.remove(appt)
+                for appt in added:
+                    index.add(appt)
+
+    def _discard(self, appts):
+        for appt in appts:
+            self._counts[appt] -= 1
+            if self._counts[appt] < 1:
+                del self._counts[appt]
+        self._notify(removed=appts)
+
+    def append(self, appt):
+        list.append(self, appt)
+        self._counts[appt] += 1
+        self._notify(added=[appt])
+
+    def insert(self, idx, appt):
+        list.insert(self, idx, appt)
+        self._counts[appt] += 1
+        self._notify(added=[appt])
+
+    def extend(self, appts):
+        appts = list(appts)
+        list.extend(self, appts)
+        self._counts.update(appts)
+        self._notify(added=appts)
+
+    def __iadd__(self, appts):
+        self.extend(appts)
+        return self
+
+    def remove(self, appt):
+        list.remove(self, appt)
+        self._discard([appt])
+
+    def pop(self, idx=-1):
+        appt = list.pop(self, idx)
+        self._discard([appt])
+        return appt
+
+    def clear(self):
+        self._discard(list(self))
+        list.clear(self)
+
+    def __setitem__(self, idx, value):
+        if isinstance(idx, slice):
+            value = list(value)
+            self._discard(self[idx])
+            self._counts.update(value)
+            self._notify(added=value)
+        else:
+            self._discard([self[idx]])
+            self._counts[value] += 1
+            self._notify(added=[value])
+        list.__setitem__(self, idx, value)
+
+    def __delitem__(self, idx):
+        if isinstance(idx, slice):
+            self._discard(self[idx])
+        else:
+            self._discard([self[idx]])
+        list.__delitem__(self, idx)
+
+    def __contains__(self, appt):
+        return appt in self._counts
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+
+class StartIndex(object):
+    """
+    Appointments kept sorted by start time, so that those starting at or
+    after one time and at or before another are found by bisection in
+    O(log n + k) time. Appointments starting together keep the order they
+    were added in. An index over an AppointmentList follows the appts
+    added to and removed from it
+    """
+
+    def __init__(self, appts=()):
+        """
+        Initialize the StartIndex class
+        :param appts: An iterable of Appointment objects
+        """
+        self.source = appts
+        self.appts = sorted(appts, key=lambda appt: appt.start.minutes)
+        self.starts = array('l', [appt.start.minutes for appt in self.appts])
+        self._watch_source()
+
+    def _watch_source(self):
+        if isinstance(self.source, AppointmentList):
+            self.source.watch(self)
+
+    def add(self, appt):
+        """
+        Add appt after any indexed appts with the same start time
+        :param appt: An Appointment object
+        :return: None
+        """
+        idx = bisect.bisect_right(self.starts, appt.start.minutes)
+        self.starts.insert(idx, appt.start.minutes)
+        self.appts.insert(idx, appt)
+
+    def remove(self, appt):
+        """
+        Remove appt from the index, if it is indexed
+        :param appt: An Appointment object
+        :return: None
+        """
+        minutes = appt.start.minutes
+        idx = bisect.bisect_left(self.starts, minutes)
+        while idx < len(self.starts) and self.starts[idx] == minutes:
+            if self.appts[idx] == appt:
+                del self.starts[idx]
+                del self.appts[idx]
+                return
+            idx += 1
+
+    def select(self, start_after=None, start_before=None):
+        """
+        Get the indexed appts starting within the given times
+        :param start_after: A Time object, keep appts starting at or after it
+        :param start_before: A Time object, keep appts starting at or before it
+        :return: A list of Appointment objects in ascending order of start
+        """
+        first, last = 0, len(self.starts)
+        if start_after is not None:
+            first = bisect.bisect_left(self.starts, start_after.minutes)
+        if start_before is not None:
+            last = bisect.bisect_right(self.starts, start_before.minutes)
+        return self.appts[first:last]
+
+    def __len__(self):
+        return len(self.appts)
+
+    def __iter__(self):
+        return iter(self.appts)
+
+    def __setstate__(self, state):
+        # Copies of the source don't know about this index yet
+        self.__dict__.update(state)
+        self._watch_source()
+
+
+class ScheduleColumns(object):
+    """
+    A struct-of-arrays view of a Schedule, one typed array per appointment
+    field, so that filters run over columns instead of Appointment objects.
+    The columns are NumPy arrays filtered with boolean masks when numpy is
+    installed, and stdlib arrays filtered row by row otherwise. Row r
+    always describes self.appts[r], and the appts tell the columns when
+    their priority or interpreter changes
+    """
+
+    def __init__(self, appts, interpreters):
+        """
+        Initialize the ScheduleColumns class
+        :param appts: A list of Appointment objects
+        :param interpreters: A list of Interpreter objects
+        """
+        self.appts = list(appts)
+        self.rows = {appt: row for row, appt in enumerate(self.appts)}
+        self.interpreters = []
+        self.interpreter_rows = {}
+        for interpreter in interpreters:
+            self.interpreter_row(interpreter)
+        self.buildings = []
+        self.building_codes = {}
+        self.idnum = array('q')
+        self.start = array('l')
+        self.finish = array('l')
+        self.priority = array('d')
+        self.x = array('d')
+        self.y = array('d')
+        self.building = array('l')
+        self.language_mask = []
+        self.assigned = array('l')
+        for appt in self.appts:
+            building = getattr(appt.location, 'building', None)
+            if building not in self.building_codes:
+                self.building_codes[building] = len(self.buildings)
+                self.buildings.append(building)
+            self.idnum.append(appt.idnum)
+            self.start.append(appt.start.minutes)
+            self.finish.append(appt.finish.minutes)
+            self.priority.append(appt.priority)
+            self.x.append(appt.location.x)
+            self.y.append(appt.location.y)
+            self.building.append(self.building_codes[building])
+            self.language_mask.append(appt.patient.language_mask)
+            self.assigned.append(self._assigned_row(appt.interpreter))
+        self.sorted_by_start = all(self.start[row - 1] <= self.start[row]
+                                   for row in range(1, len(self.start)))
+        self.vectorized = np is not None
+        if self.vectorized:
+            self._to_numpy()
+        self._watch_appts()
+
+    def _to_numpy(self):
+        """
+        Swap the stdlib arrays for NumPy arrays of the same values. Language
+        masks stay Python ints if any uses more bits than an int64 holds
+        :return: None
+        """
+        for field in ('idnum', 'start', 'finish', 'priority', 'x', 'y',
+                      'building', 'assigned'):
+            setattr(self, field, np.array(getattr(self, field)))
+        if all(mask < 2 ** 63 for mask in self.language_mask):
+            self.language_mask = np.array(self.language_mask,
+                                          dtype=np.int64)
+        else:
+            self.language_mask = np.array(self.language_mask, dtype=object)
+
+    def _watch_appts(self):
+        for appt in self.appts:
+            appt.watch(self)
+
+    def interpreter_row(self, interpreter):
+        """
+        Get the index of interpreter, registering it if it is new
+        :param interpreter: An Interpreter object (or a name string)
+        :return: An integer index
+        """
+        if interpreter not in self.interpreter_rows:
+            self.interpreter_rows[interpreter] = len(self.interpreters)
+            self.interpreters.append(interpreter)
+        return self.interpreter_rows[interpreter]
+
+    def _assigned_row(self, interpreter):
+        if not interpreter:
+            return -1
+        return self.interpreter_row(interpreter)
+
+    def refresh(self, appt=None):
+        """
+        Re-read the mutable fields (priority and interpreter) from appt, or
+        from every appointment if appt is None
+        :param appt: An Appointment object, or None
+        :return: None
+        """
+        appts = self.appts if appt is None else [appt]
+        for appt in appts:
+            row = self.rows[appt]
+            self.priority[row] = appt.priority
+            self.assigned[row] = self._assigned_row(appt.interpreter)
+
+    def assign(self, appt, interpreter):
+        """
+        Record that interpreter was assigned to appt
+        :param appt: An Appointment object
+        :param interpreter: An Interpreter object
+        :return: None
+        """
+        if appt in self.rows:
+            self.assigned[self.rows[appt]] = self.interpreter_row(interpreter)
+
+    def unassign_all(self):
+        """
+        Mark every appointment as open
+        :return: None
+        """
+        if self.vectorized:
+            self.assigned = np.full(len(self.appts), -1, dtype=np.int64)
+        else:
+            self.assigned = array('l', [-1]) * len(self.appts)
+
+    def select(self, language_mask=None, start_after=None, start_before=None,
+               finish_before=None, open_only=False):
+        """
+        Get the rows that pass every filter given
+        :param language_mask: An integer bitmask, keep rows sharing a language
+        :param start_after: A Time object, keep rows starting at or after it
+        :param start_before: A Time object, keep rows starting at or before it
+        :param finish_before: A Time object, keep rows finishing at or before
+        :param open_only: A Boolean whether to keep only unassigned rows
+        :return: A list of integer rows in ascending order
+        """
+        first, last = 0, len(self.appts)
+        if self.sorted_by_start:
+            if start_after is not None:
+                first = bisect.bisect_left(self.start, start_after.minutes)
+                start_after = None
+            if start_before is not None:
+                last = bisect.bisect_right(self.start, start_before.minutes)
+                start_before = None
+        if self.vectorized:
+            return self._select_masked(first, last, language_mask,
+                                       start_after, start_before,
+                                       finish_before, open_only)
+        rows = range(first, last)
+        if start_after is not None:
+            start, minutes = self.start, start_after.minutes
+            rows = [row for row in rows if start[row] >= minutes]
+        if start_before is not None:
+            start, minutes = self.start, start_before.minutes
+            rows = [row for row in rows if start[row] <= minutes]
+        if finish_before is not None:
+            finish, minutes = self.finish, finish_before.minutes
+            rows = [row for row in rows if finish[row] <= minutes]
+        if language_mask is not None:
+            masks = self.language_mask
+            rows = [row for row in rows if masks[row] & language_mask]
+        if open_only:
+            assigned = self.assigned
+            rows = [row for row in rows if assigned[row] < 0]
+        return list(rows)
+
+    def _select_masked(self, first, last, language_mask, start_after,
+                       start_before, finish_before, open_only):
+        """
+        Apply the filters of self.select to rows first to last of the NumPy
+        columns at once, as boolean masks
+        :return: A list of integer rows in ascending order
+        """
+        window = slice(first, last)
+        keep = np.ones(max(last - first, 0), dtype=bool)
+        if start_after is not None:
+            keep &= self.start[window] >= start_after.minutes
+        if start_before is not None:
+            keep &= self.start[window] <= start_before.minutes
+        if finish_before is not None:
+            keep &= self.finish[window] <= finish_before.minutes
+        if language_mask is not None:
+            masks = self.language_mask[window]
+            if masks.dtype == np.int64:
+                # No appt speaks a language past the bits an int64 holds
+                language_mask &= 2 ** 63 - 1
+            keep &= (masks & language_mask) != 0
+        if open_only:
+            keep &= self.assigned[window] < 0
+        return (np.flatnonzero(keep) + first).tolist()
+
+    def select_appts(self, **filters):
+        """
+        Get the Appointment objects in the rows that pass filters
+        :param filters: Keyword arguments accepted by self.select
+        :return: A list of Appointment objects
+        """
+        return [self.appts[row] for row in self.select(**filters)]
+
+    def in_shift(self, interpreter, **filters):
+        """
+        Get the rows inside interpreter's shift that speak his/her language
+        :param interpreter: An Interpreter object
+        :param filters: Further keyword arguments accepted by self.select
+        :return: A list of integer rows in ascending order
+        """
+        filters.setdefault('start_after', interpreter.shift_start)
+        return self.select(language_mask=interpreter.language_mask,
+                           finish_before=interpreter.shift_finish,
+                           **filters)
+
+    def __getstate__(self):
+        return self.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._watch_appts()
+
+    def __eq__(self, other):
+        if not isinstance(other, ScheduleColumns):
+            return False
+        if self.__dict__.keys() != other.__dict__.keys():
+            return False
+        # NumPy columns compare element by element, so compare them as lists
+        for key, value in self.__dict__.items():
+            other_value = other.__dict__[key]
+            if hasattr(value, 'tolist') and hasattr(other_value, 'tolist'):
+                value, other_value = value.tolist(), other_value.tolist()
+            if value != other_value:
+                return False
+        return True
+
+    def __ne__(self, other):
+        return not self == other
+
+
 class Schedule(object):
     """
     Collection of weighted Appointment objects
     """
 
-    def __init__(self, appts, interpreters):
+    def __init__(self, appts, interpreters, walking_rate=WALKING_RATE,
+                 distance_model=None, travel=None):
         """
         Initialize the Schedule class, sort .appts, calculate .total_impact
         :param appts: A list of Appointment objects
         :param interpreters: A list of Interpreter objects
+        :param walking_rate: A number of distance units covered per minute
+        :param distance_model: A DistanceModel object, straight-line if None
+        :param travel: A TravelMatrix to share, or None to build one for appts
         """
         self.appts = list(appts)
         self.appts.sort()
         self.interpreters = interpreters
         self.impact = 0
         self.total_impact = sum([appt.priority for appt in self.appts])
+        if travel is None:
+            travel = TravelMatrix.build([appt.location for appt in
+                                         self.appts], walking_rate,
+                                        distance_model)
+        self.travel = travel
+        self.columns = ScheduleColumns(self.appts, self.interpreters)
+
+    def arrival(self, appt1, appt2):
+        """
+        Look up when staff would arrive at appt2 after finishing appt1
+        :param appt1: An Appointment object
+        :param appt2: An Appointment object
+        :return: A Time object representing when staff could begin appt2
+        """
+        return calc_arrival(appt1, appt2, self.travel)
 
     def calc_impact(self):
         """
@@ -183,6 +662,17 @@ class Schedule(object):
     def copy(self):
         return copy.deepcopy(self)
 
+    def subset(self, appts, interpreters):
+        """
+        Build a new Schedule that shares self's travel matrix, so that
+        components and time windows don't each build and cache their own
+        :param appts: A list of Appointment objects
+        :param interpreters: A list of Interpreter objects
+        :return: A Schedule object
+        """
+        return Schedule(appts, interpreters, self.travel.walking_rate,
+                        self.travel.model, self.travel)
+
     def gen_intervals(self):
         """
         Generate a dictionary of interval property lists used in the weighted
@@ -1,7 +1,20 @@
+import bisect
 import copy
+import heapq
 import random
 import collections
 import sys
+import multiprocessing
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+try:
+    import numpy as np
+    from scipy.optimize import Bounds, LinearConstraint, linprog, milp
+    from scipy.sparse import coo_matrix, csc_matrix
+except ImportError:
+    # scipy is optional, only IntegerProgram and ColumnGeneration need it
+    linprog = milp = None
 from person import (
     Patient,
     Interpreter
@@ -13,19 +26,36 @@ from location import (
 )
 from schedule import (
     Schedule,
-    Appointment
+    Appointment,
+    AppointmentList,
+    StartIndex
 )
 from utils import (
     timer,
-    Time,
-    sum_lists_product
+    Time
 )
 from person import Patient
-from constants import (
-    TIME_FORMAT,
-    WALKING_RATE
-)
+from constants import TIME_FORMAT
 from operator import attrgetter
+from array import array
+
+
+def _solve_component(scheduler, method_name, schedule):
+    """
+    Schedule one component of a decomposed problem in a worker process
+    :param scheduler: The scheduler class to build, eg. Optimum
+    :param method_name: The name of the scheduling method to call
+    :param schedule: The component's Schedule object
+    :return: A list of (appt idnum, interpreter uid) tuples assigned
+    """
+    solver = scheduler(schedule)
+    method = getattr(solver, method_name)
+    if hasattr(solver, 'call_method_default'):
+        result = solver.call_method_default(method)
+    else:
+        result = method()
+    return [(appt.idnum, appt.interpreter.uid) for appt in result.appts
+            if len(appt.interpreter) > 0]
 
 
 class ObjectInitializer(Grid):
@@ -42,10 +72,11 @@ class ObjectInitializer(Grid):
         self.schedule = schedule
         self.schedule_dict = {}
         self.appts_dict = {}
-        self.appts_to_assign = copy.deepcopy([appt for appt in schedule.appts if
-                                              len(appt.interpreter) == 0])
+        self.appts_to_assign = AppointmentList(
+            copy.deepcopy([appt for appt in schedule.appts
+                           if len(appt.interpreter) == 0]))
         self.language_dict = collections.defaultdict(list)
-        self.time_dict = collections.defaultdict(list)
+        self.time_index = StartIndex(self.appts_to_assign)
         self.valid_choices = collections.defaultdict(list)
         self.patients = {appt.patient for appt in self.schedule.appts
                          if len(appt.patient) > 0}
@@ -100,6 +131,7 @@ class ObjectInitializer(Grid):
         # Associate appts by idnum for optimization functions/objects
         for appt in self.schedule.appts:
             self.appts_dict[appt.idnum] = appt
+        self.index_appts(self.appts_to_assign)
 
     def populate_collections(self):
         """
@@ -116,9 +148,79 @@ class ObjectInitializer(Grid):
         # This is a useful heuristic to reduce node size
         # processed by scheduling algorithms
         for language in self.languages:
-            appts_in_lang = [appt for appt in self.appts_to_assign
-                             if language in appt.patient.languages]
-            self.language_dict[language] = appts_in_lang
+            self.language_dict[language] = []
+        for appt in self.appts_to_assign:
+            for language in appt.patient.languages:
+                if language in self.languages:
+                    self.language_dict[language].append(appt)
+
+    def open_appts_for(self, interpreter, time):
+        """
+        Get the open appointments starting at or after time whose patient
+        speaks one of interpreter's languages, filtering schedule columns
+        :param interpreter: An Interpreter object
+        :param time: A Time object indicating minimum sᵢ
+        :return: A list of Appointment objects in schedule order
+        """
+        appts = self.schedule.columns.select_appts(
+            language_mask=interpreter.language_mask, start_after=time)
+        return [appt for appt in appts if appt in self.appts_to_assign]
+
+    def gen_components(self):
+        """
+        Split the interpreters and open appts into the connected components
+        of the graph joining each interpreter to the appts in his/her shift
+        whose patients speak one of his/her languages (via language_dict).
+        Components never compete for an appt or an interpreter
+        :return: A list of (interpreters, appts) tuples with at least one of
+        each, appts in schedule order, largest components first
+        """
+        appts = list(self.appts_to_assign)
+        rows = {appt: len(self.interpreters) + row
+                for row, appt in enumerate(appts)}
+        parent = list(range(len(self.interpreters) + len(appts)))
+
+        def find(node):
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for i, interpreter in enumerate(self.interpreters):
+            for language in interpreter.languages:
+                for appt in self.language_dict.get(language, []):
+                    if appt in rows and \
+                            appt.start >= interpreter.shift_start and \
+                            appt.finish <= interpreter.shift_finish:
+                        parent[find(rows[appt])] = find(i)
+
+        components = collections.defaultdict(lambda: ([], []))
+        for i, interpreter in enumerate(self.interpreters):
+            components[find(i)][0].append(interpreter)
+        for appt in appts:
+            components[find(rows[appt])][1].append(appt)
+        return sorted([component for component in components.values()
+                       if component[0] and component[1]],
+                      key=lambda component: -len(component[1]))
+
+    def solve_subschedules(self, schedules, method_name, scheduler=None,
+                           max_workers=None):
+        """
+        Run a scheduling method on each of schedules in worker processes
+        :param schedules: A list of Schedule objects
+        :param method_name: The name of the scheduling method to call
+        :param scheduler: The scheduler class to build for each schedule,
+        the class of self if None
+        :param max_workers: The most worker processes, os.cpu_count() if None
+        :return: A list of (appt idnum, interpreter uid) lists per schedule
+        """
+        if scheduler is None:
+            scheduler = type(self)
+        with ProcessPoolExecutor(max_workers) as executor:
+            return list(executor.map(_solve_component,
+                                     [scheduler] * len(schedules),
+                                     [method_name] * len(schedules),
+                                     schedules))
 
 
 class Reinitializer(ObjectInitializer):
@@ -131,7 +233,7 @@ class Reinitializer(ObjectInitializer):
         Initialize the Reinitializer class
         :param schedule: A Schedule object
         """
-        ObjectInitializer.__init__(self, schedule)
+        super(Reinitializer, self).__init__(schedule)
         self.orig_schedule = schedule.copy()
 
     def reset(self):
@@ -156,12 +258,14 @@ class Reinitializer(ObjectInitializer):
         Reinitialize class data structures
         :return: None
         """
-        self.appts_to_assign = list([appt for appt in self.schedule.appts if
-                                     len(appt.interpreter) == 0])
-        self.time_dict = collections.defaultdict(list)
+        self.appts_to_assign = AppointmentList(
+            [appt for appt in self.schedule.appts
+             if len(appt.interpreter) == 0])
+        self.time_index = StartIndex(self.appts_to_assign)
         self.valid_choices = collections.defaultdict(list)
         self.jobs = {}
         self.locs = {}
+        self.index_appts(self.appts_to_assign)
         self.schedule_dict = {}
         self.schedule_paths = []
         self.best_paths = {}
@@ -173,6 +277,7 @@ class Reinitializer(ObjectInitializer):
         """
         for appt in self.schedule.appts:
             appt.interpreter = ""
+        self.schedule.columns.unassign_all()
         for interpreter in self.interpreters:
             self.add_loc(interpreter, Point(0, 0))
             self.init_job(interpreter, self.default_appt)
@@ -188,7 +293,9 @@ class JobSupervisor(Reinitializer):
         Initialize the JobSupervisor class
         :param schedule: A Schedule object
         """
-        Reinitializer.__init__(self, schedule)
+        super(JobSupervisor, self).__init__(schedule)
+        self.weight_vectors = {}
+        self.feasible = {}
         self._populate_appts()
 
     def _populate_appts(self):
@@ -212,6 +319,8 @@ class JobSupervisor(Reinitializer):
         :return: None
         """
         super(JobSupervisor, self).reset()
+        self.weight_vectors = {}
+        self.feasible = {}
 
     def get_job_with_id(self, job_id):
         """
@@ -292,22 +401,14 @@ class JobSupervisor(Reinitializer):
         jobs.append(appt)
         jobs.sort()
 
-    @staticmethod
-    def calc_arrival(appt1, appt2):
+    def calc_arrival(self, appt1, appt2):
         """
         Compute when staff would arrive at appt2 after finishing appt1
         :param appt1: An Appointment object (time order IS important)
         :param appt2: An Appointment object (time order IS important)
         :return: A Time object representing when staff could begin appt2
         """
-        appts = [appt1, appt2]
-        appts.sort()
-        dist = int(appts[0].location.distance_from(appts[1].location))
-        commute_time = round(dist / WALKING_RATE, 0)
-        time = appts[0].finish.copy()
-        time.add_time(hours=0, minutes=commute_time)
-        time = max(time, appts[1].start.copy())
-        return time
+        return self.schedule.arrival(appt1, appt2)
 
     def calc_impact(self):
         """
@@ -330,29 +431,257 @@ class JobSupervisor(Reinitializer):
             return True
         return False
 
+    @staticmethod
+    def assignment_weight(interpreter, appt):
+        """
+        Weight appt by interpreter's multiplier for its building
+        :param interpreter: An Interpreter object
+        :param appt: An Appointment object
+        :return: A number, the appt priority times the building multiplier
+        """
+        return appt.priority * interpreter.assignments.get(
+            appt.location.building, 1)
+
+    @staticmethod
+    def interpreter_class_key(interpreter, by_assignment=True):
+        """
+        Key interpreters by what decides which appts they can work and what
+        those appts are worth, so that equal keys can stand in for each other
+        :param interpreter: An Interpreter object
+        :param by_assignment: A Boolean whether the assignment multipliers
+        are part of the key
+        :return: A hashable tuple of (language mask, shift start, shift
+        finish) and, if by_assignment, the multipliers other than 1
+        """
+        key = (interpreter.language_mask, interpreter.shift_start.minutes,
+               interpreter.shift_finish.minutes)
+        if by_assignment:
+            # A multiplier of 1 weighs the same as no multiplier at all
+            key += (tuple(sorted([(building, weight) for (building, weight)
+                                  in interpreter.assignments.items()
+                                  if weight != 1])),)
+        return key
+
+    def gen_interpreter_classes(self, interpreters, by_assignment=True):
+        """
+        Group interpreters who can stand in for each other
+        :param interpreters: A list of Interpreter objects
+        :param by_assignment: A Boolean whether interpreters with different
+        assignment multipliers go in different classes
+        :return: A list of lists of Interpreter objects, in first seen order
+        """
+        classes = collections.OrderedDict()
+        for interpreter in interpreters:
+            key = self.interpreter_class_key(interpreter, by_assignment)
+            classes.setdefault(key, []).append(interpreter)
+        return list(classes.values())
+
+    def weight_vector(self, interpreter=None):
+        """
+        Get what every appt is worth to interpreter, computed once for each
+        class of interpreters (see interpreter_class_key) and left read-only,
+        so appt.priority never changes and workers can share the appts
+        :param interpreter: An Interpreter object, or None for the priorities
+        :return: A read-only mapping of idnum: weight, the root 0 weighing 0
+        """
+        key = (None if interpreter is None
+               else self.interpreter_class_key(interpreter))
+        if key not in self.weight_vectors:
+            weights = {0: 0}
+            for (idnum, appt) in self.appts_dict.items():
+                weights[idnum] = (appt.priority if interpreter is None else
+                                  self.assignment_weight(interpreter, appt))
+            self.weight_vectors[key] = MappingProxyType(weights)
+        return self.weight_vectors[key]
+
+    def feasible_appts(self, interpreter):
+        """
+        Get the appts interpreter could ever work: those inside his/her shift
+        whose patient speaks one of his/her languages. Assigning appts never
+        changes this, so it is worked out once per interpreter and kept
+        with the shift and languages it was worked out for, and worked out
+        again if either has changed since
+        :param interpreter: An Interpreter object
+        :return: A frozenset of Appointment id numbers from self.appts_dict
+        """
+        key = (interpreter.shift_start, interpreter.shift_finish,
+               interpreter.language_mask)
+        (cached_key, feasible) = self.feasible.get(interpreter, (None, None))
+        if cached_key != key:
+            feasible = frozenset([idnum for (idnum, appt)
+                                  in self.appts_dict.items()
+                                  if interpreter.is_compatible(appt.patient)
+                                  and self.is_appt_in_shift(interpreter,
+                                                            appt)])
+            self.feasible[interpreter] = (key, feasible)
+        return feasible
+
+    def is_feasible(self, interpreter, appt):
+        """
+        Test the part of can_assign that doesn't depend on what is assigned,
+        looking it up in self.feasible_appts for the appts in the schedule
+        :param interpreter: An Interpreter object
+        :param appt: An Appointment object
+        :return: A Boolean whether interpreter could work appt on its own
+        """
+        if appt.idnum in self.appts_dict:
+            return appt.idnum in self.feasible_appts(interpreter)
+        return (interpreter.is_compatible(appt.patient) and
+                self.is_appt_in_shift(interpreter, appt))
+
+    def feasible_open_appts(self, interpreter, time):
+        """
+        Get the open appointments starting at or after time that
+        interpreter could work, per self.feasible_appts
+        :param interpreter: An Interpreter object
+        :param time: A Time object indicating minimum sᵢ
+        :return: A list of Appointment objects in schedule order
+        """
+        feasible = self.feasible_appts(interpreter)
+        return [appt for appt in self.open_appts_for(interpreter, time)
+                if appt.idnum in feasible]
+
     def can_assign(self, interpreter, new_job, last_job=None):
         """
-        Test if possible to assign both new_job and last_job to interpreter
+        Test if possible to assign both new_job and last_job to interpreter.
+        Languages and shifts come from self.is_feasible, so only the open
+        status and the overlap with last_job are checked on each call
         :param interpreter: An Interpreter object
         :param new_job: An Appointment object (order IS important)
         :param last_job: An Appointment object (order IS important)
         :return: A Boolean indicating that it can be assigned without overlap
         """
+        if not (new_job in self.appts_to_assign and
+                self.is_feasible(interpreter, new_job)):
+            return False
         if last_job is None:
             last_job = self.get_last_job(interpreter)
-        appt_is_compatible = new_job.is_compatible(last_job)
-        patient_is_compatible = (interpreter.is_compatible(new_job.patient) and
-                                 interpreter.is_compatible(last_job.patient))
-        new_job_in_shift = self.is_appt_in_shift(interpreter, new_job)
-        last_job_in_shift = self.is_appt_in_shift(interpreter, last_job)
+        if not new_job.is_compatible(last_job):
+            return False
         if last_job == self.default_appt:
-            last_job_in_shift = True
-        shift_is_compatible = new_job_in_shift and last_job_in_shift
-        needs_to_assign = new_job in self.appts_to_assign
-        return (appt_is_compatible and
-                patient_is_compatible and
-                shift_is_compatible and
-                needs_to_assign)
+            # The default appt is in every shift and speaks every language
+            return interpreter.is_compatible(last_job.patient)
+        return self.is_feasible(interpreter, last_job)
+
+    def can_reach(self, appt1, appt2):
+        """
+        Test whether staff finishing appt1 can arrive at appt2 in time
+        :param appt1: An Appointment object (time order IS important)
+        :param appt2: An Appointment object (time order IS important)
+        :return: A Boolean whether appt2 can follow appt1
+        """
+        if not appt1.finish <= appt2.start:
+            return False
+        arrival = self.calc_arrival(appt1, appt2)
+        return arrival <= appt2.start.plus_minutes(appt2.late_allowed)
+
+    def calc_max_commute(self, appts):
+        """
+        Find the longest commute between any two of appts' locations
+        :param appts: A list of Appointment objects
+        :return: An integer number of minutes
+        """
+        commute = self.schedule.travel.commute
+        locations = list({appt.location for appt in appts})
+        return max([commute(loc1, loc2) for loc1 in locations
+                    for loc2 in locations] or [0])
+
+    def gen_time_windows(self, appts):
+        """
+        Split appts into windows of the day by a sweep over start times,
+        cutting wherever every appt so far has finished at least the longest
+        commute before the next one starts. Staff can get from any appt in
+        one window to any appt in a later one, so windows don't interact
+        :param appts: A list of Appointment objects
+        :return: A list of lists of Appointment objects, in time order
+        """
+        max_commute = self.calc_max_commute(appts)
+        windows = []
+        reach = None
+        for appt in sorted(appts, key=attrgetter('start')):
+            if reach is None or appt.start.minutes - reach >= max_commute:
+                windows.append([])
+                reach = appt.finish.minutes
+            windows[-1].append(appt)
+            reach = max(reach, appt.finish.minutes)
+        return windows
+
+    @timer
+    def create_decomposed_schedule(self, method_name, scheduler=None,
+                                   max_workers=None, printing=False):
+        """
+        Schedule each component from gen_components on its own, in parallel
+        worker processes, then assign the results in time order, skipping any
+        that are no longer open or no longer fit the interpreter's jobs.
+        Workers only see the open appts, so a result that clashes with a job
+        an interpreter already has is one of those skipped
+        :param method_name: The name of the scheduling method to call, with
+        the arguments Optimum.call_method_default gives it where it applies
+        :param scheduler: The scheduler class to build for each component,
+        the class of self if None
+        :param max_workers: The most worker processes, os.cpu_count() if None
+        :param printing: A Boolean whether to print status messages
+        :return: A Schedule object
+        """
+        schedules = []
+        for (interpreters, appts) in self.gen_components():
+            appts = [self.appts_dict[appt.idnum] for appt in appts]
+            (appts, interpreters) = copy.deepcopy((appts, interpreters))
+            schedules.append(self.schedule.subset(appts, interpreters))
+        if printing:
+            print("Solving " + str(len(schedules)) + " components...")
+        results = self.solve_subschedules(schedules, method_name, scheduler,
+                                          max_workers)
+
+        interpreters = {interpreter.uid: interpreter
+                        for interpreter in self.interpreters}
+        jobs = sorted([(self.appts_dict[idnum], uid)
+                       for assignments in results
+                       for (idnum, uid) in assignments],
+                      key=lambda job: job[0].start)
+        for (appt, uid) in jobs:
+            self.safe_assign(interpreters[uid], appt)
+        return self.schedule.copy()
+
+    @timer
+    def create_windowed_schedule(self, method_name, scheduler=None,
+                                 max_workers=None, printing=False):
+        """
+        Schedule each window from gen_time_windows on its own, in parallel
+        worker processes, then assign the results in time order, skipping any
+        that are no longer open or no longer fit the interpreter's jobs.
+        Each window starts every interpreter fresh at the origin: the cuts
+        leave at least the longest commute between windows, so the jobs of
+        one window never limit which appts an interpreter can reach in the
+        next
+        :param method_name: The name of the scheduling method to call, with
+        the arguments Optimum.call_method_default gives it where it applies
+        :param scheduler: The scheduler class to build for each window,
+        the class of self if None
+        :param max_workers: The most worker processes, os.cpu_count() if None
+        :param printing: A Boolean whether to print status messages
+        :return: A Schedule object
+        """
+        self.reset()
+        windows = self.gen_time_windows(self.schedule.appts)
+        schedules = []
+        for window in windows:
+            (appts, interpreters) = copy.deepcopy((window, self.interpreters))
+            schedules.append(self.schedule.subset(appts, interpreters))
+        if printing:
+            print("Solving " + str(len(schedules)) + " windows...")
+        results = self.solve_subschedules(schedules, method_name, scheduler,
+                                          max_workers)
+
+        interpreters = {interpreter.uid: interpreter
+                        for interpreter in self.interpreters}
+        for assignments in results:
+            appts = sorted([(self.appts_dict[idnum], uid)
+                            for (idnum, uid) in assignments],
+                           key=lambda job: job[0].start)
+            for (appt, uid) in appts:
+                self.safe_assign(interpreters[uid], appt)
+        return self.schedule.copy()
 
     def can_insert_job(self, interpreter, appt):
         """
@@ -368,7 +697,8 @@ class JobSupervisor(Reinitializer):
         if not interpreter_jobs:
             return True
 
-        temp_lst = copy.deepcopy(interpreter_jobs)
+        # Sorting a shallow copy leaves the jobs alone, no need to deep copy
+        temp_lst = list(interpreter_jobs)
         temp_lst.append(appt)
         temp_lst.sort()
         temp_index = temp_lst.index(appt)
@@ -408,6 +738,8 @@ class JobSupervisor(Reinitializer):
         if interpreter not in self.interpreters:
             self.interpreters.append(interpreter)
         self.appts_to_assign.remove(appt)
+        self.remove_appt(appt)
+        self.schedule.columns.assign(appt, interpreter)
         self.schedule.impact += appt.priority
 
     def safe_assign(self, interpreter, appt):
@@ -443,7 +775,7 @@ class JobSupervisor(Reinitializer):
 
 class AvailabilityController(JobSupervisor):
     """
-    Controls the availability of Interpreter objects using Time dicts
+    Controls the availability of Interpreter objects using a start time index
     """
 
     def __init__(self, schedule):
@@ -451,69 +783,55 @@ class AvailabilityController(JobSupervisor):
         Initialize the AvailabilityController class
         :param schedule: A Schedule object
         """
-        JobSupervisor.__init__(self, schedule)
-
-    def update_time_dict(self, time, appts):
-        """
-        A dict of Appointments in ascending order at or after a given time
-        :param time: A Time object at or after which appts start
-        :param appts: A collection of Appointment objects at or after time
-        :return: None
-        """
-        self.time_dict = collections.defaultdict(list)
-        for appt in appts:
-            if appt.start >= time:
-                appt_time = str(appt.start)
-                self.time_dict[appt_time].append(appt)
+        super(AvailabilityController, self).__init__(schedule)
 
-    def rev_update_time_dict(self, time, appts):
+    def get_time_index(self, appts):
         """
-        A dict of Appointments in descending order at or after a given time
-        :param time: A Time object at or before which appts start
-        :param appts: A collection of Appointment objects at or before time
-        :return: None
+        Get a StartIndex over appts. The index over self.appts_to_assign is
+        kept between calls and follows every change to it, so it is only
+        rebuilt once appts_to_assign is replaced by another list
+        :param appts: A collection of Appointment objects
+        :return: A StartIndex object
         """
-        self.time_dict = collections.defaultdict(list)
-        for appt in appts:
-            if appt.start <= time:
-                appt_time = str(appt.start)
-                self.time_dict[appt_time].append(appt)
+        if appts is not self.appts_to_assign:
+            return StartIndex(appts)
+        if self.time_index.source is not self.appts_to_assign:
+            self.time_index = StartIndex(self.appts_to_assign)
+        return self.time_index
 
     def update_valid_choices(self, time, appts):
         """
         A dict of Appointment lists indexed to interpreters that can cover them
         Warning: Do not use if appointments are assigned out of sequence, or
         self.get_last_job(interpreter) will not work correctly
-        :param time: A Time object to direct self.update_time_dict
+        :param time: A Time object at or after which appts start
         :param appts: A list of Appointment objects
         :return: None
         """
-        self.update_time_dict(time, appts)
+        time_index = self.get_time_index(appts)
         self.valid_choices = collections.defaultdict(list)
         for interpreter in self.interpreters:
             time_when_available = self.get_last_job(interpreter).finish
-            for appt_time, appt_list in self.time_dict.items():
-                if Time(appt_time, TIME_FORMAT) >= time_when_available:
-                    for appt in appt_list:
-                        if self.can_assign(interpreter, appt):
-                            self.valid_choices[interpreter].append(appt)
+            for appt in time_index.select(
+                    start_after=max(time, time_when_available)):
+                if self.can_assign(interpreter, appt):
+                    self.valid_choices[interpreter].append(appt)
 
     def rev_update_valid_choices(self, time, appts):
         """
         A dict of Appointment lists indexed to interpreters that can cover them
-        :param time: A Time object to direct self.rev_update_time_dict
+        :param time: A Time object at or before which appts start
         :param appts: A list of Appointment objects
         :return: None
         """
-        self.rev_update_time_dict(time, appts)
+        time_index = self.get_time_index(appts)
         self.valid_choices = collections.defaultdict(list)
         for interpreter in self.interpreters:
             time_when_available = self.get_last_job(interpreter).finish
-            for appt_time, appt_list in self.time_dict.items():
-                if Time(appt_time, TIME_FORMAT) >= time_when_available:
-                    for appt in appt_list:
-                        if self.can_assign(interpreter, appt):
-                            self.valid_choices[interpreter].append(appt)
+            for appt in time_index.select(start_after=time_when_available,
+                                          start_before=time):
+                if self.can_assign(interpreter, appt):
+                    self.valid_choices[interpreter].append(appt)
 
     def next_valid_choice(self, interpreter, time, mode='after'):
         """
@@ -523,8 +841,9 @@ class AvailabilityController(JobSupervisor):
         :param mode: A string whether it should look after or before
         :return: An Appointment object
         """
-        mode_dict = {'before': self.rev_update_valid_choices,
-                     'after': self.update_valid_choices}
+        if mode == 'after':
+            return self.nearest_valid_choice(interpreter, time)
+        mode_dict = {'before': self.rev_update_valid_choices}
         mode_dict[mode](time, self.appts_to_assign)
         current_appt = self.get_last_job(interpreter)
         choices = self.valid_choices[interpreter]
@@ -535,6 +854,31 @@ class AvailabilityController(JobSupervisor):
             return choices[idx]
         return None
 
+    def nearest_valid_choice(self, interpreter, time):
+        """
+        Get the appointment starting at or after time that interpreter can
+        reach first, searching the Grid spatial index outward from the
+        interpreter's last job instead of every open appointment
+        :param interpreter: An Interpreter object
+        :param time: A Time object
+        :return: An Appointment object, or None
+        """
+        if (self.indexed_appts is not self.appts_to_assign or
+                self.appt_count != len(self.appts_to_assign)):
+            self.index_appts(self.appts_to_assign)
+        current_appt = self.get_last_job(interpreter)
+        travel = self.schedule.travel
+        walking_rate = None
+        if travel.model.at_least_straight_line:
+            walking_rate = travel.walking_rate
+        return self.nearest_appt(current_appt.location,
+                                 current_appt.finish,
+                                 max(time, current_appt.finish),
+                                 travel.commute,
+                                 walking_rate,
+                                 lambda appt: self.can_assign(interpreter,
+                                                              appt))
+
 
 class MonteCarlo(AvailabilityController):
     """
@@ -546,7 +890,7 @@ class MonteCarlo(AvailabilityController):
         Initialize the MonteCarlo class
         :param schedule: A Schedule object
         """
-        AvailabilityController.__init__(self, schedule)
+        super(MonteCarlo, self).__init__(schedule)
 
     def optimized_random_schedule(self, time, printing=False):
         """
@@ -557,15 +901,8 @@ class MonteCarlo(AvailabilityController):
         """
         self.reset()
         for interpreter in self.interpreters:
-            temp_lst = []
-            for language in interpreter.languages:
-                temp_lst += list(
-                    [appt for appt in self.language_dict[language] if
-                     appt in self.appts_to_assign and
-                     appt.start >= time]
-                )
+            temp_lst = self.feasible_open_appts(interpreter, time)
             while temp_lst:
-                self.update_valid_choices(time, temp_lst)
                 rand_appt = random.choice(temp_lst)
                 is_valid_choice = self.can_insert_job(interpreter,
                                                       rand_appt)
@@ -637,7 +974,7 @@ class Greedy(AvailabilityController):
         Initialize the Greedy class
         :param schedule: A Schedule object
         """
-        AvailabilityController.__init__(self, schedule)
+        super(Greedy, self).__init__(schedule)
 
     def select_highest_priority(self, interpreter, time, appts):
         """
@@ -678,27 +1015,77 @@ class Greedy(AvailabilityController):
             priority_lst = list([(appt.priority, appt)
                                  for appt in appt_lst])
             greedy_appt = max(priority_lst)[1]
-            greedy_str = (str(interpreter) +
-                          " assigned to " +
-                          str(greedy_appt.idnum) +
-                          ", priority = " +
-                          str(greedy_appt.priority))
         elif optimal == 'number':
-            # Scan fᵢ in the appt_lst and select the minimum,
+            # Scan fᵢ in the appt_list and select the minimum,
             # which is the earliest finish time
             len_lst = list([(appt.finish, appt)
                             for appt in appt_lst])
             earliest_fi = min(len_lst)[1]
             greedy_appt = earliest_fi
-            greedy_str = (str(interpreter) +
-                          " assigned to " +
-                          str(greedy_appt.idnum) +
-                          ", finish = " +
-                          str(greedy_appt.finish))
         else:
             raise ValueError('optimal is not a valid value.')
+        greedy_str = self.describe_choice(interpreter, greedy_appt, optimal)
         return greedy_appt, greedy_str
 
+    @staticmethod
+    def describe_choice(interpreter, appt, optimal):
+        """
+        Describe assigning appt to interpreter for status messages
+        :param interpreter: An Interpreter object
+        :param appt: An Appointment object
+        :param optimal: A string, 'weight' or 'number', to optimize for
+        :return: A string
+        """
+        if optimal.lower() == 'number':
+            detail = ", finish = " + str(appt.finish)
+        else:
+            detail = ", priority = " + str(appt.priority)
+        return str(interpreter) + " assigned to " + str(appt.idnum) + detail
+
+    @staticmethod
+    def greedy_key(optimal):
+        """
+        Get the heap key that orders appts the way process_args picks them,
+        highest priority first for 'weight' and earliest finish first for
+        'number', breaking ties on start time the same way max and min do
+        :param optimal: A string, 'weight' or 'number', to optimize for
+        :return: A function of an Appointment object returning a tuple
+        """
+        optimal = optimal.lower()
+        if optimal == 'weight':
+            return lambda appt: (-appt.priority, -appt.start.minutes)
+        elif optimal == 'number':
+            return lambda appt: (appt.finish.minutes, appt.start.minutes)
+        raise ValueError('optimal is not a valid value.')
+
+    def gen_greedy_queue(self, appts, optimal):
+        """
+        Build a priority queue of appts in the order process_args would
+        pick them; the position breaks any remaining ties by list order
+        :param appts: A list of Appointment objects
+        :param optimal: A string, 'weight' or 'number', to optimize for
+        :return: A heap of (key, position, appt) tuples
+        """
+        key = self.greedy_key(optimal)
+        queue = [(key(appt), position, appt)
+                 for position, appt in enumerate(appts)]
+        heapq.heapify(queue)
+        return queue
+
+    def pop_greedy_choice(self, queue):
+        """
+        Pop the best appt in queue that is still left to assign. Appts
+        assigned since they were queued are stale and dropped as they come
+        up, so an assignment doesn't have to touch the other queues
+        :param queue: A heap from gen_greedy_queue
+        :return: An Appointment object, or None once queue is empty
+        """
+        while queue:
+            appt = heapq.heappop(queue)[2]
+            if appt in self.appts_to_assign:
+                return appt
+        return None
+
     @timer
     def create_classic_greedy_schedule(self, time, optimal, printing=False):
         """
@@ -709,75 +1096,50 @@ class Greedy(AvailabilityController):
         :return: A Schedule object
         """
         self.reset()
-        is_valid_choice = False
         for interpreter in self.interpreters:
-            stack = []
-            for language in interpreter.languages:
-                stack += [appt for appt in self.appts_to_assign
-                          if language in appt.patient.languages
-                          and appt.start >= time]
-            while stack:
-                self.update_valid_choices(time, stack)
-                greedy_appt, greedy_str = self.process_args(optimal,
-                                                            stack,
-                                                            interpreter)
-                if isinstance(greedy_appt, Appointment):
-                    if self.can_insert_job(interpreter, greedy_appt):
-                        self.assign(interpreter, greedy_appt)
-                        if printing:
-                            print(greedy_str)
-                    stack.remove(greedy_appt)
-                else:
-                    break
+            queue = self.gen_greedy_queue(
+                self.feasible_open_appts(interpreter, time), optimal)
+            greedy_appt = self.pop_greedy_choice(queue)
+            while greedy_appt is not None:
+                if self.can_insert_job(interpreter, greedy_appt):
+                    self.assign(interpreter, greedy_appt)
+                    if printing:
+                        print(self.describe_choice(interpreter, greedy_appt,
+                                                   optimal))
+                greedy_appt = self.pop_greedy_choice(queue)
         return copy.deepcopy(self.schedule)
 
     @timer
     def create_balanced_greedy_schedule(self, time, optimal, printing=False):
         """
         Assigns appointments while balancing the load on each employee.
+        Each interpreter takes a turn picking from his/her own queue, and
+        sits out the turn after an assignment so the others can catch up
         :param time: A Time object indicating minimum sᵢ
         :param optimal: A string, 'weight' or 'number', to optimize for
         :param printing: A Boolean whether or not to print status messages
         :return: A Schedule object
         """
         self.reset()
-        appts = {}
+        queues = collections.OrderedDict()
         for interpreter in self.interpreters:
-            stack = []
-            for language in interpreter.languages:
-                stack += [appt for appt in self.appts_to_assign
-                          if language in appt.patient.languages
-                          and appt.start >= time]
-            appts[interpreter] = stack
-
-        while appts:
-            for interpreter in dict(appts):
-                if len(appts[interpreter]) < 1:
-                    del appts[interpreter]
-                else:
-                    appts_sublist = appts[interpreter]
-                    self.update_valid_choices(time,
-                                              appts_sublist)
-                    greedy_data = self.process_args(optimal, appts_sublist,
-                                                    interpreter)
-                    greedy_appt, greedy_str = greedy_data
-                    if isinstance(greedy_appt, Appointment):
-                        is_valid_appt = self.can_insert_job(interpreter,
-                                                            greedy_appt)
-                    else:
-                        is_valid_appt = False
-                    if is_valid_appt:
-                        self.assign(interpreter, greedy_appt)
-                        if printing:
-                            print(greedy_str)
-                        # Remove the assigned appointment from the other
-                        # interpreters' appointment lists
-                        appt_keys = set(appts.keys()) - set([interpreter])
-                        for interp_key in appt_keys:
-                            if greedy_appt in appts[interp_key]:
-                                appts[interp_key].remove(greedy_appt)
-                    else:
-                        appts[interpreter].remove(greedy_appt)
+            queues[interpreter] = self.gen_greedy_queue(
+                self.feasible_open_appts(interpreter, time), optimal)
+        resting = set()
+        while queues:
+            for interpreter in list(queues):
+                if interpreter in resting:
+                    resting.remove(interpreter)
+                    continue
+                greedy_appt = self.pop_greedy_choice(queues[interpreter])
+                if greedy_appt is None:
+                    del queues[interpreter]
+                elif self.can_insert_job(interpreter, greedy_appt):
+                    self.assign(interpreter, greedy_appt)
+                    resting.add(interpreter)
+                    if printing:
+                        print(self.describe_choice(interpreter, greedy_appt,
+                                                   optimal))
         return copy.deepcopy(self.schedule)
 
     @timer
@@ -816,6 +1178,147 @@ class Greedy(AvailabilityController):
         return sched_copy
 
 
+# The tree being searched and the best weight found by any search process,
+# set once per worker by _init_search_process
+_search_state = None
+
+
+def _init_search_process(shared, tree, weights, bounds, rank, incumbent,
+                         ceiling=None):
+    """
+    Give a ProcessPoolExecutor worker everything its branches have in
+    common, so each task only carries its branch entry
+    :param shared: A multiprocessing Value for the best weight found
+    :param tree: An adjacency dictionary keyed by idnum
+    :param weights: A dictionary of idnum: weight
+    :param bounds: A dictionary of idnum: bound, see calc_bounds
+    :param rank: A dictionary of idnum: rank, see calc_bounds
+    :param incumbent: A tuple of (weight, path) to beat
+    :param ceiling: An optional weight no path can beat, see search_stack
+    :return: None
+    """
+    global _search_state
+    _search_state = (tree, weights, bounds, rank, incumbent, shared, ceiling)
+
+
+def _search_branch(entry):
+    """
+    Search one branch of a split branch_and_bound in a worker process
+    :param entry: An (idnum, weight, parent link) entry to start from
+    :return: A tuple of (weight, path), see BruteForce.search_stack
+    """
+    (tree, weights, bounds, rank, incumbent, shared, ceiling) = _search_state
+    return BruteForce.search_stack([entry], tree, weights, bounds, rank,
+                                   incumbent, shared, ceiling)
+
+
+class CompatibilityGraph(Mapping):
+    """
+    Adjacency sets of the appointments an interpreter can work, keyed by
+    idnum, where appt b succeeds appt a when b starts once a finishes.
+    Node 0 is the root and is succeeded by every appointment
+    """
+
+    def __init__(self, interpreter, appts):
+        """
+        Build the successor sets of every appointment in one pass
+        :param interpreter: An Interpreter object
+        :param appts: A list of Appointment objects
+        """
+        self.position = {appt.idnum: idx for idx, appt in enumerate(appts)}
+        self.limit = None
+        self.removed = frozenset()
+        self.sets = {}
+        valid = [appt for appt in appts
+                 if interpreter.is_compatible(appt.patient) and
+                 JobSupervisor.is_appt_in_shift(interpreter, appt)]
+        self.valid = valid
+        self.nodes = self.order_nodes(valid)
+
+        by_start = sorted(valid, key=attrgetter('start'))
+        starts = [appt.start.minutes for appt in by_start]
+        ids = [appt.idnum for appt in by_start]
+        self.successors = {0: tuple(sorted(ids))}
+        for appt in valid:
+            idx = bisect.bisect_left(starts, appt.finish.minutes)
+            self.successors[appt.idnum] = tuple(sorted(
+                [idnum for idnum in ids[idx:] if idnum != appt.idnum]))
+
+    @staticmethod
+    def order_nodes(appts):
+        """
+        Order the root and appts the way a time dict over finish-sorted
+        appts would, grouping appts that start at the same time
+        :param appts: A list of Appointment objects
+        :return: A list of idnums, starting with the root 0
+        """
+        by_finish = sorted(sorted(appts), key=attrgetter('finish'))
+        groups = collections.OrderedDict()
+        for appt in by_finish:
+            groups.setdefault(appt.start.minutes, []).append(appt)
+        return [0] + [appt.idnum for group in groups.values()
+                      for appt in group]
+
+    def restrict(self, appts):
+        """
+        A view of the graph without the appts missing from appts, eg. the
+        ones assigned since it was built. It equals the graph built from the
+        same interpreter and appts, when appts keeps the original order
+        :param appts: A collection of Appointment objects
+        :return: A CompatibilityGraph object sharing this graph's sets
+        """
+        view = copy.copy(self)
+        view.removed = self.removed | frozenset(
+            [appt.idnum for appt in self.valid if appt not in appts])
+        view.valid = [appt for appt in self.valid
+                      if appt.idnum not in view.removed]
+        view.nodes = self.order_nodes(view.valid)
+        view.sets = {}
+        return view
+
+    def prefix(self, idnum):
+        """
+        A view of the graph limited to the appts up to and including idnum,
+        in the order of the appts the graph was built from
+        :param idnum: An Appointment idnum
+        :return: A CompatibilityGraph object sharing this graph's sets
+        """
+        view = copy.copy(self)
+        view.limit = self.position[idnum]
+        view.sets = {}
+        return view
+
+    def _in_view(self, idnum):
+        return idnum == 0 or (idnum not in self.removed and
+                              (self.limit is None or
+                               self.position[idnum] <= self.limit))
+
+    def __getitem__(self, idnum):
+        # Each set is only filtered down to the view the first time it's used
+        if idnum in self.sets:
+            return self.sets[idnum]
+        if idnum not in self:
+            raise KeyError(idnum)
+        successors = set(self.successors[idnum])
+        if self.removed:
+            successors -= self.removed
+        if self.limit is not None:
+            position, limit = self.position, self.limit
+            successors = set([ID for ID in successors
+                              if position[ID] <= limit])
+        self.sets[idnum] = successors
+        return successors
+
+    def __contains__(self, idnum):
+        return idnum in self.successors and self._in_view(idnum)
+
+    def __iter__(self):
+        return (idnum for idnum in self.nodes if self._in_view(idnum))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
 class BruteForce(AvailabilityController):
     """
     Utilizes a brute force approach to computing as many of the
@@ -829,34 +1332,76 @@ class BruteForce(AvailabilityController):
         Initialize the BruteForce class
         :param schedule:
         """
-        AvailabilityController.__init__(self, schedule)
+        super(BruteForce, self).__init__(schedule)
+        self.class_graphs = {}
 
-    def dfs_weighted(self, tree, start, finish, interpreter):
+    def reset(self):
         """
-        DFS for max weight appointment list in the power set of appt lists
+        Reinitialize the class, dropping the graphs kept for each class of
+        interpreters
+        :return: None
+        """
+        super(BruteForce, self).reset()
+        self.class_graphs = {}
+
+    @staticmethod
+    def unwind(link):
+        """
+        Rebuild a path from the parent pointers kept on the DFS stack
+        :param link: A tuple of (idnum, parent link), None at the root
+        :return: A list of idnums from the root to the linked node
+        """
+        path = []
+        while link is not None:
+            (vertex, link) = link
+            path.append(vertex)
+        path.reverse()
+        return path
+
+    def dfs_paths(self, tree, start, finish, interpreter, weights):
+        """
+        DFS for every path from start to finish, tracking the heaviest in
+        self.best_paths. Each stack entry carries its visited nodes as a
+        bitmask, its running weight and a parent pointer, so a step only
+        allocates O(1); paths are rebuilt when they reach finish
         :param tree: An adjacency list using idnums to represent node number
-        :param start: The start time as a Time object
-        :param finish: The finish time as a Time object
+        :param start: The idnum of the root node
+        :param finish: The idnum of the node that paths end on
         :param interpreter: An Interpreter object
+        :param weights: A dictionary of idnum: weight, see path_weights
         :return: A generator object
         """
-        stack = [(start, [start])]
-        appts_dict = self.appts_dict
+        bits = {ID: 1 << idx for idx, ID in enumerate(tree)}
+        stack = [(start, bits[start], weights[start], (start, None))]
         if interpreter not in self.best_paths:
             self.best_paths[interpreter] = (0, [])
         max_weight = self.best_paths[interpreter][0]
         while stack:
-            (vertex, path) = stack.pop()
-            for next in tree[vertex] - set(path):
+            (vertex, visited, weight, link) = stack.pop()
+            for next in tree[vertex]:
+                if visited & bits[next]:
+                    continue
                 if next == finish:
-                    weight = sum([appts_dict[ID].priority for ID in
-                                  (path + [next]) if ID in appts_dict])
-                    if weight > max_weight:
-                        self.best_paths[interpreter] = (weight, path + [next])
-                        max_weight = weight
-                    yield path + [next]
+                    path = self.unwind((next, link))
+                    if weight + weights[next] > max_weight:
+                        max_weight = weight + weights[next]
+                        self.best_paths[interpreter] = (max_weight, path)
+                    yield path
                 else:
-                    stack.append((next, path + [next]))
+                    stack.append((next, visited | bits[next],
+                                  weight + weights[next], (next, link)))
+
+    def dfs_weighted(self, tree, start, finish, interpreter):
+        """
+        DFS for max weight appointment list in the power set of appt lists
+        :param tree: An adjacency list using idnums to represent node number
+        :param start: The start time as a Time object
+        :param finish: The finish time as a Time object
+        :param interpreter: An Interpreter object
+        :return: A generator object
+        """
+        weights = self.weight_vector()
+        return self.dfs_paths(tree, start, finish, interpreter, weights)
 
     def dfs_weighted_by_assignment(self, tree, start, finish, interpreter):
         """
@@ -868,28 +1413,304 @@ class BruteForce(AvailabilityController):
         :param interpreter: An Interpreter object
         :return: A generator object
         """
-        stack = [(start, [start])]
-        appts_dict = self.appts_dict
-        if interpreter not in self.best_paths:
-            self.best_paths[interpreter] = (0, [])
-        max_weight = self.best_paths[interpreter][0]
-        while stack:
-            (vertex, path) = stack.pop()
-            for next in tree[vertex] - set(path):
-                if next == finish:
-                    appt_wts = [appts_dict[ID].priority for ID in
-                                (path + [next]) if ID in appts_dict]
-                    inter_wts = [interpreter.assignments[
-                        appts_dict[ID].location.building
-                    ]
-                        for ID in (path + [next]) if ID in appts_dict]
-                    weight = sum_lists_product(appt_wts, inter_wts)
-                    if weight > max_weight:
-                        self.best_paths[interpreter] = (weight, path + [next])
-                        max_weight = weight
-                    yield path + [next]
+        weights = self.weight_vector(interpreter)
+        return self.dfs_paths(tree, start, finish, interpreter, weights)
+
+    def path_weights(self, tree, interpreter, by_assignment=False):
+        """
+        Weight every node in tree, the root weighing nothing
+        :param tree: A CompatibilityGraph or adjacency list keyed by idnum
+        :param interpreter: An Interpreter object
+        :param by_assignment: A Boolean whether to apply the interpreter's
+        assignment multipliers, as dfs_weighted_by_assignment does
+        :return: A dictionary of idnum: weight
+        """
+        weights = {0: 0}
+        for ID in tree:
+            if ID in self.appts_dict:
+                appt = self.appts_dict[ID]
+                if by_assignment:
+                    weights[ID] = self.assignment_weight(interpreter, appt)
                 else:
-                    stack.append((next, path + [next]))
+                    weights[ID] = appt.priority
+        return weights
+
+    def class_schedule_graph(self, interpreter):
+        """
+        Get interpreter's graph of the appts left to assign. It's only built
+        for the first interpreter of a class, see interpreter_class_key; the
+        rest of the class get a view of it without the appts assigned since
+        :param interpreter: An Interpreter object
+        :return: A CompatibilityGraph object
+        """
+        key = self.interpreter_class_key(interpreter, False)
+        if key not in self.class_graphs:
+            self.class_graphs[key] = self.gen_schedule_graph(
+                interpreter, list(self.appts_to_assign))
+            return self.class_graphs[key]
+        return self.class_graphs[key].restrict(self.appts_to_assign)
+
+    def calc_bounds(self, tree, weights):
+        """
+        Compute the optimistic bound for branch_and_bound: the most weight
+        that can still be collected after each node, filled in from the
+        latest appts back to the root
+        :param tree: A CompatibilityGraph or adjacency list keyed by idnum
+        :param weights: A dictionary of idnum: weight, see path_weights
+        :return: A tuple of (bounds, rank) dictionaries keyed by idnum, where
+        rank orders the nodes by start time so the search only moves forward
+        """
+        def sort_key(ID):
+            appt = self.appts_dict[ID]
+            return appt.start, appt.finish, ID
+        order = sorted([ID for ID in tree if ID > 0], key=sort_key)
+        rank = {ID: idx for idx, ID in enumerate(order, 1)}
+        rank[0] = 0
+        bounds = {}
+        for ID in reversed([0] + order):
+            bounds[ID] = max([weights[next] + bounds[next]
+                              for next in tree[ID] if rank[next] > rank[ID]]
+                             or [0])
+        return bounds, rank
+
+    @staticmethod
+    def branch_and_bound(tree, start, weights, bounds, rank,
+                         incumbent=(0, []), ceiling=None):
+        """
+        DFS for the max weight path through tree that prunes a partial path
+        once its weight plus the bound after it can't beat the incumbent.
+        Only the best path is kept, rebuilt from parent pointers when found
+        :param tree: A CompatibilityGraph or adjacency list keyed by idnum
+        :param start: The idnum of the root node
+        :param weights: A dictionary of idnum: weight, see path_weights
+        :param bounds: A dictionary of idnum: bound, see calc_bounds
+        :param rank: A dictionary of idnum: start order, see calc_bounds
+        :param incumbent: A tuple of (weight, path) to beat
+        :param ceiling: An optional weight no path can beat, see search_stack
+        :return: A tuple of (weight, path), the incumbent if nothing beat it
+        """
+        stack = [(start, weights[start], (start, None))]
+        return BruteForce.search_stack(stack, tree, weights, bounds, rank,
+                                       incumbent, ceiling=ceiling)
+
+    @staticmethod
+    def search_stack(stack, tree, weights, bounds, rank, incumbent,
+                     shared=None, ceiling=None):
+        """
+        Run branch_and_bound from the entries already on stack
+        :param stack: A list of (idnum, weight, parent link) entries
+        :param tree: A CompatibilityGraph or adjacency list keyed by idnum
+        :param weights: A dictionary of idnum: weight, see path_weights
+        :param bounds: A dictionary of idnum: bound, see calc_bounds
+        :param rank: A dictionary of idnum: start order, see calc_bounds
+        :param incumbent: A tuple of (weight, path) to beat
+        :param shared: An optional multiprocessing Value holding the best
+        weight found by any process. Branches that can only tie it are still
+        explored, so the path kept doesn't depend on which process was first
+        :param ceiling: An optional weight known to be the most any path can
+        reach, eg. what an interpreter of the same class got from a larger
+        tree. The search stops at the first path reaching it, which is the
+        path it would have kept anyway
+        :return: A tuple of (weight, path), the incumbent if nothing beat it
+        """
+        (max_weight, best_path) = incumbent
+        floor = max_weight
+        if ceiling is not None and max_weight >= ceiling:
+            return max_weight, best_path
+        while stack:
+            (vertex, weight, link) = stack.pop()
+            if shared is not None:
+                floor = max(max_weight, shared.value)
+                if weight + bounds[vertex] < floor:
+                    continue
+            if weight > max_weight:
+                (max_weight, best_path) = (weight, BruteForce.unwind(link))
+                if shared is not None:
+                    with shared.get_lock():
+                        shared.value = max(shared.value, weight)
+                if ceiling is not None and max_weight >= ceiling:
+                    break
+            # Push the most promising branch last so it's explored first
+            branches = sorted([(weights[next] + bounds[next], next)
+                               for next in tree[vertex]
+                               if rank[next] > rank[vertex]])
+            for (potential, next) in branches:
+                if (weight + potential > max_weight and
+                        weight + potential >= floor):
+                    stack.append((next, weight + weights[next],
+                                  (next, link)))
+        return max_weight, best_path
+
+    @staticmethod
+    def split_branches(tree, start, weights, bounds, rank, incumbent,
+                       depth=1):
+        """
+        Split branch_and_bound by its first depth appointment choices,
+        in the order the serial search would visit them
+        :param tree: A CompatibilityGraph or adjacency list keyed by idnum
+        :param start: The idnum of the root node
+        :param weights: A dictionary of idnum: weight, see path_weights
+        :param bounds: A dictionary of idnum: bound, see calc_bounds
+        :param rank: A dictionary of idnum: start order, see calc_bounds
+        :param incumbent: A tuple of (weight, path) to beat
+        :param depth: The number of appointment choices to split by
+        :return: A list of (is_branch, entry) tuples. Branch entries are
+        searched separately, the others are shorter paths to weigh as is
+        """
+        splits = []
+        stack = [(start, weights[start], (start, None), 0)]
+        while stack:
+            (vertex, weight, link, level) = stack.pop()
+            if level == depth:
+                splits.append((True, (vertex, weight, link)))
+                continue
+            splits.append((False, (vertex, weight, link)))
+            branches = sorted([(weights[next] + bounds[next], next)
+                               for next in tree[vertex]
+                               if rank[next] > rank[vertex]])
+            for (potential, next) in branches:
+                if weight + potential > incumbent[0]:
+                    stack.append((next, weight + weights[next],
+                                  (next, link), level + 1))
+        return splits
+
+    def gen_best_path_parallel(self, interpreter, by_assignment=False,
+                               depth=1, max_workers=None, ceiling=None):
+        """
+        gen_best_path with the branches searched on a process pool
+        The result is identical to gen_best_path's
+        :param interpreter: An Interpreter object
+        :param by_assignment: A Boolean whether to apply the interpreter's
+        assignment multipliers
+        :param depth: The number of appointment choices to split by
+        :param max_workers: The number of processes, os.cpu_count() if None
+        :param ceiling: An optional weight no path can beat, see search_stack
+        :return: None
+        """
+        tree = self.class_schedule_graph(interpreter)
+        weights = self.weight_vector(interpreter if by_assignment else None)
+        incumbent = self.check_incumbent(tree, weights, interpreter)
+        if ceiling is not None and incumbent[0] >= ceiling:
+            self.best_paths[interpreter] = incumbent
+            return
+        bounds, rank = self.calc_bounds(tree, weights)
+        splits = self.split_branches(tree, 0, weights, bounds, rank,
+                                     incumbent, depth)
+        futures = {}
+        if any([is_branch for (is_branch, entry) in splits]):
+            # The tree and its bounds go to each worker once, when the pool
+            # starts, rather than with every branch
+            shared = multiprocessing.Value('d', incumbent[0])
+            with ProcessPoolExecutor(
+                    max_workers, initializer=_init_search_process,
+                    initargs=(shared, dict(tree), dict(weights), bounds,
+                              rank, incumbent, ceiling)) as executor:
+                futures = {b: executor.submit(_search_branch, entry)
+                           for b, (is_branch, entry) in enumerate(splits)
+                           if is_branch}
+        # Keep the first best in serial search order, so ties resolve the
+        # same way they would in branch_and_bound
+        (max_weight, best_path) = incumbent
+        for b, (is_branch, entry) in enumerate(splits):
+            if is_branch:
+                (weight, path) = futures[b].result()
+            else:
+                (weight, path) = (entry[1], None)
+            if weight > max_weight:
+                (max_weight, best_path) = (weight, path or
+                                           self.unwind(entry[2]))
+        self.best_paths[interpreter] = (max_weight, best_path)
+
+    def check_incumbent(self, tree, weights, interpreter):
+        """
+        Reweigh interpreter's path in self.best_paths, dropping it if it no
+        longer follows the edges of tree, eg. an appt was assigned since
+        :param tree: A CompatibilityGraph or adjacency list keyed by idnum
+        :param weights: A dictionary of idnum: weight, see path_weights
+        :param interpreter: An Interpreter object
+        :return: A tuple of (weight, path)
+        """
+        (weight, path) = self.best_paths.get(interpreter, (0, []))
+        if not path or path[0] != 0:
+            return 0, []
+        for (vertex, next) in zip(path, path[1:]):
+            if vertex not in tree or next not in tree[vertex]:
+                return 0, []
+        return sum([weights[ID] for ID in path]), path
+
+    def warm_start(self, schedule):
+        """
+        Seed self.best_paths with the jobs each interpreter has in schedule,
+        eg. one made by Greedy, for branch_and_bound to start from
+        :param schedule: A Schedule object
+        :return: None
+        """
+        for interpreter in self.interpreters:
+            jobs = sorted([appt for appt in schedule.appts
+                           if appt.interpreter == interpreter])
+            if jobs:
+                self.best_paths[interpreter] = (
+                    sum([appt.priority for appt in jobs]),
+                    [0] + [appt.idnum for appt in jobs])
+
+    def gen_best_path(self, interpreter, by_assignment=False, ceiling=None):
+        """
+        Branch and bound for interpreter's max weight path through the
+        appts left to assign, it modifies self.best_paths
+        :param interpreter: An Interpreter object
+        :param by_assignment: A Boolean whether to apply the interpreter's
+        assignment multipliers
+        :param ceiling: An optional weight no path can beat, see search_stack
+        :return: None
+        """
+        tree = self.class_schedule_graph(interpreter)
+        weights = self.weight_vector(interpreter if by_assignment else None)
+        incumbent = self.check_incumbent(tree, weights, interpreter)
+        if ceiling is not None and incumbent[0] >= ceiling:
+            self.best_paths[interpreter] = incumbent
+            return
+        bounds, rank = self.calc_bounds(tree, weights)
+        self.best_paths[interpreter] = self.branch_and_bound(
+            tree, 0, weights, bounds, rank, incumbent, ceiling)
+
+    def class_ceiling(self, ceilings, interpreter, by_assignment=False):
+        """
+        Get the most interpreter's path can weigh, given what earlier
+        interpreters of the same class got. Interpreters are solved in turn
+        on what is left, so a later member of a class searches a subset of
+        an earlier member's tree with the same weights and can't do better.
+        Ordering the members this way breaks the symmetry between them
+        :param ceilings: A dictionary of class key: weight, kept by the caller
+        for one pass over the interpreters
+        :param interpreter: An Interpreter object
+        :param by_assignment: A Boolean whether the assignment multipliers
+        apply to the weights
+        :return: A weight, or None for the first interpreter of its class
+        """
+        return ceilings.get(self.interpreter_class_key(interpreter,
+                                                       by_assignment))
+
+    def update_class_ceiling(self, ceilings, interpreter, by_assignment=False):
+        """
+        Record interpreter's best path weight as its class's ceiling
+        :param ceilings: A dictionary of class key: weight, see class_ceiling
+        :param interpreter: An Interpreter object with a path in best_paths
+        :param by_assignment: A Boolean whether the assignment multipliers
+        apply to the weights
+        :return: None
+        """
+        ceilings[self.interpreter_class_key(interpreter, by_assignment)] = \
+            self.best_paths[interpreter][0]
+
+    @staticmethod
+    def gen_schedule_graph(interpreter, appts):
+        """
+        Build the adjacency sets of the appts that Interpreter can cover
+        :param interpreter: An Interpreter object
+        :param appts: A list of Appointment objects
+        :return: A CompatibilityGraph object
+        """
+        return CompatibilityGraph(interpreter, appts)
 
     def gen_schedule_dict(self, interpreter, appts):
         """
@@ -898,26 +1719,7 @@ class BruteForce(AvailabilityController):
         :param appts: A list of Appointment objects
         :return: None
         """
-        self.schedule_dict = {}
-        appts = copy.deepcopy(appts)
-        sched = Schedule(appts, [interpreter])
-        opt = Optimum(sched)
-        opt.reset()
-        opt_appts = opt.schedule.appts
-        opt.update_valid_choices(interpreter.shift_start, opt_appts)
-        temp_lst = [appt.idnum for appt in
-                    opt.valid_choices[interpreter]]
-        temp_lst.sort()
-        self.schedule_dict[0] = set(temp_lst)
-        for appt in opt.valid_choices[interpreter]:
-            opt.reset()
-            opt.assign(interpreter, appt)
-            appt.interpreter = ""
-            opt.update_valid_choices(appt.finish, opt_appts)
-            temp_lst = [appt.idnum for appt in
-                        opt.valid_choices[interpreter]]
-            temp_lst.sort()
-            self.schedule_dict[appt.idnum] = set(temp_lst)
+        self.schedule_dict = dict(self.gen_schedule_graph(interpreter, appts))
 
     @timer
     def gen_all_paths(self, tree_function, interpreter):
@@ -929,20 +1731,12 @@ class BruteForce(AvailabilityController):
         :return: None
         """
         list_of_paths = []
-        appts = list(self.appts_to_assign)
-        appt_ids = [appt.idnum for appt in appts]
-        sched = Schedule(appts, [interpreter])
-        opt = Optimum(sched)
-        opt.gen_schedule_dict(interpreter, appts)
-        tree = dict(opt.schedule_dict)
+        tree = self.class_schedule_graph(interpreter)
         nodes = [node for node in tree if node > 0]  # skip the root
         for node in nodes:
             # This lets gen_all_paths iteratively explore the tree,
             # visiting only nodes that are processed instead of all possible
-            node_idx = appt_ids.index(node)
-            appts_subset = appts[:node_idx + 1]
-            opt.gen_schedule_dict(interpreter, appts_subset)
-            subtree = dict(opt.schedule_dict)
+            subtree = tree.prefix(node)
             # To guard against index errors, tamp down endNode
             (startNode, endNode) = (min(subtree),
                                     min(node, max(subtree)))
@@ -954,8 +1748,6 @@ class BruteForce(AvailabilityController):
         for row in list_of_paths:
             for appt in row:
                 self.schedule_paths.append(appt)
-        if interpreter in opt.best_paths:
-            self.best_paths[interpreter] = opt.best_paths[interpreter]
 
     @timer
     def group_gen_all_paths(self, tree_function, interpreters, printing=False):
@@ -1000,6 +1792,77 @@ class BruteForce(AvailabilityController):
         return self.group_gen_all_paths(self.dfs_weighted_by_assignment,
                                         self.interpreters, printing)
 
+    @timer
+    def create_branch_and_bound_schedule(self, by_assignment=False,
+                                         warm_start=None, printing=False):
+        """
+        Use branch_and_bound to generate the optimal schedule
+        :param by_assignment: A Boolean whether to apply the interpreters'
+        assignment multipliers
+        :param warm_start: An optional Schedule object, eg. from Greedy, whose
+        assignments are the incumbents to beat
+        :param printing: A Boolean whether to print status messages
+        :return: A Schedule object
+        """
+        self.reset()
+        if warm_start is not None:
+            self.warm_start(warm_start)
+        if printing:
+            print(self.schedule.brief())
+        ceilings = {}
+        for interpreter in self.interpreters:
+            if printing:
+                print("Finding the optimal path for " + str(interpreter) +
+                      "...")
+            self.gen_best_path(interpreter, by_assignment,
+                               self.class_ceiling(ceilings, interpreter,
+                                                  by_assignment))
+            self.update_class_ceiling(ceilings, interpreter, by_assignment)
+            jobs = [self.appts_dict[ID] for ID in
+                    (self.best_paths[interpreter][1])
+                    if ID in self.appts_dict]
+            self.group_assign(interpreter, jobs)
+        return self.schedule.copy()
+
+    @timer
+    def create_parallel_branch_and_bound_schedule(self, by_assignment=False,
+                                                  warm_start=None, depth=1,
+                                                  max_workers=None,
+                                                  printing=False):
+        """
+        create_branch_and_bound_schedule with each interpreter's search tree
+        split by its first depth choices across a process pool
+        :param by_assignment: A Boolean whether to apply the interpreters'
+        assignment multipliers
+        :param warm_start: An optional Schedule object, eg. from Greedy, whose
+        assignments are the incumbents to beat
+        :param depth: The number of appointment choices to split by
+        :param max_workers: The number of processes, os.cpu_count() if None
+        :param printing: A Boolean whether to print status messages
+        :return: A Schedule object
+        """
+        self.reset()
+        if warm_start is not None:
+            self.warm_start(warm_start)
+        if printing:
+            print(self.schedule.brief())
+        ceilings = {}
+        for interpreter in self.interpreters:
+            if printing:
+                print("Finding the optimal path for " + str(interpreter) +
+                      "...")
+            self.gen_best_path_parallel(interpreter, by_assignment, depth,
+                                        max_workers,
+                                        self.class_ceiling(ceilings,
+                                                           interpreter,
+                                                           by_assignment))
+            self.update_class_ceiling(ceilings, interpreter, by_assignment)
+            jobs = [self.appts_dict[ID] for ID in
+                    (self.best_paths[interpreter][1])
+                    if ID in self.appts_dict]
+            self.group_assign(interpreter, jobs)
+        return self.schedule.copy()
+
 
 class BruteForceDP(AvailabilityController):
     """
@@ -1013,52 +1876,20 @@ class BruteForceDP(AvailabilityController):
         Initialize the BruteForceDP class
         :param schedule: A schedule object
         """
-        AvailabilityController.__init__(self, schedule)
+        super(BruteForceDP, self).__init__(schedule)
         self.interpreter_appts = []
+        self.p_key = None
+        self.p_cache = None
         self.schedule.appts.sort(key=attrgetter('finish'))
-        self.appts_to_assign = list([appt for appt in self.schedule.appts if
-                                     len(appt.interpreter) == 0])
+        self.appts_to_assign = AppointmentList(
+            [appt for appt in self.schedule.appts
+             if len(appt.interpreter) == 0])
         self.appt_weights = {}
-        self.orig_weights = {}
-        self._cache_original_weights()
         self._calc_weights()
 
     def _calc_weights(self):
         self.appt_weights = self.calculate_weights(self.schedule.appts)
 
-    def _cache_original_weights(self):
-        """
-        Store a copy of the original appt weights at self.__init__
-        :return: None
-        """
-        # self.orig_weights is where the object stores the original weights
-        for appt in self.schedule.appts:
-            self.orig_weights[appt.idnum] = appt.priority
-
-    def reset_weights(self):
-        """
-        Revert appointment weights to the original value at initialization
-        Assumes that weights have been pre-cached and modified prior to running
-        :return: None
-        """
-        for appt in self.schedule.appts:
-            appt.priority = self.orig_weights[appt.idnum]
-
-    def update_weights(self, interpreter):
-        """
-        Update the appointment weights based on the interpreter's assignment
-        :param interpreter: An Interpreter object
-        :return: None
-        """
-        wts_sum = sum([val for key, val in interpreter.assignments.items()])
-        # I want to avoid unnecessary processing when all weights *= 1
-        if wts_sum != len(interpreter.assignments):
-            for appt in self.schedule.appts:
-                loc = appt.location.building
-                if loc in interpreter.assignments.keys():
-                    weight_modifier = interpreter.assignments[loc]
-                    appt.priority *= weight_modifier
-
     @staticmethod
     def indexed_p(appt, appts):
         """
@@ -1076,6 +1907,43 @@ class BruteForceDP(AvailabilityController):
             p = p_idnum
         return p
 
+    @staticmethod
+    def calc_predecessors(appts):
+        """
+        Compute p(j) for every appointment in one pass of binary searches
+        :param appts: A list of Appointment objects sorted by finish time
+        :return: An array where p[j] is the 1-based position of the last appt
+        to finish by the time appts[j - 1] starts, or 0 if there is none
+        """
+        finish = [appt.finish.minutes for appt in appts]
+        p = array('l', [0]) * (len(appts) + 1)
+        for j, appt in enumerate(appts, 1):
+            p[j] = min(bisect.bisect_right(finish, appt.start.minutes), j - 1)
+        return p
+
+    def predecessors(self, appts):
+        """
+        Get p(j) for appts, only recomputing it when appts holds different
+        appointments, or the same ones in a different order or at different
+        times, than the last call
+        :param appts: A list of Appointment objects sorted by finish time
+        :return: An array of integer positions, see calc_predecessors
+        """
+        key = tuple([(appt.idnum, appt.start.minutes, appt.finish.minutes)
+                     for appt in appts])
+        if key != self.p_key:
+            self.p_cache = self.calc_predecessors(appts)
+            self.p_key = key
+        return self.p_cache
+
+    @property
+    def p(self):
+        """
+        The predecessor array of self.interpreter_appts
+        :return: An array of integer positions, see calc_predecessors
+        """
+        return self.predecessors(self.interpreter_appts)
+
     def calculate_weights(self, appts):
         """
         Create a dictionary of appt weights used in compute_optimal
@@ -1087,51 +1955,86 @@ class BruteForceDP(AvailabilityController):
         weights = dict()
         weights[0] = 0
         appts_to_calculate = sorted(appts, key=attrgetter('finish'))
-        for appt in appts_to_calculate:
-            idx = appts_to_calculate.index(appt) + 1
-            p = self.indexed_p(appt, appts_to_calculate)
-            weights[idx] = max(appt.priority + weights[p],
+        p = self.predecessors(appts_to_calculate)
+        for idx, appt in enumerate(appts_to_calculate, 1):
+            weights[idx] = max(appt.priority + weights[p[idx]],
                                weights[idx - 1])
         return weights
 
+    @staticmethod
+    def optimal_weights(appts, p, weights=None):
+        """
+        Fill the table of optimal weights bottom-up, without recursion
+        :param appts: A list of Appointment objects sorted by finish time
+        :param p: The predecessor array of appts, see calc_predecessors
+        :param weights: Optional weights of appts by 0-based position, to use
+        instead of their priorities
+        :return: An array where M[j] is the best total weight of appts[:j]
+        """
+        if weights is None:
+            weights = [appt.priority for appt in appts]
+        m = array('d', [0.0]) * (len(appts) + 1)
+        for j, weight in enumerate(weights, 1):
+            m[j] = max(weight + m[p[j]], m[j - 1])
+        return m
+
+    @staticmethod
+    def trace_optimal(j, appts, p, m, weights=None):
+        """
+        Walk the table of optimal weights back from j, collecting the
+        positions of the appts that make up the optimal solution
+        :param j: The 1-based position to start the traceback from
+        :param appts: A list of Appointment objects sorted by finish time
+        :param p: The predecessor array of appts, see calc_predecessors
+        :param m: The optimal weights of appts, indexed by position
+        :param weights: Optional weights of appts by 0-based position, the
+        same ones given to optimal_weights
+        :return: An array of 1-based positions in descending order
+        """
+        if weights is None:
+            weights = [appt.priority for appt in appts]
+        positions = array('l')
+        while j > 0:
+            if weights[j - 1] + m[p[j]] >= m[j - 1]:
+                positions.append(j)
+                j = p[j]
+            else:
+                j -= 1
+        return positions
+
     def compute_optimal(self, j, appts):
         """
-        Recursively visits nodes in a list and selects the most highly
-        weighted node at each edge, then proceeds from the optimal
-        node to the next optimal node, repeating until j==0
+        Visits nodes in a list and selects the most highly weighted node
+        at each edge, then proceeds from the optimal node to the next
+        optimal node, repeating until j==0
         :param j: the idnum of the interval
         :param appts: A list of Appointments
-        :return: A string
+        :return: A string of positions ending in 0, or 0 if j == 0
         """
         if j == 0:
             return 0
-        else:
-            appt = appts[j - 1]
-            v = appt.priority
-            p = self.indexed_p(appt, appts)
-            if (v + self.appt_weights[p]) >= self.appt_weights[j - 1]:
-                return str(j) + ", " + str(self.compute_optimal(p, appts))
-            else:
-                return self.compute_optimal(j - 1, appts)
+        positions = self.trace_optimal(j, appts, self.predecessors(appts),
+                                       self.appt_weights)
+        return ", ".join([str(idx) for idx in positions] + ["0"])
 
-    def gen_optimal(self, appts):
+    def gen_optimal(self, appts, weights=None):
         """
         Generates a list of the optimal appt choices for interpreter
-        :param appts: A list of Appointment objects
+        :param appts: A list of Appointment objects sorted by finish time
+        :param weights: An optional mapping of idnum: weight, eg. from
+        weight_vector, to use instead of the appt priorities
         :return: The optimal list of appts for interpreter to cover
         """
         if len(appts) < 1:
             raise ValueError("Interpreter unable to work any appointments.")
 
-        self.appt_weights = self.calculate_weights(appts)
-        optimal = self.compute_optimal(len(appts), appts)
-        if optimal == 0:
-            return []
-        appts_idx = [int(idx) for idx in optimal.split(sep=", ")]
-        appts_idx.sort()
-        appts_idx.pop(0)
-        appt_ids = [appts[idx - 1].idnum for idx in appts_idx]
-        return appt_ids
+        self.interpreter_appts = appts
+        if weights is not None:
+            weights = [weights[appt.idnum] for appt in appts]
+        p = self.predecessors(appts)
+        m = self.optimal_weights(appts, p, weights)
+        positions = self.trace_optimal(len(appts), appts, p, m, weights)
+        return [appts[idx - 1].idnum for idx in reversed(positions)]
 
     def create_cached_schedule(self, interpreter, appts):
         """
@@ -1143,9 +2046,7 @@ class BruteForceDP(AvailabilityController):
         """
         if len(appts) < 1:
             raise ValueError("No appointments to assign.")
-        self.update_weights(interpreter)
-        appt_ids = self.gen_optimal(appts)
-        self.reset_weights()
+        appt_ids = self.gen_optimal(appts, self.weight_vector(interpreter))
 
         if len(appt_ids) > 0:
             appts_to_assign = self.get_jobs_with_ids(appt_ids)
@@ -1174,7 +2075,874 @@ class BruteForceDP(AvailabilityController):
         return self.schedule.copy()
 
 
-class Optimum(BruteForce, BruteForceDP, Greedy, MonteCarlo):
+class ColumnGeneration(BruteForceDP):
+    """
+    Schedules the team as a set packing of routes, one per interpreter.
+    A restricted master LP picks among the routes found so far, and the
+    BruteForceDP algorithm, run on dual-adjusted weights, prices in better
+    routes.
+    Needs scipy for the LP, like IntegerProgram
+    """
+
+    def __init__(self, schedule):
+        """
+        Initialize the ColumnGeneration class
+        :param schedule: A Schedule object
+        """
+        super(ColumnGeneration, self).__init__(schedule)
+        self.classes = []
+        self.columns = []
+        self.column_keys = set()
+        self.cg_value = None
+        self.cg_bound = None
+
+    def gen_route_candidates(self, interpreters, appts):
+        """
+        Get the appts each interpreter can work, sorted by finish time,
+        along with their weights and predecessor arrays for pricing
+        :param interpreters: A list of Interpreter objects
+        :param appts: A list of Appointment objects
+        :return: A list of (appt indices, weights, p) tuples per interpreter
+        """
+        candidates = []
+        for interpreter in interpreters:
+            idx = [a for a, appt in enumerate(appts)
+                   if self.can_assign(interpreter, appt)]
+            idx.sort(key=lambda a: appts[a].finish)
+            vector = self.weight_vector(interpreter)
+            weights = [vector[appts[a].idnum] for a in idx]
+            p = self.calc_predecessors([appts[a] for a in idx])
+            candidates.append((idx, weights, p))
+        return candidates
+
+    def price_route(self, appts, candidates, duals):
+        """
+        Find an interpreter's most valuable route once each appt's weight
+        is reduced by its dual price
+        :param appts: A list of Appointment objects
+        :param candidates: One interpreter's tuple from gen_route_candidates
+        :param duals: A sequence of appt dual prices by appt index
+        :return: A tuple of (reduced value, appt indices in finish order)
+        """
+        (idx, weights, p) = candidates
+        route_appts = [appts[a] for a in idx]
+        reduced = [weight - duals[a] for a, weight in zip(idx, weights)]
+        m = self.optimal_weights(route_appts, p, reduced)
+        positions = self.trace_optimal(len(idx), route_appts, p, m, reduced)
+        return m[len(idx)], [idx[j - 1] for j in reversed(positions)]
+
+    def add_column(self, team_idx, route, candidates):
+        """
+        Add a route to self.columns unless it is empty or already there
+        :param team_idx: The index of the route's class in self.classes
+        :param route: A list of appt indices
+        :param candidates: The tuples from gen_route_candidates
+        :return: A Boolean whether the column was added
+        """
+        key = (team_idx, tuple(route))
+        if not route or key in self.column_keys:
+            return False
+        (idx, weights, p) = candidates[team_idx]
+        weight_of = dict(zip(idx, weights))
+        value = sum([weight_of[a] for a in route])
+        self.columns.append((team_idx, route, value))
+        self.column_keys.add(key)
+        return True
+
+    def build_master(self, n_appts):
+        """
+        Build the restricted master over self.columns: each appt is used by
+        at most one chosen route, and each class by at most as many routes
+        as it has interpreters
+        :param n_appts: The number of appts
+        :return: A tuple of (values, sparse matrix, row limits) with appt
+        rows first
+        """
+        rows = []
+        cols = []
+        for col, (c, route, value) in enumerate(self.columns):
+            rows.extend(route + [n_appts + c])
+            cols.extend([col] * (len(route) + 1))
+        values = np.asarray([value for (c, route, value) in self.columns])
+        limits = np.concatenate([np.ones(n_appts),
+                                 [len(team) for team in self.classes]])
+        matrix = coo_matrix((np.ones(len(rows)), (rows, cols)),
+                            shape=(len(limits), len(self.columns))).tocsr()
+        return values, matrix, limits
+
+    def solve_master(self, appts, candidates, max_iterations=100,
+                     printing=False):
+        """
+        Alternate between the master LP and pricing until no route has a
+        positive reduced value, tracking the Lagrangian bound as it goes.
+        Pricing runs once per class, not once per interpreter
+        :param appts: A list of Appointment objects
+        :param candidates: The tuples from gen_route_candidates, per class
+        :param max_iterations: The most rounds of pricing to run
+        :param printing: A Boolean whether to print status messages
+        :return: The LP solution, one value per column
+        """
+        n = len(appts)
+        solution = np.zeros(len(self.columns))
+        for iteration in range(max_iterations):
+            values, matrix, limits = self.build_master(n)
+            result = linprog(-values, A_ub=matrix, b_ub=limits,
+                             bounds=(0, None), method='highs')
+            if result.status != 0:
+                raise ValueError('Master LP found no solution: ' +
+                                 result.message)
+            solution = result.x
+            duals = -result.ineqlin.marginals
+            added = False
+            bound = -result.fun
+            for c, team in enumerate(self.classes):
+                (value, route) = self.price_route(appts, candidates[c],
+                                                  duals[:n])
+                # A better route improves on the class's dual price
+                reduced = value - duals[n + c]
+                if reduced > 1e-9:
+                    bound += len(team) * reduced
+                    added = self.add_column(c, route, candidates) or added
+            self.cg_bound = bound if self.cg_bound is None else \
+                min(self.cg_bound, bound)
+            if printing:
+                print('Iteration ' + str(iteration) + ': LP ' +
+                      str(-result.fun) + ', bound ' + str(self.cg_bound))
+            if not added:
+                break
+        return solution
+
+    def round_columns(self, solution):
+        """
+        Round the LP solution: take columns by descending LP value, skipping
+        any whose class is full or whose appts are already taken
+        :param solution: The LP solution, one value per column
+        :return: A list of column indices
+        """
+        chosen = []
+        used_appts = set()
+        used = collections.Counter()
+        order = sorted(range(len(self.columns)),
+                       key=lambda col: (-solution[col],
+                                        -self.columns[col][2]))
+        for col in order:
+            (c, route, value) = self.columns[col]
+            if used[c] >= len(self.classes[c]) or \
+                    used_appts.intersection(route):
+                continue
+            chosen.append(col)
+            used[c] += 1
+            used_appts.update(route)
+        return chosen
+
+    def branch_columns(self, n_appts, time_limit=60):
+        """
+        Solve the master as a 0/1 program over the columns generated,
+        a small price-and-branch step
+        :param n_appts: The number of appts
+        :param time_limit: The most seconds to let HiGHS run
+        :return: A list of column indices, empty if HiGHS found nothing
+        """
+        values, matrix, limits = self.build_master(n_appts)
+        result = milp(-values,
+                      constraints=[LinearConstraint(matrix, -np.inf, limits)],
+                      integrality=np.ones(len(values)), bounds=Bounds(0, 1),
+                      options={'time_limit': time_limit})
+        if result.x is None:
+            return []
+        return np.flatnonzero(result.x > 0.5).tolist()
+
+    def gen_column_optimal(self, interpreters, appts, max_iterations=100,
+                           time_limit=60, printing=False):
+        """
+        Generate routes for interpreters by column generation. Interpreters
+        who can stand in for each other (see interpreter_class_key) share
+        their columns, so the master has no symmetric copies of a schedule
+        :param interpreters: A list of Interpreter objects
+        :param appts: A list of Appointment objects
+        :param max_iterations: The most rounds of pricing to run
+        :param time_limit: The most seconds for the integer step
+        :param printing: A Boolean whether to print status messages
+        :return: A list of (interpreter index, appt indices) tuples
+        """
+        if linprog is None:
+            raise ImportError("ColumnGeneration needs scipy, "
+                              "try: pip install scipy")
+        self.columns = []
+        self.column_keys = set()
+        self.cg_bound = None
+        self.classes = self.gen_interpreter_classes(interpreters)
+        candidates = self.gen_route_candidates(
+            [team[0] for team in self.classes], appts)
+        no_duals = [0] * len(appts)
+        for c in range(len(self.classes)):
+            (value, route) = self.price_route(appts, candidates[c], no_duals)
+            self.add_column(c, route, candidates)
+        if not self.columns:
+            self.cg_value = self.cg_bound = 0
+            return []
+        solution = self.solve_master(appts, candidates, max_iterations,
+                                     printing)
+        chosen = max([self.round_columns(solution),
+                      self.branch_columns(len(appts), time_limit)],
+                     key=lambda cols: sum([self.columns[col][2]
+                                           for col in cols]))
+        self.cg_value = sum([self.columns[col][2] for col in chosen])
+        if printing:
+            print('Column generation: ' + str(self.cg_value) +
+                  ', bound: ' + str(self.cg_bound))
+        # Hand each class's routes out to its interpreters in turn
+        members = [iter(team) for team in self.classes]
+        index = {interpreter: i for i, interpreter in enumerate(interpreters)}
+        return [(index[next(members[self.columns[col][0]])],
+                 self.columns[col][1]) for col in sorted(chosen)]
+
+    @timer
+    def create_column_assignment(self, interpreters, max_iterations=100,
+                                 time_limit=60, printing=False):
+        """
+        Create a schedule for all interpreters at once by column generation
+        :param interpreters: A list of Interpreter objects
+        :param max_iterations: The most rounds of pricing to run
+        :param time_limit: The most seconds for the integer step
+        :param printing: A Boolean whether to print status messages
+        :return: A Schedule object
+        """
+        self.reset()
+        appts = list(self.appts_to_assign)
+        routes = self.gen_column_optimal(interpreters, appts, max_iterations,
+                                         time_limit, printing)
+        for (i, route) in routes:
+            self.group_assign(interpreters[i],
+                              sorted([appts[a] for a in route]))
+        return self.schedule.copy()
+
+
+class FlowNetwork(object):
+    """
+    A network of capacitated, costed edges between numbered nodes, solved
+    for a min cost flow by successive shortest paths. Edges are stored in
+    flat arrays, with each edge's residual twin at index ^ 1
+    """
+
+    def __init__(self, size):
+        """
+        Initialize the FlowNetwork class
+        :param size: The number of nodes
+        """
+        self.size = size
+        self.edges = [[] for _ in range(size)]
+        self.head = array('l')
+        self.cap = array('l')
+        self.cost = array('d')
+
+    def add_edge(self, node1, node2, cap, cost):
+        """
+        Add an edge and its residual twin to the network
+        :param node1: The node the edge leaves
+        :param node2: The node the edge enters
+        :param cap: An integer capacity
+        :param cost: The cost per unit of flow
+        :return: The edge's integer index
+        """
+        idx = len(self.head)
+        self.head.extend([node2, node1])
+        self.cap.extend([cap, 0])
+        self.cost.extend([cost, -cost])
+        self.edges[node1].append(idx)
+        self.edges[node2].append(idx + 1)
+        return idx
+
+    def flow(self, idx):
+        """
+        Get the flow sent along an edge
+        :param idx: An edge index returned by add_edge
+        :return: An integer amount of flow
+        """
+        return self.cap[idx ^ 1]
+
+    def topological_potentials(self, source):
+        """
+        Shortest path costs from source, assuming every edge leads from a
+        lower to a higher numbered node, so negative costs are allowed
+        :param source: The source node
+        :return: A list of costs, 0 for unreachable nodes
+        """
+        inf = float('inf')
+        dist = [inf] * self.size
+        dist[source] = 0
+        for node in range(source, self.size):
+            if dist[node] == inf:
+                continue
+            for idx in self.edges[node]:
+                if self.cap[idx] > 0:
+                    cost = dist[node] + self.cost[idx]
+                    if cost < dist[self.head[idx]]:
+                        dist[self.head[idx]] = cost
+        return [0 if cost == inf else cost for cost in dist]
+
+    def min_cost_flow(self, source, sink, max_flow):
+        """
+        Send up to max_flow from source to sink along successive shortest
+        paths, using Dijkstra on potential-reduced costs, and stop early
+        once another unit of flow would no longer lower the total cost
+        :param source: The source node
+        :param sink: The sink node
+        :param max_flow: The most flow to send
+        :return: A tuple of (flow sent, total cost)
+        """
+        inf = float('inf')
+        potentials = self.topological_potentials(source)
+        total_flow = 0
+        total_cost = 0
+        while total_flow < max_flow:
+            dist = [inf] * self.size
+            via = [-1] * self.size
+            dist[source] = 0
+            queue = [(0, source)]
+            while queue:
+                (cost, node) = heapq.heappop(queue)
+                if cost > dist[node]:
+                    continue
+                for idx in self.edges[node]:
+                    if self.cap[idx] == 0:
+                        continue
+                    head = self.head[idx]
+                    reduced = (cost + self.cost[idx] + potentials[node] -
+                               potentials[head])
+                    if reduced < dist[head]:
+                        dist[head] = reduced
+                        via[head] = idx
+                        heapq.heappush(queue, (reduced, head))
+            if dist[sink] == inf:
+                break
+            for node in range(self.size):
+                if dist[node] < inf:
+                    potentials[node] += dist[node]
+            path_cost = potentials[sink] - potentials[source]
+            if path_cost >= 0:
+                break
+            amount = max_flow - total_flow
+            node = sink
+            while node != source:
+                amount = min(amount, self.cap[via[node]])
+                node = self.head[via[node] ^ 1]
+            node = sink
+            while node != source:
+                self.cap[via[node]] -= amount
+                self.cap[via[node] ^ 1] += amount
+                node = self.head[via[node] ^ 1]
+            total_flow += amount
+            total_cost += amount * path_cost
+        return total_flow, total_cost
+
+
+class TeamFlow(AvailabilityController):
+    """
+    Schedules a team of interchangeable interpreters at once, as weighted
+    k-track interval scheduling solved by min cost flow. Interpreters who
+    speak the same languages and work the same shift form a class, and
+    each class is scheduled optimally as a whole. An appt that starts when
+    it finishes has no edge in the network, so TeamFlow never assigns it
+    and it is left open for another scheduler
+    """
+
+    def __init__(self, schedule):
+        """
+        Initialize the TeamFlow class
+        :param schedule: A Schedule object
+        """
+        super(TeamFlow, self).__init__(schedule)
+
+    @staticmethod
+    def build_network(appts, k):
+        """
+        Build the time-expanded network for appts: one node per distinct
+        start or finish time, a free edge with capacity k from each time to
+        the next, and an edge with capacity 1 costing -priority from each
+        appt's start to its finish. Zero length appts would be an edge from
+        a time to itself, so they are left out and never assigned
+        :param appts: A list of Appointment objects
+        :param k: The number of interpreters
+        :return: A tuple of (network, edges) where edges maps each edge index
+        to the appt it represents
+        """
+        appts = [appt for appt in appts if appt.start < appt.finish]
+        times = sorted({appt.start.minutes for appt in appts} |
+                       {appt.finish.minutes for appt in appts})
+        nodes = {time: idx for idx, time in enumerate(times)}
+        network = FlowNetwork(max(len(times), 1))
+        for idx in range(len(times) - 1):
+            network.add_edge(idx, idx + 1, k, 0)
+        edges = {}
+        for appt in appts:
+            idx = network.add_edge(nodes[appt.start.minutes],
+                                   nodes[appt.finish.minutes], 1,
+                                   -appt.priority)
+            edges[idx] = appt
+        return network, edges
+
+    @staticmethod
+    def decompose(network, edges, flow):
+        """
+        Split the flow into one path per unit, each a list of the appts on
+        it in time order
+        :param network: A solved FlowNetwork, see build_network
+        :param edges: A dictionary of edge index: Appointment
+        :param flow: The amount of flow sent
+        :return: A list of lists of Appointment objects
+        """
+        remaining = {}
+        for idx in range(0, len(network.head), 2):
+            if network.flow(idx) > 0:
+                remaining[idx] = network.flow(idx)
+        paths = []
+        for _ in range(flow):
+            node = 0
+            path = []
+            while node < network.size - 1:
+                # Follow appt edges first, then the free edge to the next time
+                out = [idx for idx in network.edges[node]
+                       if remaining.get(idx, 0) > 0]
+                out.sort(key=lambda idx: idx not in edges)
+                idx = out[0]
+                remaining[idx] -= 1
+                if idx in edges:
+                    path.append(edges[idx])
+                node = network.head[idx]
+            paths.append(path)
+        return paths
+
+    def gen_team_optimal(self, interpreters, appts):
+        """
+        Generate the optimal appts for a class of interchangeable interpreters
+        :param interpreters: A list of Interpreter objects of one class
+        :param appts: A list of Appointment objects
+        :return: A list of appt idnum lists, one per interpreter
+        """
+        candidates = [appt for appt in appts
+                      if self.can_assign(interpreters[0], appt)]
+        network, edges = self.build_network(candidates, len(interpreters))
+        flow, cost = network.min_cost_flow(0, network.size - 1,
+                                           len(interpreters))
+        paths = self.decompose(network, edges, flow)
+        paths += [[] for _ in range(len(interpreters) - len(paths))]
+        return [[appt.idnum for appt in path] for path in paths]
+
+    def create_team_schedule(self, interpreters, appts):
+        """
+        Assigns a class of interchangeable interpreters to appts optimally
+        :param interpreters: A list of Interpreter objects of one class
+        :param appts: A list of Appointment objects
+        :return: None
+        """
+        appt_ids = self.gen_team_optimal(interpreters, appts)
+        for interpreter, ids in zip(interpreters, appt_ids):
+            if len(ids) > 0:
+                self.group_assign(interpreter, self.get_jobs_with_ids(ids))
+
+    @timer
+    def create_flow_assignment(self, interpreters):
+        """
+        Create a schedule for each class of interpreters using min cost flow.
+        Zero length appts are skipped, see build_network
+        :param interpreters: A list of Interpreter objects
+        :return: A Schedule object
+        """
+        self.reset()
+        # The network weighs appts by priority alone, so assignments
+        # multipliers don't split a class
+        for team in self.gen_interpreter_classes(interpreters, False):
+            self.create_team_schedule(team, list(self.appts_to_assign))
+        return self.schedule.copy()
+
+
+class IntegerProgram(AvailabilityController):
+    """
+    Formulates the whole day as a 0/1 program with one variable per
+    (interpreter, appt) pair that can_assign allows, and solves it with
+    scipy's HiGHS MILP solver when scipy is installed
+    """
+
+    def __init__(self, schedule):
+        """
+        Initialize the IntegerProgram class
+        :param schedule: A Schedule object
+        """
+        super(IntegerProgram, self).__init__(schedule)
+        self.mip_gap = None
+        self.mip_bound = None
+
+    def gen_variables(self, interpreters, appts):
+        """
+        List the (interpreter, appt) pairs worth a variable
+        :param interpreters: A list of Interpreter objects
+        :param appts: A list of Appointment objects
+        :return: A tuple of (interpreter indices, appt indices, weights)
+        """
+        index = {appt.idnum: a for a, appt in enumerate(appts)}
+        is_open = [appt in self.appts_to_assign for appt in appts]
+        columns = self.schedule.columns
+        classes = {}
+        var_interpreters = []
+        var_appts = []
+        weights = []
+        for i, interpreter in enumerate(interpreters):
+            key = self.interpreter_class_key(interpreter)
+            if key not in classes:
+                # One select on the columns covers the whole class
+                rows = columns.in_shift(interpreter)
+                feasible = sorted([index[columns.appts[row].idnum]
+                                   for row in rows
+                                   if columns.appts[row].idnum in index])
+                feasible = [a for a in feasible if is_open[a]]
+                vector = self.weight_vector(interpreter)
+                fresh = [a for a in feasible
+                         if appts[a].is_compatible(self.default_appt)]
+                classes[key] = (feasible, vector, fresh,
+                                [vector[appts[a].idnum] for a in fresh])
+            (feasible, vector, fresh, fresh_weights) = classes[key]
+            last_job = self.get_last_job(interpreter)
+            if last_job != self.default_appt:
+                choices = [a for a in feasible
+                           if self.can_assign(interpreter, appts[a], last_job)]
+                choice_weights = [vector[appts[a].idnum] for a in choices]
+            elif interpreter.is_compatible(last_job.patient):
+                (choices, choice_weights) = (fresh, fresh_weights)
+            else:
+                (choices, choice_weights) = ([], [])
+            var_interpreters.extend([i] * len(choices))
+            var_appts.extend(choices)
+            weights.extend(choice_weights)
+        return var_interpreters, var_appts, weights
+
+    @staticmethod
+    def gen_cliques(appts):
+        """
+        Find the maximal sets of mutually overlapping appts by sweeping
+        their start and finish times. A set is complete just before a
+        finish that follows a start
+        :param appts: A list of Appointment objects
+        :return: A list of lists of appt indices, each with 2 or more
+        """
+        # finishes sort first, back to back appts don't overlap
+        events = sorted([(appt.start.minutes, 1, a)
+                         for a, appt in enumerate(appts)] +
+                        [(appt.finish.minutes, 0, a)
+                         for a, appt in enumerate(appts)])
+        cliques = []
+        active = set()
+        growing = False
+        for (time, is_start, a) in events:
+            if is_start:
+                active.add(a)
+                growing = True
+            else:
+                if growing and len(active) > 1:
+                    cliques.append(sorted(active))
+                active.discard(a)
+                growing = False
+        return cliques
+
+    def gen_conflicts(self, appts):
+        """
+        Find the pairs of appts that don't overlap, but are too close
+        together for staff to make it from one to the other in time,
+        checking every pair within the longest commute at once
+        :param appts: A list of Appointment objects
+        :return: A tuple of (earlier, later) arrays of appt indices
+        """
+        travel = self.schedule.travel
+        start = np.asarray([appt.start.minutes for appt in appts],
+                           dtype=np.int64)
+        finish = np.asarray([appt.finish.minutes for appt in appts],
+                            dtype=np.int64)
+        late = np.asarray([appt.late_allowed for appt in appts],
+                          dtype=np.int64)
+        order = np.argsort(start, kind='stable')
+        lo = np.searchsorted(start[order], finish, side='left')
+        hi = np.searchsorted(start[order], finish +
+                             self.calc_max_commute(appts), side='left')
+        counts = np.maximum(hi - lo, 0)
+        earlier = np.repeat(np.arange(len(appts)), counts)
+        steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) -
+                                                    counts, counts)
+        later = order[np.repeat(lo, counts) + steps]
+        index = [travel.index_of(appt.location) for appt in appts]
+        if None in index:
+            commute = np.asarray([travel.commute(appts[a].location,
+                                                 appts[b].location)
+                                  for (a, b) in zip(earlier, later)],
+                                 dtype=np.int64)
+        else:
+            index = np.asarray(index, dtype=np.int64)
+            commute = np.asarray(travel.minutes, dtype=np.int64)[
+                index[earlier] * travel.size + index[later]]
+        # The same test as can_reach, in minutes
+        conflict = finish[earlier] + commute > start[later] + late[later]
+        return earlier[conflict], later[conflict]
+
+    def build_program(self, interpreters, appts):
+        """
+        Build the constraint matrix: each appt is covered at most once, and
+        no interpreter takes two appts of a clique or of a conflicting pair
+        :param interpreters: A list of Interpreter objects
+        :param appts: A list of Appointment objects, none of zero length
+        :return: A tuple of (weights, matrix, var_interpreters, var_appts)
+        where each row of the sparse matrix sums to at most 1
+        """
+        var_interpreters, var_appts, weights = self.gen_variables(
+            interpreters, appts)
+        var_interpreters = np.asarray(var_interpreters, dtype=np.int64)
+        var_appts = np.asarray(var_appts, dtype=np.int64)
+        n_vars = len(var_appts)
+        cliques = self.gen_cliques(appts)
+        (earlier, later) = self.gen_conflicts(appts)
+        sizes = np.concatenate([
+            np.asarray([len(clique) for clique in cliques], dtype=np.int64),
+            np.full(len(earlier), 2, dtype=np.int64)])
+        members = np.concatenate([
+            np.asarray([a for clique in cliques for a in clique],
+                       dtype=np.int64),
+            np.column_stack([earlier, later]).ravel()])
+        # Which appts belong to each clique or pair, one row per group
+        incidence = csc_matrix((np.ones(len(members)),
+                                (np.repeat(np.arange(len(sizes)), sizes),
+                                 members)),
+                               shape=(len(sizes), len(appts)))
+        rows = [var_appts]
+        cols = [np.arange(n_vars)]
+        offset = len(appts)
+        # Interpreters of a class have the same variables, so they share
+        # one block of clique and conflict rows, shifted to their columns
+        bounds = np.searchsorted(var_interpreters,
+                                 np.arange(len(interpreters) + 1))
+        blocks = {}
+        for (first, last) in zip(bounds[:-1], bounds[1:]):
+            choices = var_appts[first:last]
+            key = choices.tobytes()
+            if key not in blocks:
+                block = incidence[:, choices].tocoo()
+                blocks[key] = (block.row, block.col)
+            (block_rows, block_cols) = blocks[key]
+            rows.append(block_rows + offset)
+            cols.append(block_cols + first)
+            offset += len(sizes)
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        # Only keep rows that constrain two or more variables
+        counts = np.bincount(rows, minlength=offset)
+        keep = counts[rows] > 1
+        renumber = np.cumsum(counts > 1) - 1
+        rows = renumber[rows[keep]]
+        cols = cols[keep]
+        matrix = coo_matrix((np.ones(len(rows)), (rows, cols)),
+                            shape=(int(np.sum(counts > 1)), n_vars)).tocsr()
+        return (np.asarray(weights, dtype=float), matrix, var_interpreters,
+                var_appts)
+
+    def solve_program(self, interpreters, appts, time_limit=60,
+                      mip_rel_gap=1e-4, printing=False):
+        """
+        Solve the 0/1 program with scipy.optimize.milp, keeping the gap
+        and bound it reports in self.mip_gap and self.mip_bound
+        :param interpreters: A list of Interpreter objects
+        :param appts: A list of Appointment objects, none of zero length
+        :param time_limit: The most seconds to let HiGHS run
+        :param mip_rel_gap: The relative gap at which HiGHS stops
+        :param printing: A Boolean whether to print solver messages
+        :return: A list of (interpreter index, appt index) tuples to assign
+        """
+        if milp is None:
+            raise ImportError("IntegerProgram needs scipy, "
+                              "try: pip install scipy")
+        weights, matrix, var_interpreters, var_appts = self.build_program(
+            interpreters, appts)
+        if len(weights) == 0:
+            self.mip_gap = 0
+            self.mip_bound = 0
+            return []
+        constraints = [LinearConstraint(matrix, -np.inf, 1)] \
+            if matrix.shape[0] > 0 else []
+        result = milp(-weights, constraints=constraints,
+                      integrality=np.ones(len(weights)),
+                      bounds=Bounds(0, 1),
+                      options={'time_limit': time_limit,
+                               'mip_rel_gap': mip_rel_gap,
+                               'disp': printing})
+        if result.x is None:
+            raise ValueError('MILP found no solution: ' + result.message)
+        self.mip_gap = getattr(result, 'mip_gap', None)
+        self.mip_bound = -getattr(result, 'mip_dual_bound', result.fun)
+        if printing:
+            print('MILP objective: ' + str(-result.fun) + ', bound: ' +
+                  str(self.mip_bound) + ', gap: ' + str(self.mip_gap))
+        chosen = np.flatnonzero(result.x > 0.5)
+        return list(zip(var_interpreters[chosen].tolist(),
+                        var_appts[chosen].tolist()))
+
+    @timer
+    def create_milp_assignment(self, interpreters, time_limit=60,
+                               mip_rel_gap=1e-4, printing=False):
+        """
+        Create a schedule for all interpreters at once by solving the MILP
+        :param interpreters: A list of Interpreter objects
+        :param time_limit: The most seconds to let HiGHS run
+        :param mip_rel_gap: The relative gap at which HiGHS stops
+        :param printing: A Boolean whether to print solver messages
+        :return: A Schedule object
+        """
+        self.reset()
+        appts = [appt for appt in self.appts_to_assign
+                 if appt.start < appt.finish]
+        chosen = self.solve_program(interpreters, appts, time_limit,
+                                    mip_rel_gap, printing)
+        jobs = collections.defaultdict(list)
+        for (i, a) in chosen:
+            jobs[i].append(appts[a])
+        for i in sorted(jobs):
+            self.group_assign(interpreters[i], sorted(jobs[i]))
+        return self.schedule.copy()
+
+
+class TravelDP(AvailabilityController):
+    """
+    Solves each interpreter's schedule exactly as the longest path through
+    a DAG of appointments, where an edge means staff can finish one
+    appointment and still reach the next in time, commute included
+    """
+
+    def __init__(self, schedule):
+        """
+        Initialize the TravelDP class
+        :param schedule: A Schedule object
+        """
+        super(TravelDP, self).__init__(schedule)
+
+    def travel_candidates(self, interpreter, appts):
+        """
+        Get the appts interpreter can work after his/her last job
+        :param interpreter: An Interpreter object
+        :param appts: A list of Appointment objects
+        :return: A list of Appointment objects sorted by start time
+        """
+        last_job = self.get_last_job(interpreter)
+        candidates = [appt for appt in appts
+                      if self.can_assign(interpreter, appt)]
+        if last_job != self.default_appt:
+            candidates = [appt for appt in candidates
+                          if self.can_reach(last_job, appt)]
+        candidates.sort(key=attrgetter('start', 'finish'))
+        return candidates
+
+    def gen_dag(self, appts):
+        """
+        Build sparse successor lists for appts. Once an appt starts at least
+        the longest commute after another finishes, it and every later appt
+        are reachable, so only edges inside that window are stored
+        :param appts: A list of Appointment objects sorted by start time
+        :return: A tuple of (successors, tails): successors[i] is an array of
+        the positions reachable from appts[i] inside the window, and tails[i]
+        is the first position from which every appt is reachable
+        """
+        commute = self.schedule.travel.commute
+        starts = [appt.start.minutes for appt in appts]
+        max_commute = self.calc_max_commute(appts)
+        successors = []
+        tails = array('l', [0]) * len(appts)
+        for i, appt in enumerate(appts):
+            finish = appt.finish.minutes
+            lo = max(bisect.bisect_left(starts, finish), i + 1)
+            hi = max(bisect.bisect_left(starts, finish + max_commute), lo)
+            # calc_arrival in minutes: finishing appt plus the commute
+            successors.append(array('l', [
+                j for j in range(lo, hi)
+                if finish + commute(appt.location, appts[j].location) <=
+                starts[j] + appts[j].late_allowed]))
+            tails[i] = hi
+        return successors, tails
+
+    @staticmethod
+    def longest_path(weights, successors, tails):
+        """
+        Find the max weight path through the DAG by DP in reverse
+        topological (start time) order
+        :param weights: A list of appt weights, indexed by position
+        :param successors: Successor arrays, see gen_dag
+        :param tails: Fully reachable suffix positions, see gen_dag
+        :return: A list of positions along the path, in start order
+        """
+        n = len(weights)
+        best = array('d', [0.0]) * n
+        after = array('l', [-1]) * n
+        # suffix_best[k] is the best path starting at any position >= k
+        suffix_best = array('d', [0.0]) * (n + 1)
+        suffix_arg = array('l', [-1]) * (n + 1)
+        for i in range(n - 1, -1, -1):
+            next_weight = suffix_best[tails[i]]
+            next_idx = suffix_arg[tails[i]]
+            for j in successors[i]:
+                if best[j] > next_weight:
+                    next_weight = best[j]
+                    next_idx = j
+            best[i] = weights[i] + next_weight
+            after[i] = next_idx
+            if best[i] >= suffix_best[i + 1]:
+                suffix_best[i] = best[i]
+                suffix_arg[i] = i
+            else:
+                suffix_best[i] = suffix_best[i + 1]
+                suffix_arg[i] = suffix_arg[i + 1]
+        path = []
+        i = suffix_arg[0] if n > 0 and suffix_best[0] > 0 else -1
+        while i >= 0:
+            path.append(i)
+            i = after[i]
+        return path
+
+    def gen_travel_optimal(self, interpreter, appts):
+        """
+        Generates a list of the optimal appt choices for interpreter,
+        accounting for commutes and interpreter's assignment multipliers
+        :param interpreter: An Interpreter object
+        :param appts: A list of Appointment objects
+        :return: The optimal list of appt idnums for interpreter to cover
+        """
+        candidates = self.travel_candidates(interpreter, appts)
+        vector = self.weight_vector(interpreter)
+        weights = [vector[appt.idnum] for appt in candidates]
+        successors, tails = self.gen_dag(candidates)
+        path = self.longest_path(weights, successors, tails)
+        return [candidates[idx].idnum for idx in path]
+
+    def create_travel_schedule(self, interpreter, appts):
+        """
+        Assigns interpreter to the optimal commute-aware path through appts
+        :param interpreter: An Interpreter object
+        :param appts: A list of Appointment objects
+        :return: None
+        """
+        appt_ids = self.gen_travel_optimal(interpreter, appts)
+        if len(appt_ids) > 0:
+            appts_to_assign = self.get_jobs_with_ids(appt_ids)
+            self.group_assign(interpreter, appts_to_assign)
+
+    @timer
+    def create_travel_assignment(self, interpreters):
+        """
+        Create a schedule for each interpreter using the travel-aware DAG
+        :param interpreters: A list of Interpreter objects
+        :return: A Schedule object
+        """
+        self.reset()
+        for interpreter in interpreters:
+            self.create_travel_schedule(interpreter,
+                                        list(self.appts_to_assign))
+        return self.schedule.copy()
+
+
+class Optimum(BruteForce, ColumnGeneration, BruteForceDP, TeamFlow,
+              IntegerProgram, TravelDP, Greedy, MonteCarlo):
     """
     Compares the performance of scheduling algorithms
     """
@@ -1184,10 +2952,7 @@ class Optimum(BruteForce, BruteForceDP, Greedy, MonteCarlo):
         Initialize the Optimum class
         :param schedule: A Schedule object
         """
-        BruteForce.__init__(self, schedule)
-        BruteForceDP.__init__(self, schedule)
-        Greedy.__init__(self, schedule)
-        MonteCarlo.__init__(self, schedule)
+        super(Optimum, self).__init__(schedule)
         self.default_time = Time("6:00", TIME_FORMAT)
         self.default_trials = 100
         self.max_repeated_result = max(self.default_trials // 4, 1)
@@ -1197,7 +2962,13 @@ class Optimum(BruteForce, BruteForceDP, Greedy, MonteCarlo):
                                  self.create_balanced_greedy_schedule,
                                  self.create_bruteforce_schedule,
                                  self.create_bruteforce_assignment,
-                                 self.create_cached_assignment]
+                                 self.create_branch_and_bound_schedule,
+                                 self.create_cached_assignment,
+                                 self.create_flow_assignment,
+                                 self.create_travel_assignment]
+        if milp is not None:
+            self.schedule_methods.append(self.create_milp_assignment)
+            self.schedule_methods.append(self.create_column_assignment)
 
     def call_method_default(self, method, printing=False):
         """
@@ -1217,7 +2988,13 @@ class Optimum(BruteForce, BruteForceDP, Greedy, MonteCarlo):
                                                        optimal, printing],
                 self.create_bruteforce_schedule: [printing],
                 self.create_bruteforce_assignment: [printing],
-                self.create_cached_assignment: [self.interpreters]}
+                self.create_branch_and_bound_schedule: [False, None,
+                                                        printing],
+                self.create_cached_assignment: [self.interpreters],
+                self.create_flow_assignment: [self.interpreters],
+                self.create_travel_assignment: [self.interpreters],
+                self.create_milp_assignment: [self.interpreters],
+                self.create_column_assignment: [self.interpreters]}
         if method in args.keys():
             lst = args[method]
             return method(*lst)
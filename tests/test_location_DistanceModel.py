@@ -0,0 +1,103 @@
+from location import (
+    Location,
+    DistanceModel,
+    EuclideanDistance,
+    ManhattanDistance,
+    CorridorGraph,
+    TravelMatrix
+)
+import os
+import tempfile
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the location.DistanceModel subclasses
+    """
+    def setUp(self):
+        self.loc1 = Location(0, 0, "Building 1", "Radiology")
+        self.loc2 = Location(3, 4, "Building 2", "Oncology")
+        self.loc3 = Location(6, 8, "Building 3", "Obstetrics")
+        self.loc4 = Location(0, 1, "Building 1", "Pulmonary")
+        self.corridors = {("Building 1", "Building 2"): 20,
+                          ("Building 3", "Building 2"): 15,
+                          ("Building 1", "Building 3"): 50}
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test(self):
+        # DistanceModel is abstract, subclasses must define distance
+        with self.assertRaises(TypeError):
+            DistanceModel()
+
+        class NoDistance(DistanceModel):
+            pass
+        with self.assertRaises(TypeError):
+            NoDistance()
+
+        # EuclideanDistance
+        self.assertEqual(5, EuclideanDistance().distance(self.loc1, self.loc2))
+
+        # ManhattanDistance
+        self.assertEqual(7, ManhattanDistance().distance(self.loc1, self.loc2))
+
+        # CorridorGraph shortest_paths, Building 1 -> 3 goes through 2
+        graph = CorridorGraph(self.corridors, self.cache_dir.name)
+        self.assertEqual(["Building 1", "Building 2", "Building 3"],
+                         graph.buildings)
+        self.assertEqual(20, graph.distance(self.loc1, self.loc2))
+        self.assertEqual(35, graph.distance(self.loc1, self.loc3))
+        self.assertEqual(35, graph.distance(self.loc3, self.loc1))
+
+        # the same building uses straight-line distance
+        self.assertEqual(1, graph.distance(self.loc1, self.loc4))
+
+        # the paths are cached on disk under the graph hash
+        cache_file = os.path.join(self.cache_dir.name,
+                                  graph.graph_hash + '.json')
+        self.assertTrue(os.path.exists(cache_file))
+        reloaded = CorridorGraph(dict(self.corridors), self.cache_dir.name)
+        self.assertEqual(graph.key, reloaded.key)
+        self.assertEqual(graph.paths, reloaded.paths)
+
+        # unconnected buildings cannot be reached
+        split = CorridorGraph({("Building 1", "Building 2"): 20,
+                               ("Building 3", "Building 4"): 10}, None)
+        with self.assertRaises(ValueError):
+            split.distance(self.loc1, self.loc3)
+
+        # TravelMatrix with a distance model
+        matrix = TravelMatrix([self.loc1, self.loc2, self.loc3], 1.0, graph)
+        self.assertEqual(35, matrix.commute(self.loc1, self.loc3))
+        self.assertEqual(20, matrix.commute(self.loc2, self.loc1))
+
+        # models are keyed by class and parameters, so TravelMatrix.build
+        # only shares a matrix between models that measure the same way
+        class ScaledDistance(DistanceModel):
+            def __init__(self, scale):
+                self.scale = scale
+
+            def distance(self, location1, location2):
+                return self.scale * location1.distance_from(location2)
+
+        self.assertNotEqual(EuclideanDistance().key,
+                            ManhattanDistance().key)
+        self.assertEqual(EuclideanDistance().key, EuclideanDistance().key)
+        self.assertNotEqual(ScaledDistance(1).key, ScaledDistance(2).key)
+        self.assertEqual(ScaledDistance(2).key, ScaledDistance(2).key)
+        locations = [self.loc1, self.loc2]
+        single = TravelMatrix.build(locations, 1.0, ScaledDistance(1))
+        double = TravelMatrix.build(locations, 1.0, ScaledDistance(2))
+        self.assertEqual(5, single.commute(self.loc1, self.loc2))
+        self.assertEqual(10, double.commute(self.loc1, self.loc2))
+        self.assertIs(double,
+                      TravelMatrix.build(locations, 1.0, ScaledDistance(2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
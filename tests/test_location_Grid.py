@@ -3,6 +3,12 @@ from location import (
     Grid
 )
 from person import Person
+from tests.objects import (
+    appt1,
+    appt2,
+    appt3
+)
+from utils import Time
 import unittest
 import sys
 sys.path.append('..')
@@ -37,6 +43,38 @@ class TestClass(unittest.TestCase):
         self.assertEquals(self.class_instance.get_loc(person).x, 0)
         self.assertEquals(self.class_instance.get_loc(person).y, 0)
 
+        # index_appts method
+        grid = Grid(cell_size=2)
+        grid.index_appts([appt1, appt2, appt3])
+        self.assertEqual(3, grid.appt_count)
+        self.assertEqual(grid.get_cell(appt1.location), (1, 2))
+
+        # nearest_appt method
+        # appt1 (08:00) is 5 away from the origin, appt2 (08:25) is at it
+        # and appt3 (08:45) is 5.66 away, so when free at 07:00 appt1 is
+        # reached first, and when free at 08:22 appt2 is reached first
+        def commute(loc1, loc2):
+            return int(loc1.distance_from(loc2))
+        origin = Point(0, 0)
+        early = Time("07:00", "%H:%M")
+        later = Time("08:22", "%H:%M")
+        self.assertIs(appt1, grid.nearest_appt(origin, early, early,
+                                               commute, 1.0))
+        self.assertIs(appt2, grid.nearest_appt(origin, later, later,
+                                               commute, 1.0))
+        self.assertIs(appt3, grid.nearest_appt(origin, later, later,
+                                               commute, None,
+                                               lambda appt: appt is appt3))
+
+        # remove_appt method
+        grid.remove_appt(appt2)
+        self.assertEqual(2, grid.appt_count)
+        self.assertIs(appt3, grid.nearest_appt(origin, later, later,
+                                               commute, 1.0))
+        grid.remove_appt(appt3)
+        self.assertIsNone(grid.nearest_appt(origin, later, later,
+                                            commute, 1.0))
+
 
 if __name__ == '__main__':
     unittest.main()
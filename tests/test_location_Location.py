@@ -1,4 +1,7 @@
-from location import Location
+from location import (
+    Point,
+    Location
+)
 import unittest
 import sys
 sys.path.append('..')
@@ -18,6 +21,12 @@ class TestClass(unittest.TestCase):
         # str method
         self.assertTrue(str((self.loc.building,  self.loc.clinic)),
                         str(self.loc))
+        # interning and equality
+        self.assertIs(Location(1,  1,  "Hospital",  "Clinic"),  self.loc)
+        self.assertNotEqual(Location(1,  1,  "Hospital",  "Lab"),  self.loc)
+        self.assertNotEqual(Point(1,  1),  self.loc)
+        self.assertEqual(len({self.loc,  Location(1,  1,  "Hospital",
+                                                  "Clinic")}),  1)
 
 
 if __name__ == '__main__':
@@ -1,4 +1,6 @@
 from location import Point
+import copy
+import pickle
 import unittest
 import sys
 sys.path.append('..')
@@ -35,6 +37,20 @@ class TestClass(unittest.TestCase):
         string_repr = str(point2)
         self.assertEqual(str((4,  5)),  string_repr)
 
+        # interning, equal coordinates share one instance
+        self.assertIs(Point(4,  5),  point2)
+        self.assertIs(copy.deepcopy(point2),  point2)
+        self.assertIs(pickle.loads(pickle.dumps(point2)),  point2)
+
+        # hash method
+        self.assertEqual(hash(Point(4,  5)),  hash(point2))
+        self.assertEqual({point2: 1}[Point(4,  5)],  1)
+
+        # immutability
+        with self.assertRaises(AttributeError):
+            point2.x = 0
+        self.assertEqual(4,  point2.x)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+from location import (
+    Point,
+    Location,
+    TravelMatrix
+)
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the location.TravelMatrix class
+    """
+    def setUp(self):
+        self.loc1 = Location(0, 0, "Central Hospital", "Radiology")
+        self.loc2 = Location(3, 4, "East Wing", "Emergency Room")
+        self.loc3 = Location(3, 4, "East Wing", "General Med")
+        self.matrix = TravelMatrix([self.loc1, self.loc2, self.loc3], 1.0)
+
+    def test(self):
+        # index_of method, duplicate coordinates share one index
+        self.assertEqual(2, self.matrix.size)
+        self.assertEqual(0, self.matrix.index_of(self.loc1))
+        self.assertEqual(1, self.matrix.index_of(self.loc3))
+        self.assertIsNone(self.matrix.index_of(Point(9, 9)))
+
+        # commute method
+        self.assertEqual(5, self.matrix.commute(self.loc1, self.loc2))
+        self.assertEqual(5, self.matrix.commute(self.loc2, self.loc1))
+        self.assertEqual(0, self.matrix.commute(self.loc2, self.loc3))
+        self.assertEqual(10, self.matrix.commute(self.loc1, Point(6, 8)))
+
+        # walking_rate
+        slow = TravelMatrix([self.loc1, self.loc2], 0.5)
+        self.assertEqual(10, slow.commute(self.loc1, self.loc2))
+
+        # build method, matrices are cached per locations and rate
+        built = TravelMatrix.build([self.loc1, self.loc2], 1.0)
+        self.assertIs(built, TravelMatrix.build([self.loc2, self.loc1], 1.0))
+        self.assertIsNot(built, TravelMatrix.build([self.loc1, self.loc2], 2.0))
+        self.assertEqual(built, self.matrix)
+
+        # only the cache_size most recently used matrices are kept
+        for x in range(TravelMatrix.cache_size):
+            TravelMatrix.build([self.loc1, Point(x, 100)], 1.0)
+        self.assertLessEqual(len(TravelMatrix._cache), TravelMatrix.cache_size)
+        rebuilt = TravelMatrix.build([self.loc1, self.loc2], 1.0)
+        self.assertIsNot(built, rebuilt)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,8 @@
-from person import Person
+from person import (
+    Person,
+    LANGUAGES
+)
+import pickle
 import unittest
 import sys
 sys.path.append('..')
@@ -26,6 +30,28 @@ class TestPerson(unittest.TestCase):
         self.assertIsInstance(new_person,  Person)
         self.assertTrue(new_person == self.person)
 
+        # identity survives copies and pickling
+        self.assertEqual(hash(new_person),  hash(self.person))
+        self.assertEqual({self.person: 1}[new_person],  1)
+        self.assertEqual(pickle.loads(pickle.dumps(self.person)),  self.person)
+        twin = Person("Doe, John",  {"English",  "German"},  "Male")
+        self.assertNotEqual(twin,  self.person)
+
+        # language_mask property
+        mask = LANGUAGES.mask({"English",  "German"})
+        self.assertEqual(mask,  self.person.language_mask)
+        self.assertEqual({"English",  "German"},  LANGUAGES.languages(mask))
+        self.assertEqual(mask,  new_person.language_mask)
+        person2.languages = {"Japanese",  "German"}
+        self.assertTrue(self.person.has_common_language(person2))
+        self.assertEqual(LANGUAGES.mask(person2.languages),
+                         person2.language_mask)
+
+        # languages can't change in place behind the mask's back
+        with self.assertRaises(AttributeError):
+            person2.languages.add("French")
+        self.assertEqual({"Japanese",  "German"},  person2.languages)
+
 
 if __name__ == '__main__':
     unittest.main()
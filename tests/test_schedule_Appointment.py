@@ -104,7 +104,7 @@ class TestClass(unittest.TestCase):
         self.assertEqual(str(self.appt), appt_str)
 
         # __hash__
-        expected_hash = id(self.appt)
+        expected_hash = hash(self.appt.idnum)
         actual_hash = self.appt.__hash__()
         self.assertEqual(expected_hash, actual_hash)
 
@@ -63,6 +63,29 @@ class TestClass(unittest.TestCase):
         self.assertEqual(p_dict, precalculated_p)
         self.assertEqual(cls.appt_weights, precalculated_weights)
 
+        # calc_predecessors gives the same priors as 1-based positions
+        by_finish = sorted(appts, key=lambda appt: appt.finish)
+        p = cls.calc_predecessors(by_finish)
+        self.assertEqual(0, p[0])
+        self.assertEqual(precalculated_p,
+                         {appt.idnum: (by_finish[p[j] - 1].idnum if p[j] else 0)
+                          for j, appt in enumerate(by_finish, 1)})
+        # predecessors caches p until the appointments or their order change
+        self.assertIs(cls.predecessors(by_finish), cls.predecessors(by_finish))
+        self.assertIs(cls.predecessors(by_finish),
+                      cls.predecessors(list(by_finish)))
+        self.assertIsNot(p, cls.predecessors(by_finish[:-1]))
+        cached = cls.predecessors(by_finish)
+        by_finish[0], by_finish[1] = by_finish[1], by_finish[0]
+        self.assertIsNot(cached, cls.predecessors(by_finish))
+        by_finish[0], by_finish[1] = by_finish[1], by_finish[0]
+
+        # a second calculate_weights on the same appts reuses p
+        cls.calculate_weights(appts)
+        cached = cls.p_cache
+        self.assertEqual(precalculated_weights, cls.calculate_weights(appts))
+        self.assertIs(cached, cls.p_cache)
+
         # test compute_optimal
         precalculated_co = [2, 4, 5]
         optimal = cls.compute_optimal(len(cls.appts_to_assign),
@@ -71,6 +94,14 @@ class TestClass(unittest.TestCase):
         optimal.pop(0)
         self.assertEqual(precalculated_co, optimal)
 
+        # the bottom-up table matches the weights and traces the same path
+        m = cls.optimal_weights(by_finish, p)
+        self.assertEqual(list(precalculated_weights.values()), list(m))
+        self.assertEqual([5, 4, 2],
+                         list(cls.trace_optimal(len(by_finish), by_finish,
+                                                p, m)))
+        self.assertEqual([2, 4, 5], cls.gen_optimal(by_finish))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+from schedule import AppointmentList
+from tests.objects import (
+    appt1,
+    appt2,
+    appt3,
+    appt4
+)
+import copy
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the schedule.AppointmentList class
+    """
+    def setUp(self):
+        self.appts = AppointmentList([appt1, appt2])
+
+    def test(self):
+        # __contains__, membership is by idnum
+        self.assertIn(appt1, self.appts)
+        self.assertIn(appt1.copy(), self.appts)
+        self.assertNotIn(appt3, self.appts)
+
+        # append, insert and extend
+        self.appts.append(appt3)
+        self.assertIn(appt3, self.appts)
+        self.appts.insert(0, appt4)
+        self.assertEqual([appt4, appt1, appt2, appt3], self.appts)
+        self.appts.extend([appt4])
+        self.appts += [appt4]
+        self.assertEqual(6, len(self.appts))
+
+        # remove, pop and del keep counting duplicates
+        self.appts.remove(appt4)
+        self.appts.pop()
+        self.assertIn(appt4, self.appts)
+        del self.appts[-1]
+        self.assertNotIn(appt4, self.appts)
+        del self.appts[:1]
+        self.assertNotIn(appt1, self.appts)
+        self.appts[0] = appt1
+        self.assertIn(appt1, self.appts)
+        self.assertNotIn(appt2, self.appts)
+
+        # copy
+        copied = copy.deepcopy(self.appts)
+        self.assertIsInstance(copied, AppointmentList)
+        self.assertEqual(self.appts, copied)
+        self.assertIn(appt3, copied)
+        copied.remove(appt3)
+        self.assertNotIn(appt3, copied)
+        self.assertIn(appt3, self.appts)
+
+
+if __name__ == '__main__':
+    unittest.main()
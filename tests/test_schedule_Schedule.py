@@ -38,6 +38,11 @@ class TestClass(unittest.TestCase):
         self.assertTrue(appt2 in copied.appts)
         self.assertTrue(appt3 in copied.appts)
 
+        # subset shares the travel matrix
+        subset = self.sched.subset([appt1, appt2], [interpreter1])
+        self.assertIs(self.sched.travel, subset.travel)
+        self.assertEqual([appt1, appt2], subset.appts)
+
         # gen_intervals
         generated = self.sched.gen_intervals()
         expected = {"i": [1, 2, 3],
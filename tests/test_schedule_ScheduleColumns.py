@@ -0,0 +1,106 @@
+from schedule import ScheduleColumns
+import schedule
+from tests.objects import (
+    interpreter1,
+    interpreter3,
+    appt4,
+    appt5,
+    appt6,
+    appt7,
+    patient1
+)
+from utils import Time
+from constants import TIME_FORMAT
+import copy
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the schedule.ScheduleColumns class
+    """
+    def setUp(self):
+        self.appts = [appt4.copy(), appt5.copy(), appt6.copy(), appt7.copy()]
+        self.cls = ScheduleColumns(self.appts, [interpreter1, interpreter3])
+
+    def test(self):
+        # columns
+        self.assertEqual([4, 5, 6, 7], list(self.cls.idnum))
+        self.assertEqual([585, 765, 825, 845], list(self.cls.start))
+        self.assertEqual([625, 805, 915, 875], list(self.cls.finish))
+        self.assertEqual([20, 20, 20, 20], list(self.cls.priority))
+        self.assertEqual([4, 4, 4, 4], list(self.cls.x))
+        self.assertEqual([0, 0, 0, 0], list(self.cls.building))
+        self.assertEqual(["West Wing"], self.cls.buildings)
+        self.assertEqual([-1, -1, -1, -1], list(self.cls.assigned))
+        self.assertTrue(self.cls.sorted_by_start)
+
+        # select
+        self.assertEqual([1, 2, 3], self.cls.select(
+            start_after=Time("12:45", TIME_FORMAT)))
+        self.assertEqual([0, 1], self.cls.select(
+            start_before=Time("12:45", TIME_FORMAT)))
+        self.assertEqual([0, 1, 3], self.cls.select(
+            finish_before=Time("14:35", TIME_FORMAT)))
+        self.assertEqual([2, 3], self.cls.select(
+            language_mask=patient1.language_mask))
+
+        # in_shift, interpreter3 works 8:30 - 12:30 and speaks French
+        self.assertEqual([0], self.cls.in_shift(interpreter3))
+        self.assertEqual([2, 3], self.cls.in_shift(interpreter1))
+
+        # assign and open_only
+        self.cls.assign(self.appts[2], interpreter1)
+        self.assertEqual(0, self.cls.assigned[2])
+        self.assertEqual([self.appts[3]], self.cls.select_appts(
+            language_mask=patient1.language_mask, open_only=True))
+
+        # refresh
+        self.appts[3].priority = 50
+        self.appts[3].interpreter = interpreter3
+        self.cls.refresh(self.appts[3])
+        self.assertEqual(50, self.cls.priority[3])
+        self.assertEqual(1, self.cls.assigned[3])
+
+        # unassign_all
+        self.cls.unassign_all()
+        self.assertEqual([-1, -1, -1, -1], list(self.cls.assigned))
+
+        # direct changes to the appts are picked up without a refresh
+        self.appts[0].priority = 7
+        self.appts[0].interpreter = interpreter3
+        self.assertEqual(7, self.cls.priority[0])
+        self.assertEqual(1, self.cls.assigned[0])
+        self.assertEqual([1, 2, 3], self.cls.select(open_only=True))
+
+        # copies watch their own appts
+        columns = copy.deepcopy(self.cls)
+        self.assertEqual(self.cls, columns)
+        columns.appts[1].interpreter = interpreter1
+        self.assertEqual(0, columns.assigned[1])
+        self.assertEqual(-1, self.cls.assigned[1])
+        self.assertNotEqual(self.cls, columns)
+
+        # the stdlib columns select the same rows as the NumPy columns
+        self.cls = ScheduleColumns(self.appts, [interpreter1, interpreter3])
+        numpy = schedule.np
+        schedule.np = None
+        try:
+            plain = ScheduleColumns(self.appts, [interpreter1, interpreter3])
+        finally:
+            schedule.np = numpy
+        self.assertFalse(plain.vectorized)
+        for filters in [{'start_after': Time("12:45", TIME_FORMAT)},
+                        {'finish_before': Time("14:35", TIME_FORMAT)},
+                        {'language_mask': patient1.language_mask},
+                        {'open_only': True}]:
+            self.assertEqual(plain.select(**filters),
+                             self.cls.select(**filters))
+        self.assertEqual(plain.in_shift(interpreter1),
+                         self.cls.in_shift(interpreter1))
+
+
+if __name__ == '__main__':
+    unittest.main()
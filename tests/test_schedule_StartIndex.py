@@ -0,0 +1,71 @@
+from schedule import StartIndex, AppointmentList
+from tests.objects import bf_test_schedule
+from utils import Time
+from constants import TIME_FORMAT
+import copy
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the schedule.StartIndex class
+    """
+    def setUp(self):
+        self.appts = list(reversed(bf_test_schedule.appts))
+        self.index = StartIndex(self.appts)
+
+    def test(self):
+        # the appts are kept in ascending order of start
+        starts = [appt.start for appt in self.index]
+        self.assertEqual(sorted(starts), starts)
+        self.assertEqual(len(self.appts), len(self.index))
+
+        # select matches a scan of the appts for every pair of times
+        times = sorted({appt.start for appt in self.appts})
+        for after in times:
+            expected = [appt for appt in self.index if appt.start >= after]
+            self.assertEqual(expected, self.index.select(start_after=after))
+            for before in times:
+                self.assertEqual(
+                    [appt for appt in expected if appt.start <= before],
+                    self.index.select(start_after=after,
+                                      start_before=before))
+        self.assertEqual([], self.index.select(
+            start_after=Time("23:00", TIME_FORMAT)))
+
+        # remove and add keep the order, ties go after the indexed appts
+        appt = self.appts[0]
+        self.index.remove(appt)
+        self.assertNotIn(appt, list(self.index))
+        self.index.remove(appt)
+        self.assertEqual(len(self.appts) - 1, len(self.index))
+        self.index.add(appt)
+        same_start = self.index.select(start_after=appt.start,
+                                       start_before=appt.start)
+        self.assertEqual(appt, same_start[-1])
+        self.assertEqual(len(self.appts), len(self.index))
+
+        # an index over an AppointmentList follows every change to it
+        appts = AppointmentList(self.appts)
+        index = StartIndex(appts)
+        removed = appts.pop()
+        appts.remove(appts[0])
+        appts[0] = removed
+        del appts[1:3]
+        appts.append(self.appts[0])
+        self.assertEqual(sorted([appt.idnum for appt in appts]),
+                         sorted([appt.idnum for appt in index]))
+        self.assertEqual(sorted([appt.start for appt in appts]),
+                         [appt.start for appt in index])
+        index_copy = copy.deepcopy(index)
+        index_copy.source.pop()
+        self.assertEqual(len(index_copy.source), len(index_copy))
+        self.assertEqual(len(appts), len(index))
+        appts.clear()
+        self.assertEqual(0, len(index))
+
+
+if __name__ == '__main__':
+    unittest.main()
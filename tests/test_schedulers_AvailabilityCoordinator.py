@@ -19,31 +19,18 @@ class TestClass(unittest.TestCase):
         appts = self.schedule.appts
         interpreters = self.cls.interpreters
 
-        # update_time_dict
+        # get_time_index keeps the index over the open appts
+        time_index = self.cls.get_time_index(self.cls.appts_to_assign)
+        self.assertIs(time_index,
+                      self.cls.get_time_index(self.cls.appts_to_assign))
+        self.assertEqual(len(self.cls.appts_to_assign), len(time_index))
+
+        # and indexes any other appts from scratch
+        time_index = self.cls.get_time_index(appts)
         time = Time("8:00", TIME_FORMAT)
-        self.cls.update_time_dict(time, appts)
-
-        td = self.cls.time_dict["08:00"]
-        self.assertEqual(td[0], appts[0])
-
-        td = self.cls.time_dict["08:25"]
-        self.assertEqual(td[0], appts[1])
-
-        td = self.cls.time_dict["08:45"]
-        self.assertEqual(td[0], appts[2])
-
-        # rev_update_time_dict
-        self.cls.time_dict = {}
+        self.assertEqual(appts[:3], time_index.select(start_after=time)[:3])
         time = Time("8:30", TIME_FORMAT)
-        self.cls.rev_update_time_dict(time, appts)
-
-        td = self.cls.time_dict["08:00"]
-        self.assertEqual(td[0], appts[0])
-
-        td = self.cls.time_dict["08:25"]
-        self.assertEqual(td[0], appts[1])
-
-        self.assertNotIn("08:45", self.cls.time_dict.keys())
+        self.assertEqual(appts[:2], time_index.select(start_before=time))
 
         # update_valid_choices
         self.cls.appts_to_assign.append(appts[0])
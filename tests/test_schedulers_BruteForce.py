@@ -0,0 +1,133 @@
+from schedulers import BruteForce
+from tests.objects import bf_test_schedule
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the BruteForce class
+    """
+    def setUp(self):
+        self.schedule = bf_test_schedule.copy()
+        self.cls = BruteForce(self.schedule)
+
+    def test(self):
+        interpreter = self.schedule.interpreters[0]
+        appts = list(self.cls.appts_to_assign)
+        tree = self.cls.gen_schedule_graph(interpreter, appts)
+        subtree = tree.prefix(appts[11].idnum)
+
+        # path_weights
+        weights = self.cls.path_weights(subtree, interpreter)
+        self.assertEqual(0, weights[0])
+        for ID in subtree:
+            if ID > 0:
+                self.assertEqual(self.cls.appts_dict[ID].priority,
+                                 weights[ID])
+
+        # calc_bounds never underestimates what follows a node
+        bounds, rank = self.cls.calc_bounds(subtree, weights)
+        self.assertEqual(0, rank[0])
+        for ID in subtree:
+            for next in subtree[ID]:
+                self.assertGreaterEqual(bounds[ID],
+                                        weights[next] + bounds[next])
+
+        # unwind follows the parent pointers back to the root
+        self.assertEqual([0, 2, 7], self.cls.unwind((7, (2, (0, None)))))
+
+        # dfs_weighted yields every path to finish with its weight tracked
+        finish = appts[11].idnum
+        paths = list(self.cls.dfs_weighted(subtree, 0, finish, interpreter))
+        self.assertTrue(paths)
+        for path in paths:
+            self.assertEqual(0, path[0])
+            self.assertEqual(finish, path[-1])
+            for (vertex, next) in zip(path, path[1:]):
+                self.assertIn(next, subtree[vertex])
+        self.assertEqual(max([sum([weights[ID] for ID in path])
+                              for path in paths]),
+                         self.cls.best_paths[interpreter][0])
+
+        # branch_and_bound finds the same best weight as dfs_weighted
+        for node in subtree:
+            if node > 0:
+                list(self.cls.dfs_weighted(subtree, 0, node, interpreter))
+        best = self.cls.best_paths[interpreter]
+        result = self.cls.branch_and_bound(subtree, 0, weights, bounds, rank)
+        self.assertEqual(best[0], result[0])
+        self.assertEqual(result[0], sum([weights[ID] for ID in result[1]]))
+
+        # an incumbent that can't be beaten is kept
+        self.assertEqual(best, self.cls.branch_and_bound(
+            subtree, 0, weights, bounds, rank, best))
+
+        # a ceiling at the best weight stops on the same path, and one the
+        # incumbent already reaches skips the search
+        self.assertEqual(result, self.cls.branch_and_bound(
+            subtree, 0, weights, bounds, rank, ceiling=result[0]))
+        self.assertEqual((0, []), self.cls.branch_and_bound(
+            subtree, 0, weights, bounds, rank, ceiling=0))
+
+        # check_incumbent drops a path that doesn't follow the edges
+        self.cls.best_paths[interpreter] = (best[0], list(reversed(best[1])))
+        self.assertEqual((0, []), self.cls.check_incumbent(subtree, weights,
+                                                           interpreter))
+
+        # warm_start from a schedule, then improve on it
+        self.cls.reset()
+        greedy = self.schedule.copy()
+        first = self.cls.appts_dict[best[1][1]]
+        for appt in greedy.appts:
+            if appt.idnum == first.idnum:
+                appt.interpreter = interpreter
+        self.cls.warm_start(greedy)
+        self.assertEqual((first.priority, [0, first.idnum]),
+                         self.cls.best_paths[interpreter])
+        self.cls.gen_best_path(interpreter)
+        self.assertEqual(2010, self.cls.best_paths[interpreter][0])
+
+        # split_branches lists whole branches after depth choices
+        splits = self.cls.split_branches(subtree, 0, weights, bounds, rank,
+                                         (0, []), 2)
+        self.assertEqual((False, (0, 0, (0, None))), splits[0])
+        for (is_branch, entry) in splits:
+            self.assertEqual(is_branch, len(self.cls.unwind(entry[2])) == 3)
+
+        # class_schedule_graph reuses a class's graph as appts get assigned
+        self.cls.reset()
+        tree = self.cls.class_schedule_graph(interpreter)
+        self.assertEqual(dict(tree),
+                         dict(self.cls.class_schedule_graph(interpreter)))
+        self.assertEqual([tree], list(self.cls.class_graphs.values()))
+        self.cls.assign(interpreter, self.cls.appts_dict[best[1][1]])
+        self.assertEqual(dict(self.cls.gen_schedule_graph(
+            interpreter, list(self.cls.appts_to_assign))),
+            dict(self.cls.class_schedule_graph(interpreter)))
+
+        # create_branch_and_bound_schedule
+        self.cls.reset()
+        sched = self.cls.create_branch_and_bound_schedule()
+        self.assertEqual(3704, sched.calc_impact())
+        serial = dict(self.cls.best_paths)
+
+        # the parallel search gives the serial result
+        self.cls.reset()
+        sched = self.cls.create_parallel_branch_and_bound_schedule(
+            depth=2, max_workers=2)
+        self.assertEqual(3704, sched.calc_impact())
+        self.assertEqual(serial, self.cls.best_paths)
+
+        # a later interpreter of a class can't beat an earlier one
+        ceilings = {}
+        self.assertIsNone(self.cls.class_ceiling(ceilings, interpreter))
+        self.cls.update_class_ceiling(ceilings, interpreter)
+        self.assertEqual(serial[interpreter][0],
+                         self.cls.class_ceiling(ceilings,
+                                                interpreter.copy()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+from schedulers import ColumnGeneration, linprog
+from tests.objects import bf_test_schedule
+import schedulers
+import types
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the ColumnGeneration class
+    """
+    def setUp(self):
+        self.schedule = bf_test_schedule.copy()
+        self.cls = ColumnGeneration(self.schedule)
+        self.appts = list(self.cls.appts_to_assign)
+
+    def test(self):
+        interpreters = self.schedule.interpreters
+
+        # gen_route_candidates keeps what can_assign allows, by finish
+        candidates = self.cls.gen_route_candidates(interpreters, self.appts)
+        for interpreter, (idx, weights, p) in zip(interpreters, candidates):
+            self.assertEqual([a for a, appt in enumerate(self.appts)
+                              if self.cls.can_assign(interpreter, appt)],
+                             sorted(idx))
+            finishes = [self.appts[a].finish for a in idx]
+            self.assertEqual(sorted(finishes), finishes)
+            self.assertEqual(len(idx) + 1, len(p))
+
+        # price_route with no duals is the interpreter's best DP route
+        no_duals = [0] * len(self.appts)
+        value, route = self.cls.price_route(self.appts, candidates[0],
+                                            no_duals)
+        (idx, weights, p) = candidates[0]
+        route_appts = [self.appts[a] for a in idx]
+        m = self.cls.optimal_weights(route_appts, p, weights)
+        self.assertEqual(m[-1], value)
+        for a, b in zip(route, route[1:]):
+            self.assertLessEqual(self.appts[a].finish, self.appts[b].start)
+
+        # a dual price at least an appt's weight prices it out of the route
+        duals = list(no_duals)
+        duals[route[0]] = 10 ** 6
+        value2, route2 = self.cls.price_route(self.appts, candidates[0],
+                                              duals)
+        self.assertNotIn(route[0], route2)
+        self.assertLessEqual(value2, value)
+
+        # add_column skips empty and repeated routes
+        self.assertTrue(self.cls.add_column(0, route, candidates))
+        self.assertFalse(self.cls.add_column(0, route, candidates))
+        self.assertFalse(self.cls.add_column(1, [], candidates))
+        self.assertEqual([(0, route, value)], self.cls.columns)
+        self.assertEqual({(0, tuple(route))}, self.cls.column_keys)
+
+        # round_columns takes disjoint columns by LP value, as many of a
+        # class as it has interpreters
+        self.cls.classes = [[interpreters[0]], [interpreters[1]]]
+        self.cls.columns = [(0, [0, 1], 5), (1, [1, 2], 9), (1, [3], 2),
+                            (0, [4], 1)]
+        self.assertEqual([1, 3], self.cls.round_columns([0.5, 1, 0, 0]))
+        self.cls.classes = [interpreters, []]
+        self.cls.columns = [(0, [0, 1], 5), (0, [2], 9), (0, [3], 2)]
+        self.assertEqual([1, 0], self.cls.round_columns([0.5, 1, 0]))
+
+    @unittest.skipIf(linprog is None, "scipy is not installed")
+    def test_column_generation(self):
+        interpreters = self.schedule.interpreters
+
+        # the bound covers the best schedule, 3704, and routes are valid
+        sched = self.cls.create_column_assignment(interpreters)
+        self.assertEqual(self.cls.cg_value, sched.calc_impact())
+        self.assertLessEqual(self.cls.cg_value, self.cls.cg_bound)
+        self.assertGreaterEqual(self.cls.cg_bound, 3704 - 1e-6)
+        self.assertGreaterEqual(self.cls.cg_value, 3600)
+        for interpreter in interpreters:
+            jobs = self.cls.get_jobs(interpreter)[1:]
+            for job1, job2 in zip(jobs, jobs[1:]):
+                self.assertLessEqual(job1.finish, job2.start)
+
+        # a master LP that fails is reported rather than read
+        failed = types.SimpleNamespace(status=4, message='Numerical trouble')
+        schedulers.linprog = lambda *args, **kwargs: failed
+        try:
+            with self.assertRaises(ValueError):
+                self.cls.create_column_assignment(interpreters)
+        finally:
+            schedulers.linprog = linprog
+
+
+    @unittest.skipIf(linprog is None, "scipy is not installed")
+    def test_classes(self):
+        # interpreters with the same shift share one class and its columns
+        interpreters = self.schedule.interpreters
+        interpreters[1].shift_finish = interpreters[0].shift_finish
+        sched = self.cls.create_column_assignment(interpreters)
+        self.assertEqual([interpreters], self.cls.classes)
+        self.assertEqual({0}, {c for (c, route, value) in self.cls.columns})
+        self.assertEqual(3492, sched.calc_impact())
+        for interpreter in interpreters:
+            self.assertTrue(self.cls.get_jobs(interpreter)[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+from schedulers import CompatibilityGraph
+from tests.objects import bf_test_schedule
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the CompatibilityGraph class
+    """
+    def setUp(self):
+        self.schedule = bf_test_schedule.copy()
+        self.interpreter = self.schedule.interpreters[0]
+        self.appts = list(self.schedule.appts)
+        self.cls = CompatibilityGraph(self.interpreter, self.appts)
+
+    def test(self):
+        appts_dict = {appt.idnum: appt for appt in self.appts}
+
+        # the root leads to every appt the interpreter can work
+        self.assertEqual(0, min(self.cls))
+        self.assertNotIn(32, self.cls[0])  # outside of the shift
+        self.assertEqual(set(self.cls) - {0}, self.cls[0])
+
+        # an appt leads to every other appt starting once it has finished
+        for idnum in self.cls[0]:
+            appt = appts_dict[idnum]
+            expected = {ID for ID in self.cls[0]
+                        if appts_dict[ID].start >= appt.finish}
+            self.assertEqual(expected, self.cls[idnum])
+
+        # prefix views match a graph built from the same prefix of appts
+        for idx, appt in enumerate(self.appts):
+            view = self.cls.prefix(appt.idnum)
+            graph = CompatibilityGraph(self.interpreter,
+                                       self.appts[:idx + 1])
+            self.assertEqual(dict(graph), dict(view))
+            self.assertEqual(len(graph), len(view))
+
+        # restricted views match a graph built without the missing appts
+        remaining = [appt for appt in self.appts if appt.idnum % 4 != 0]
+        view = self.cls.restrict(remaining)
+        graph = CompatibilityGraph(self.interpreter, remaining)
+        self.assertEqual(dict(graph), dict(view))
+        self.assertEqual(list(graph), list(view))
+        for idx, appt in enumerate(remaining):
+            self.assertEqual(
+                dict(CompatibilityGraph(self.interpreter,
+                                        remaining[:idx + 1])),
+                dict(view.prefix(appt.idnum)))
+
+        # views don't change the graph they were taken from
+        self.assertEqual(len(self.cls[0]) + 1, len(self.cls))
+        self.assertRaises(KeyError, self.cls.prefix(1).__getitem__, 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+from schedulers import Greedy
+from tests.objects import bf_test_schedule
+from utils import Time
+from constants import TIME_FORMAT
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the Greedy class
+    """
+    def setUp(self):
+        self.schedule = bf_test_schedule.copy()
+        self.cls = Greedy(self.schedule)
+        self.time = Time("06:00", TIME_FORMAT)
+
+    def test(self):
+        interpreter = self.schedule.interpreters[0]
+        appts = self.cls.open_appts_for(interpreter, self.time)
+
+        # the queue pops appts in the order process_args picks them
+        for optimal in ('weight', 'number'):
+            queue = self.cls.gen_greedy_queue(appts, optimal)
+            remaining = list(appts)
+            while remaining:
+                expected = self.cls.process_args(optimal, remaining,
+                                                 interpreter)[0]
+                self.assertEqual(expected, self.cls.pop_greedy_choice(queue))
+                remaining.remove(expected)
+            self.assertIsNone(self.cls.pop_greedy_choice(queue))
+        self.assertRaises(ValueError, self.cls.gen_greedy_queue, appts, 'x')
+
+        # appts assigned since they were queued are dropped
+        queue = self.cls.gen_greedy_queue(appts, 'weight')
+        assigned = [appt for appt in appts
+                    if self.cls.can_assign(interpreter, appt)][0]
+        self.cls.assign(interpreter, assigned)
+        popped = []
+        while queue:
+            popped.append(self.cls.pop_greedy_choice(queue))
+        self.assertEqual(set(appts) - {assigned}, set(popped) - {None})
+
+        # create_classic_greedy_schedule
+        self.schedule = bf_test_schedule.copy()
+        self.cls = Greedy(self.schedule)
+        sched = self.cls.create_classic_greedy_schedule(self.time, 'weight')
+        self.assertEqual(3499, sched.calc_impact())
+        for interpreter in self.schedule.interpreters:
+            jobs = self.cls.get_jobs(interpreter)[1:]
+            for job1, job2 in zip(jobs, jobs[1:]):
+                self.assertLessEqual(job1.finish, job2.start)
+
+        # create_balanced_greedy_schedule
+        self.cls = Greedy(bf_test_schedule.copy())
+        sched = self.cls.create_balanced_greedy_schedule(self.time, 'weight')
+        self.assertEqual(3614, sched.calc_impact())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+from schedulers import IntegerProgram, milp
+from tests.objects import bf_test_schedule
+from utils import Time
+from constants import TIME_FORMAT
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the IntegerProgram class
+    """
+    def setUp(self):
+        self.schedule = bf_test_schedule.copy()
+        self.cls = IntegerProgram(self.schedule)
+        self.appts = list(self.cls.appts_to_assign)
+
+    def test(self):
+        interpreters = self.schedule.interpreters
+
+        # gen_variables keeps the pairs can_assign allows
+        var_interpreters, var_appts, weights = self.cls.gen_variables(
+            interpreters, self.appts)
+        pairs = set(zip(var_interpreters, var_appts))
+        for i, interpreter in enumerate(interpreters):
+            for a, appt in enumerate(self.appts):
+                self.assertEqual(self.cls.can_assign(interpreter, appt),
+                                 (i, a) in pairs)
+        self.assertNotIn((0, self.appts.index(
+            self.cls.get_job_with_id(32))), pairs)
+
+        # gen_cliques covers every overlapping pair with a maximal clique
+        cliques = self.cls.gen_cliques(self.appts)
+        for a, appt1 in enumerate(self.appts):
+            for b, appt2 in enumerate(self.appts):
+                if a != b:
+                    self.assertEqual(not appt1.is_compatible(appt2),
+                                     any([a in clique and b in clique
+                                          for clique in cliques]))
+        for clique in cliques:
+            self.assertFalse(any([set(clique) < set(other)
+                                  for other in cliques]))
+
+    @unittest.skipIf(milp is None, "scipy is not installed")
+    def test_milp(self):
+        interpreters = self.schedule.interpreters
+
+        # gen_conflicts finds the pairs can_reach rejects that don't overlap
+        earlier, later = self.cls.gen_conflicts(self.appts)
+        conflicts = set(zip(earlier.tolist(), later.tolist()))
+        for a, appt1 in enumerate(self.appts):
+            for b, appt2 in enumerate(self.appts):
+                expected = (appt1.finish <= appt2.start and
+                            not self.cls.can_reach(appt1, appt2))
+                self.assertEqual(expected, (a, b) in conflicts)
+
+        # create_milp_assignment
+        sched = self.cls.create_milp_assignment(interpreters)
+        self.assertEqual(3629, sched.calc_impact())
+        self.assertEqual(0, self.cls.mip_gap)
+        for interpreter in interpreters:
+            jobs = self.cls.get_jobs(interpreter)[1:]
+            for job1, job2 in zip(jobs, jobs[1:]):
+                self.assertTrue(self.cls.can_reach(job1, job2))
+
+        # Interpreters of one class get the same variables and rows
+        schedule = bf_test_schedule.copy()
+        schedule.interpreters[1].shift_finish = Time("16:30", TIME_FORMAT)
+        cls = IntegerProgram(schedule)
+        self.assertEqual(1, len(cls.gen_interpreter_classes(
+            schedule.interpreters)))
+        appts = list(cls.appts_to_assign)
+        weights, matrix, var_interpreters, var_appts = cls.build_program(
+            schedule.interpreters, appts)
+        first = var_appts[var_interpreters == 0].tolist()
+        self.assertEqual(first, var_appts[var_interpreters == 1].tolist())
+        n = len(first)
+        self.assertTrue(n > 0)
+        rows = [sorted(matrix[:, :n].getrow(r).indices.tolist())
+                for r in range(matrix.shape[0]) if matrix[r, :n].nnz]
+        twins = [sorted((matrix[:, n:].getrow(r).indices).tolist())
+                 for r in range(matrix.shape[0]) if matrix[r, n:].nnz]
+        self.assertEqual(sorted(rows), sorted(twins))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+from schedulers import Optimum
+from tests.objects import bf_test_schedule
+from utils import Time
+from constants import TIME_FORMAT
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test grouping schedulers.JobSupervisor interpreters into classes, their
+    weight vectors and feasible appts, and splitting the day into time windows
+    """
+    def setUp(self):
+        # leave a gap around lunch that no appt spans
+        lunch = (Time("11:00", TIME_FORMAT), Time("12:00", TIME_FORMAT))
+        appts = [appt for appt in bf_test_schedule.copy().appts
+                 if appt.finish <= lunch[0] or appt.start >= lunch[1]]
+        self.schedule = bf_test_schedule.subset(
+            appts, bf_test_schedule.copy().interpreters)
+        self.cls = Optimum(self.schedule)
+
+    def test(self):
+        # interpreter_class_key ignores multipliers of 1 and, if asked, all
+        (interpreter1, interpreter2) = self.schedule.interpreters
+        key = self.cls.interpreter_class_key(interpreter1)
+        interpreter1.assignments = {}
+        self.assertEqual(key, self.cls.interpreter_class_key(interpreter1))
+        interpreter1.assignments = {"West Wing": 2}
+        self.assertNotEqual(key, self.cls.interpreter_class_key(interpreter1))
+        self.assertEqual(key[:3], self.cls.interpreter_class_key(
+            interpreter1, by_assignment=False))
+
+        # gen_interpreter_classes groups by shift too
+        self.assertEqual([[interpreter1], [interpreter2]],
+                         self.cls.gen_interpreter_classes(
+                             self.schedule.interpreters, False))
+        interpreter2.shift_finish = interpreter1.shift_finish
+        self.assertEqual([[interpreter1, interpreter2]],
+                         self.cls.gen_interpreter_classes(
+                             self.schedule.interpreters, False))
+        self.assertEqual([[interpreter1], [interpreter2]],
+                         self.cls.gen_interpreter_classes(
+                             self.schedule.interpreters))
+        interpreter1.assignments = interpreter2.assignments
+        interpreter2.shift_finish = Time("17:00", TIME_FORMAT)
+
+        # weight_vector is read-only and shared by a class
+        interpreter1.assignments = {"West Wing": 2}
+        vector = self.cls.weight_vector(interpreter1)
+        self.assertIs(vector, self.cls.weight_vector(interpreter1))
+        with self.assertRaises(TypeError):
+            vector[1] = 0
+        self.assertEqual(0, vector[0])
+        for appt in self.schedule.appts:
+            self.assertEqual(self.cls.assignment_weight(interpreter1, appt),
+                             vector[appt.idnum])
+            self.assertEqual(appt.priority,
+                             self.cls.weight_vector()[appt.idnum])
+
+        # create_cached_assignment leaves the priorities alone
+        priorities = [appt.priority for appt in self.schedule.appts]
+        self.cls.create_cached_assignment(self.schedule.interpreters)
+        self.assertEqual(priorities,
+                         [appt.priority for appt in self.schedule.appts])
+        interpreter1.assignments = interpreter2.assignments
+
+        # feasible_appts holds the appts in shift that speak a language
+        self.cls.reset()
+        for interpreter in self.schedule.interpreters:
+            feasible = self.cls.feasible_appts(interpreter)
+            self.assertIs(feasible, self.cls.feasible_appts(interpreter))
+            for appt in self.cls.appts_to_assign:
+                self.assertEqual(
+                    interpreter.is_compatible(appt.patient) and
+                    self.cls.is_appt_in_shift(interpreter, appt),
+                    appt.idnum in feasible)
+                self.assertEqual(appt.idnum in feasible,
+                                 self.cls.can_assign(interpreter, appt))
+
+        # and stays put as appts are assigned, until reset
+        appt = self.cls.feasible_open_appts(interpreter, Time("00:00",
+                                                              TIME_FORMAT))[0]
+        self.cls.assign(interpreter, appt)
+        self.assertIn(appt.idnum, self.cls.feasible_appts(interpreter))
+        self.assertFalse(self.cls.can_assign(interpreter, appt))
+        self.cls.reset()
+        self.assertNotIn(interpreter, self.cls.feasible)
+
+        # but is worked out again when the shift or languages change
+        feasible = self.cls.feasible_appts(interpreter)
+        self.assertIn(appt.idnum, feasible)
+        (shift_finish, languages) = (interpreter.shift_finish,
+                                     interpreter.languages)
+        interpreter.shift_finish = appt.start
+        self.assertNotIn(appt.idnum, self.cls.feasible_appts(interpreter))
+        self.assertFalse(self.cls.can_assign(interpreter, appt))
+        interpreter.shift_finish = shift_finish
+        self.assertEqual(feasible, self.cls.feasible_appts(interpreter))
+        interpreter.languages = []
+        self.assertEqual(frozenset(), self.cls.feasible_appts(interpreter))
+        interpreter.languages = languages
+        self.assertEqual(feasible, self.cls.feasible_appts(interpreter))
+
+        # gen_time_windows cuts at idle gaps of at least the longest commute
+        max_commute = self.cls.calc_max_commute(self.schedule.appts)
+        windows = self.cls.gen_time_windows(self.schedule.appts)
+        self.assertEqual(sorted([appt.idnum for appt in self.schedule.appts]),
+                         sorted([appt.idnum for window in windows
+                                 for appt in window]))
+        self.assertGreaterEqual(len(windows), 2)
+        for window, following in zip(windows, windows[1:]):
+            reach = max([appt.finish.minutes for appt in window])
+            self.assertGreaterEqual(following[0].start.minutes - reach,
+                                    max_commute)
+            for appt1 in window:
+                for appt2 in following:
+                    self.assertTrue(self.cls.can_reach(appt1, appt2))
+
+        # create_windowed_schedule matches solving the whole day
+        for method_name in ['create_travel_assignment',
+                            'create_branch_and_bound_schedule']:
+            self.cls.reset()
+            self.cls.reset()
+            method = getattr(self.cls, method_name)
+            expected = self.cls.call_method_default(method).calc_impact()
+            self.cls.reset()
+            self.cls.reset()
+            sched = self.cls.create_windowed_schedule(method_name,
+                                                      max_workers=2)
+            self.assertEqual(expected, sched.calc_impact())
+
+        # each interpreter ends up where his/her last job was
+        for interpreter in self.schedule.interpreters:
+            jobs = self.cls.get_jobs(interpreter)
+            self.assertEqual(jobs[-1].location.coordinates,
+                             self.cls.locs[interpreter].coordinates)
+
+        # a worker result that doesn't fit is skipped rather than raising
+        self.cls.reset()
+        self.cls.reset()
+        interpreter = self.schedule.interpreters[0]
+        appts = sorted([appt for appt in self.cls.appts_to_assign
+                        if self.cls.can_assign(interpreter, appt)])
+        (first, clash) = [(appt1, appt2) for appt1 in appts
+                          for appt2 in appts
+                          if appt1.start < appt2.start < appt1.finish][0]
+        self.cls.solve_subschedules = lambda *args: [
+            [(first.idnum, interpreter.uid), (clash.idnum, interpreter.uid)]]
+        sched = self.cls.create_windowed_schedule('create_travel_assignment')
+        del self.cls.solve_subschedules
+        self.assertEqual(first.priority, sched.calc_impact())
+        self.assertIn(clash, self.cls.appts_to_assign)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+from schedulers import ObjectInitializer, JobSupervisor, Optimum
+from tests.objects import bf_test_schedule, interpreter3, patient2
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test decomposing the schedulers.ObjectInitializer problem
+    """
+    def setUp(self):
+        schedule = bf_test_schedule.copy()
+        # French patients can only be seen by the French interpreter
+        for appt in schedule.appts:
+            if appt.idnum % 3 == 0:
+                appt.patient = patient2
+        self.schedule = schedule.subset(
+            schedule.appts, schedule.interpreters + [interpreter3.copy()])
+        self.object_initializer = ObjectInitializer(self.schedule)
+
+    def test(self):
+        (spanish1, spanish2, french) = self.schedule.interpreters
+
+        # gen_components splits the teams by language and shift
+        components = self.object_initializer.gen_components()
+        self.assertEqual([[spanish1, spanish2], [french]],
+                         [interpreters for (interpreters, appts)
+                          in components])
+        for (interpreters, appts) in components:
+            for appt in appts:
+                self.assertTrue(any([
+                    interpreter.is_compatible(appt.patient) and
+                    appt.start >= interpreter.shift_start and
+                    appt.finish <= interpreter.shift_finish
+                    for interpreter in interpreters]))
+        self.assertEqual([], [appt for appt in components[1][1]
+                              if appt.patient != patient2])
+
+        # appts no interpreter can work are left out
+        covered = components[0][1] + components[1][1]
+        left_out = [appt for appt in self.schedule.appts
+                    if appt not in covered]
+        self.assertIn(32, [appt.idnum for appt in left_out])
+
+        # create_decomposed_schedule matches solving the whole schedule
+        unassigned = self.schedule.copy()
+        optimum = Optimum(self.schedule.copy())
+        expected = optimum.create_travel_assignment(optimum.interpreters)
+        supervisor = JobSupervisor(self.schedule)
+        sched = supervisor.create_decomposed_schedule(
+            'create_travel_assignment', Optimum, max_workers=2)
+        self.assertEqual(expected.calc_impact(), sched.calc_impact())
+        self.assertEqual({appt.idnum: str(appt.interpreter)
+                          for appt in expected.appts},
+                         {appt.idnum: str(appt.interpreter)
+                          for appt in sched.appts})
+
+        # the results go through assign, so the supervisor keeps up
+        self.assertEqual(expected.calc_impact(), supervisor.schedule.impact)
+        for appt in supervisor.schedule.appts:
+            if appt.interpreter:
+                self.assertNotIn(appt, supervisor.appts_to_assign)
+                self.assertIn(appt, supervisor.get_jobs(appt.interpreter))
+            else:
+                self.assertIn(appt, supervisor.appts_to_assign)
+
+        # jobs assigned beforehand are kept, and clashing results skipped
+        supervisor = JobSupervisor(unassigned)
+        supervisor.assign(spanish1, supervisor.appts_dict[2])
+        sched = supervisor.create_decomposed_schedule(
+            'create_travel_assignment', Optimum, max_workers=2)
+        self.assertEqual(spanish1, [job for job in sched.appts
+                                    if job.idnum == 2][0].interpreter)
+        for interpreter in supervisor.interpreters:
+            jobs = supervisor.get_jobs(interpreter)[1:]
+            for job1, job2 in zip(jobs, jobs[1:]):
+                self.assertTrue(supervisor.can_reach(job1, job2))
+
+
+if __name__ == '__main__':
+    unittest.main()
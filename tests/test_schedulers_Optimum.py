@@ -0,0 +1,48 @@
+from schedulers import Optimum, ObjectInitializer, JobSupervisor
+from tests.objects import bf_test_schedule
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the schedulers.Optimum class
+    """
+    def setUp(self):
+        self.schedule = bf_test_schedule.copy()
+        self.calls = []
+
+    def count(self, name, method):
+        def wrapper(obj, *args, **kwargs):
+            self.calls.append(name)
+            return method(obj, *args, **kwargs)
+        return wrapper
+
+    def test(self):
+        # The shared setup runs once through the MRO
+        init_all_objects = ObjectInitializer.init_all_objects
+        populate_appts = JobSupervisor._populate_appts
+        ObjectInitializer.init_all_objects = self.count('init',
+                                                        init_all_objects)
+        JobSupervisor._populate_appts = self.count('populate',
+                                                   populate_appts)
+        try:
+            optimum = Optimum(self.schedule)
+        finally:
+            ObjectInitializer.init_all_objects = init_all_objects
+            JobSupervisor._populate_appts = populate_appts
+        self.assertEqual(['init', 'populate'], self.calls)
+
+        # Each engine still sets up its own state
+        self.assertEqual({}, optimum.class_graphs)
+        self.assertEqual([], optimum.columns)
+        self.assertTrue(len(optimum.appt_weights) > 0)
+        self.assertTrue(hasattr(optimum, 'mip_gap'))
+        self.assertEqual(len(self.schedule.appts),
+                         len(optimum.appts_to_assign))
+        self.assertFalse(optimum.has_compared)
+
+
+if __name__ == '__main__':
+    unittest.main()
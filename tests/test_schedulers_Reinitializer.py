@@ -23,8 +23,8 @@ class TestClass(unittest.TestCase):
 
         # _reset_data_structures
         self.reinitializer._reset_data_structures()
-        self.assertEqual(self.reinitializer.time_dict,
-                         collections.defaultdict(list))
+        self.assertEqual(list(self.reinitializer.appts_to_assign),
+                         list(self.reinitializer.time_index))
         self.assertEqual(self.reinitializer.valid_choices,
                          collections.defaultdict(list))
         self.assertEqual(self.reinitializer.jobs, {})
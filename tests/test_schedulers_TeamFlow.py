@@ -0,0 +1,71 @@
+from schedulers import FlowNetwork, TeamFlow
+from tests.objects import bf_test_schedule
+from utils import Time
+from constants import TIME_FORMAT
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the FlowNetwork and TeamFlow classes
+    """
+    def setUp(self):
+        self.schedule = bf_test_schedule.copy()
+        # give both interpreters the same shift so they form one class
+        self.schedule.interpreters[1].shift_finish = Time("16:30",
+                                                          TIME_FORMAT)
+        self.cls = TeamFlow(self.schedule)
+
+    def test(self):
+        # FlowNetwork: the negative edge is worth taking, the last unit isn't
+        network = FlowNetwork(3)
+        free = network.add_edge(0, 1, 2, 0)
+        network.add_edge(1, 2, 2, 0)
+        paid = network.add_edge(0, 2, 1, -5)
+        self.assertEqual(-5, network.topological_potentials(0)[2])
+        self.assertEqual((1, -5), network.min_cost_flow(0, 2, 2))
+        self.assertEqual(1, network.flow(paid))
+        self.assertEqual(0, network.flow(free))
+
+        # gen_interpreter_classes
+        interpreters = self.schedule.interpreters
+        self.assertEqual([interpreters],
+                         self.cls.gen_interpreter_classes(interpreters))
+
+        # build_network has a node per distinct time and an edge per appt
+        appts = list(self.cls.appts_to_assign)
+        network, edges = self.cls.build_network(appts, 2)
+        times = {appt.start for appt in appts} | {appt.finish
+                                                  for appt in appts}
+        self.assertEqual(len(times), network.size)
+        self.assertEqual(sorted([appt.idnum for appt in appts]),
+                         sorted([appt.idnum for appt in edges.values()]))
+
+        # but leaves out zero length appts
+        instant = appts[0].copy()
+        instant.finish = instant.start
+        network, edges = self.cls.build_network([instant] + appts[1:], 2)
+        self.assertNotIn(instant, edges.values())
+        self.assertEqual(len(appts) - 1, len(edges))
+
+        # gen_team_optimal splits the appts into compatible tracks
+        ids = self.cls.gen_team_optimal(interpreters, appts)
+        self.assertEqual(2, len(ids))
+        self.assertEqual([], [ID for ID in ids[0] if ID in ids[1]])
+        for track in ids:
+            jobs = self.cls.get_jobs_with_ids(track)
+            for job1, job2 in zip(jobs, jobs[1:]):
+                self.assertLessEqual(job1.finish, job2.start)
+
+        # create_flow_assignment matches the best pair of tracks
+        sched = self.cls.create_flow_assignment(interpreters)
+        self.assertEqual(3492, sched.calc_impact())
+        for interpreter, track in zip(interpreters, ids):
+            self.assertEqual(track, [job.idnum for job in
+                                     self.cls.get_jobs(interpreter)[1:]])
+
+
+if __name__ == '__main__':
+    unittest.main()
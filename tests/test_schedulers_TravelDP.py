@@ -0,0 +1,70 @@
+from schedulers import TravelDP
+from tests.objects import bf_test_schedule
+import itertools
+import unittest
+import sys
+sys.path.append('..')
+
+
+class TestClass(unittest.TestCase):
+    """
+    Test the TravelDP class
+    """
+    def setUp(self):
+        self.schedule = bf_test_schedule.copy()
+        self.cls = TravelDP(self.schedule)
+
+    def test(self):
+        interpreter = self.schedule.interpreters[0]
+        appts = list(self.cls.appts_to_assign)
+
+        # assignment_weight
+        appt = appts[0]
+        interpreter.assignments = {appt.location.building: 3}
+        self.assertEqual(3 * appt.priority,
+                         self.cls.assignment_weight(interpreter, appt))
+        interpreter.assignments = {}
+        self.assertEqual(appt.priority,
+                         self.cls.assignment_weight(interpreter, appt))
+
+        # travel_candidates only keeps appts in interpreter's shift
+        candidates = self.cls.travel_candidates(interpreter, appts)
+        self.assertNotIn(32, [appt.idnum for appt in candidates])
+        starts = [appt.start for appt in candidates]
+        self.assertEqual(sorted(starts), starts)
+
+        # gen_dag stores the edges inside each window, and tails the rest
+        candidates = self.cls.travel_candidates(interpreter, appts[:12])
+        successors, tails = self.cls.gen_dag(candidates)
+        for i, appt in enumerate(candidates):
+            reachable = [j for j in range(len(candidates))
+                         if self.cls.can_reach(appt, candidates[j])]
+            self.assertEqual(reachable,
+                             list(successors[i]) +
+                             list(range(tails[i], len(candidates))))
+
+        # longest_path matches an exhaustive search of the same appts
+        weights = [appt.priority for appt in candidates]
+        path = self.cls.longest_path(weights, successors, tails)
+        best = 0
+        for r in range(1, len(candidates) + 1):
+            for combo in itertools.combinations(candidates, r):
+                if all([self.cls.can_reach(combo[k], combo[k + 1])
+                        for k in range(r - 1)]):
+                    best = max(best, sum([appt.priority for appt in combo]))
+        self.assertEqual(best, sum([weights[idx] for idx in path]))
+
+        # gen_travel_optimal
+        ids = [2, 7, 12, 19, 24, 26, 33, 43, 48]
+        self.assertEqual(ids, self.cls.gen_travel_optimal(interpreter, appts))
+
+        # create_travel_schedule
+        self.cls.create_travel_schedule(interpreter, appts)
+        jobs = self.cls.get_jobs(interpreter)[1:]
+        self.assertEqual(ids, [job.idnum for job in jobs])
+        for job1, job2 in zip(jobs, jobs[1:]):
+            self.assertTrue(self.cls.can_reach(job1, job2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 from utils import Time
+import pickle
 import unittest
 import sys
 sys.path.append('..')
@@ -16,13 +17,16 @@ class TestClass(unittest.TestCase):
         
         # change_to method
         new_time = "08:01"
-        new_instance.change_to(new_time)
-        self.assertEqual(str(new_instance),  new_time)
-        
+        changed = new_instance.change_to(new_time)
+        self.assertEqual(str(changed),  new_time)
+        self.assertEqual(str(new_instance),  "08:00")
+        self.assertEqual(str(Time("8am", "%I%p").change_to("9am")), "09:00")
+
         # add_time method
-        new_instance.add_time(1,  1)
+        new_instance = changed.add_time(1,  1)
         self.assertEqual(str(new_instance),  "09:02")
-        new_instance.add_time(-10,  -3)
+        self.assertEqual(str(changed),  new_time)
+        new_instance = new_instance.add_time(-10,  -3)
         self.assertEqual(str(new_instance),  "22:59")
         
         # time_difference method
@@ -32,6 +36,37 @@ class TestClass(unittest.TestCase):
         # str method
         self.assertEqual(str(self.time),  "08:00")
 
+        # plus_minutes method
+        later = self.time.plus_minutes(75)
+        self.assertEqual(str(later),  "09:15")
+        self.assertEqual(str(self.time),  "08:00")
+        self.assertLess(self.time,  later)
+
+        # from_minutes method
+        self.assertEqual(Time.from_minutes(480),  self.time)
+        self.assertEqual(Time("8:00",  "%H:%M"),  self.time)
+
+        # hash method
+        self.assertEqual(hash(self.time),  hash(self.time.copy()))
+        self.assertEqual(len({self.time,  self.time.copy()}),  1)
+
+        # Time can't be changed once built, so it stays findable by hash
+        times = {self.time}
+        with self.assertRaises(AttributeError):
+            self.time.minutes = 600
+        with self.assertRaises(AttributeError):
+            self.time.format = "%I%p"
+        with self.assertRaises(AttributeError):
+            del self.time.minutes
+        self.assertIn(self.time,  times)
+        self.assertEqual(self.time,  pickle.loads(pickle.dumps(self.time)))
+
+        # parse_minutes rejects what strptime rejects
+        for text in ("08:00 ", " 8:00", "+8:00", "08:000", "0_8:00",
+                     "08:-1", "24:00", "08"):
+            with self.assertRaises(ValueError):
+                Time(text,  "%H:%M")
+
 
 if __name__ == '__main__':
     unittest.main()
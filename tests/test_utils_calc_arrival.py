@@ -10,10 +10,18 @@ class TestFunction(unittest.TestCase):
     Test the utils.calc_arrival function
     """
     def setUp(self):
-        self.appts = test_schedule
+        self.appts = test_schedule.appts
         
     def test(self):
-        dist = test_schedule.appts[0]
+        appt1, appt2 = self.appts[0], self.appts[1]
+        # appt1 finishes at 08:10 and is 5 minutes away from appt2,
+        # which starts at 08:25, so the start time is the arrival time
+        self.assertEqual(str(calc_arrival(appt1, appt2)), "08:25")
+        # order of the arguments does not matter
+        self.assertEqual(str(calc_arrival(appt2, appt1)), "08:25")
+        # the schedule's travel matrix gives the same answer
+        self.assertEqual(calc_arrival(appt1, appt2, test_schedule.travel),
+                         test_schedule.arrival(appt1, appt2))
 
 
 if __name__ == '__main__':
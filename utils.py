@@ -1,8 +1,14 @@
 import timeit
 import datetime
-import copy
-from constants import WALKING_RATE
-from functools import wraps
+from constants import (
+    TIME_CACHE_SIZE,
+    TIME_FORMAT,
+    WALKING_RATE
+)
+from functools import (
+    lru_cache,
+    wraps
+)
 
 
 def timer(method):
@@ -62,59 +68,130 @@ def sum_lists_product(list1, list2):
     return lst_sum
 
 
-def calc_arrival(appt1, appt2):
+def commute_time(location1, location2, walking_rate=WALKING_RATE,
+                 model=None):
+    """
+    Compute the whole minutes needed to walk between two locations
+    :param location1: A Point (or inherited) object
+    :param location2: A Point (or inherited) object
+    :param walking_rate: A number of distance units covered per minute
+    :param model: An optional DistanceModel, straight-line by default
+    :return: An integer number of minutes
+    """
+    if model is None:
+        dist = int(location1.distance_from(location2))
+    else:
+        dist = int(model.distance(location1, location2))
+    return int(round(dist / walking_rate, 0))
+
+
+def calc_arrival(appt1, appt2, travel=None):
     """
     Compute when staff would arrive at appt2 after finishing appt1
     :param appt1: An Appointment object (time order IS important)
     :param appt2: An Appointment object (time order IS important)
+    :param travel: An optional TravelMatrix to look commute times up in
     :return: A Time object representing when staff could begin appt2
     """
-    appts = [appt1, appt2]
-    appts.sort()
-    dist = int(appts[0].location.distance_from(appts[1].location))
-    commute_time = round(dist / WALKING_RATE, 0)
-    time = appts[0].finish.copy()
-    time.add_time(hours=0, minutes=commute_time)
-    time = max(time, appts[1].start.copy())
-    return time
+    if appt2 < appt1:
+        appt1, appt2 = appt2, appt1
+    if travel is None:
+        minutes = commute_time(appt1.location, appt2.location)
+    else:
+        minutes = travel.commute(appt1.location, appt2.location)
+    return max(appt1.finish.plus_minutes(minutes), appt2.start)
+
+
+@lru_cache(maxsize=TIME_CACHE_SIZE)
+def parse_minutes(time, time_format):
+    """
+    Convert a time string to the number of minutes since midnight
+    :param time: A string representing the time, eg.: "08:00"
+    :param time_format: The string format, eg.: "%H:%M"
+    :return: An integer number of minutes
+    """
+    if time_format == TIME_FORMAT:
+        hours, sep, minutes = time.partition(':')
+        # Only take the shortcut on what strptime would accept, 1 or 2
+        # ASCII digits on each side, and let strptime reject the rest
+        if sep and 0 < len(hours) <= 2 and 0 < len(minutes) <= 2 and \
+                (hours + minutes).isascii() and (hours + minutes).isdigit():
+            hours, minutes = int(hours), int(minutes)
+            if hours < 24 and minutes < 60:
+                return hours * 60 + minutes
+    parsed = datetime.datetime.strptime(time, time_format)
+    return parsed.hour * 60 + parsed.minute
 
 
 class Time(object):
     """
-    A wrapper around the time library to encapsulate date/time arithmetic
+    A time of day stored as a whole number of minutes since midnight.
+    Times are hashed by value, so they can't be changed once built and
+    methods return new Time objects instead
     """
+    __slots__ = ('minutes', 'format')
+
     def __init__(self, time, time_format):
         """
         Initialize the Time class
         :param time: A string representing the time, eg.: "08:00"
         :param time_format: The string format, eg.: "%H:%S"
         """
-        self.format = time_format
-        self.time = datetime.datetime.strptime(time, self.format)
+        object.__setattr__(self, 'format', time_format)
+        object.__setattr__(self, 'minutes', parse_minutes(time, time_format))
+
+    @classmethod
+    def from_minutes(cls, minutes, time_format=TIME_FORMAT):
+        """
+        Build a Time directly from minutes since midnight, skipping parsing
+        :param minutes: An integer number of minutes since midnight
+        :param time_format: The string format, eg.: "%H:%M"
+        :return: A Time object
+        """
+        time = cls.__new__(cls)
+        object.__setattr__(time, 'format', time_format)
+        object.__setattr__(time, 'minutes', minutes)
+        return time
+
+    @property
+    def hour(self):
+        return (self.minutes // 60) % 24
+
+    @property
+    def minute(self):
+        return self.minutes % 60
 
     def copy(self):
         """
         Return a copy of self by value
         :return: A Time object
         """
-        return copy.deepcopy(self)
-    
+        return Time.from_minutes(self.minutes, self.format)
+
+    def plus_minutes(self, minutes):
+        """
+        Get a new Time that is minutes after self, leaving self unchanged
+        :param minutes: An integer number of minutes to add
+        :return: A Time object
+        """
+        return Time.from_minutes(self.minutes + minutes, self.format)
+
     def change_to(self, time):
         """
-        Change self.time to time
+        Get a new Time for time, parsed in the same format as self
         :param time: A string representing the time, eg.: "O8:00"
-        :return: None
+        :return: A Time object
         """
-        self.time = datetime.datetime.strptime(time, self.format)
-        
+        return Time(time, self.format)
+
     def add_time(self, hours, minutes):
         """
-        Add specified hour and minute quantities to self.time
+        Get a new Time that is hours and minutes after self
         :param hours: A number of hours to add to self.time
         :param minutes: A number of minutes to add to self.time
-        :return: None
+        :return: A Time object
         """
-        self.time += datetime.timedelta(hours=hours, minutes=minutes)
+        return self.plus_minutes(int(round(hours * 60 + minutes)))
 
     def time_difference(self, other):
         """
@@ -122,38 +199,59 @@ class Time(object):
         :param other: A Time object
         :return: A tuple
         """
-        return (other.time.hour - self.time.hour,
-                other.time.minute - self.time.minute)
-    
+        return (other.hour - self.hour,
+                other.minute - self.minute)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __getstate__(self):
+        return (self.minutes, self.format)
+
+    def __setstate__(self, state):
+        (minutes, time_format) = state
+        object.__setattr__(self, 'format', time_format)
+        object.__setattr__(self, 'minutes', minutes)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Time objects can't be changed")
+
+    def __delattr__(self, name):
+        raise AttributeError("Time objects can't be changed")
+
     def __str__(self):
-        try:
-            dt = self.time
-            time = f'{dt:%H}:{dt:%M}'
-        except:
-            time = self.time.strftime(self.format)
-        return time
+        return '%02d:%02d' % (self.hour, self.minute)
+
+    def __repr__(self):
+        return 'Time(' + repr(str(self)) + ')'
+
+    def __hash__(self):
+        return hash(self.minutes)
 
     def __eq__(self, other):
         if not isinstance(other, Time):
             return False
-        return self.__dict__ == other.__dict__
+        return self.minutes == other.minutes
 
     def __ne__(self, other):
         if not isinstance(other, Time):
             return True
-        return self.__dict__ != other.__dict__
+        return self.minutes != other.minutes
 
     def __le__(self, other):
         if not isinstance(other, Time):
             raise TypeError("'<=' not supported between instances of '" +
                             typedef(self) + "' and other types")
-        return self.time <= other.time
+        return self.minutes <= other.minutes
 
     def __lt__(self, other):
         if not isinstance(other, Time):
             raise TypeError("'<' not supported between instances of '" +
                             typedef(self) + "' and other types")
-        return self.time < other.time
+        return self.minutes < other.minutes
 
     def __ge__(self, other):
         if not isinstance(other, Time):
@@ -161,7 +259,7 @@ class Time(object):
                 "'>=' not supported between instances of '" +
                 typedef(self) + "' and other types"
                 )
-        return self.time >= other.time
+        return self.minutes >= other.minutes
 
     def __gt__(self, other):
         if not isinstance(other, Time):
@@ -169,4 +267,4 @@ class Time(object):
                 "'>' not supported between instances of '" +
                 typedef(self) + "' and other types"
                 )
-        return self.time > other.time
+        return self.minutes > other.minutes